@@ -1,6 +1,19 @@
 # backend/api/admin.py
+import csv
+import json
+
 from django.contrib import admin
-from .models import ContactSubmission, Project, Certification, Post, WorkExperience, Tag
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from django.http import HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html
+
+from .pagination import EstimatedCountPaginator
+from .models import BitcoinAddress, ContactSubmission, ProfileArtifact, Project, Certification, Post, WorkExperience, Tag
 
 @admin.register(Tag)
 class TagAdmin(admin.ModelAdmin):
@@ -32,10 +45,117 @@ class PostAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('title',)}
     filter_horizontal = ('tags',)
 
+# --- Contact submission export ---
+EXPORT_FIELDS = ('id', 'created_at', 'name', 'email', 'subject', 'message')
+EXPORT_CHUNK_SIZE = 2000
+
+class _Echo:
+    """A file-like object csv.writer can write to that just hands each line back."""
+    def write(self, value):
+        return value
+
+def _csv_cell(value):
+    # Submissions are user input: keep spreadsheets from evaluating them as formulas.
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@', '\t', '\r'):
+        return f"'{value}"
+    return value
+
+def _export_rows(queryset):
+    # Streamed through a server-side cursor on PostgreSQL, so the whole inbox is never in memory.
+    return queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+def _export_response(lines, extension, content_type):
+    response = StreamingHttpResponse(lines, content_type=content_type)
+    filename = f"contact-submissions-{timezone.now():%Y%m%d-%H%M%S}.{extension}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
 @admin.register(ContactSubmission)
 class ContactSubmissionAdmin(admin.ModelAdmin):
     list_display = ('name', 'email', 'subject', 'created_at')
-    list_filter = ('created_at',)
+    list_filter = ('created_at',)  # Range scans on contact_created_at_idx
+    # Used as-is off PostgreSQL; on PostgreSQL see get_search_results.
     search_fields = ('name', 'email', 'subject', 'message')
     # Make the message content read-only in the admin list view
-    readonly_fields = ('name', 'email', 'subject', 'message', 'created_at')
\ No newline at end of file
+    readonly_fields = ('name', 'email', 'subject', 'message', 'created_at')
+    # No exact COUNT(*) of the whole inbox on every page
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ('export_csv', 'export_jsonl')
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        On PostgreSQL: full-text search over name/subject/message (GIN index)
+        or an exact email match (B-tree index), instead of four unindexed
+        ILIKE scans.
+        """
+        search_term = search_term.strip()
+        if not search_term or connections[queryset.db].vendor != 'postgresql':
+            return super().get_search_results(request, queryset, search_term)
+        from django.contrib.postgres.search import SearchQuery
+
+        query = SearchQuery(search_term, config='english', search_type='websearch')
+        queryset = queryset.alias(search=ContactSubmission.search_vector()).filter(
+            Q(search=query) | Q(email=search_term)
+        )
+        return queryset, False
+
+    @admin.action(description="Export selected submissions as CSV")
+    def export_csv(self, request, queryset):
+        writer = csv.writer(_Echo())
+
+        def lines():
+            yield writer.writerow(EXPORT_FIELDS)
+            for row in _export_rows(queryset):
+                yield writer.writerow([_csv_cell(value) for value in row])
+
+        return _export_response(lines(), 'csv', 'text/csv; charset=utf-8')
+
+    @admin.action(description="Export selected submissions as JSON Lines")
+    def export_jsonl(self, request, queryset):
+        def lines():
+            for row in _export_rows(queryset):
+                yield json.dumps(dict(zip(EXPORT_FIELDS, row)), cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+
+        return _export_response(lines(), 'jsonl', 'application/x-ndjson')
+
+@admin.register(BitcoinAddress)
+class BitcoinAddressAdmin(admin.ModelAdmin):
+    list_display = ('index', 'address', 'created_at', 'assigned_at', 'used_at')
+    search_fields = ('address',)
+    # Addresses are derived from the xpub; editing them by hand would break the pool.
+    readonly_fields = ('index', 'address', 'created_at', 'assigned_at', 'used_at')
+
+@admin.register(ProfileArtifact)
+class ProfileArtifactAdmin(admin.ModelAdmin):
+    list_display = ('created_at', 'method', 'path', 'status_code', 'duration_ms', 'sql_count', 'http_count', 'download_link')
+    list_filter = ('method', 'status_code')
+    search_fields = ('path',)
+    exclude = ('stats',)
+    # Profiles are recorded by ProfilingMiddleware, never written by hand.
+    readonly_fields = (
+        'created_at', 'user', 'method', 'path', 'status_code', 'duration_ms', 'sql_count', 'sql_ms',
+        'http_count', 'http_ms', 'download_link', 'summary', 'spans',
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_urls(self):
+        return [
+            path('<int:pk>/download/', self.admin_site.admin_view(self.download_view), name='api_profileartifact_download'),
+        ] + super().get_urls()
+
+    def download_view(self, request, pk):
+        if not self.has_view_permission(request):
+            return HttpResponse(status=403)
+        artifact = get_object_or_404(ProfileArtifact, pk=pk)
+        response = HttpResponse(bytes(artifact.stats), content_type='application/octet-stream')
+        response['Content-Disposition'] = f'attachment; filename="profile-{artifact.pk}.prof"'
+        return response
+
+    @admin.display(description="Profile")
+    def download_link(self, obj):
+        if obj.pk is None:
+            return "-"
+        return format_html('<a href="{}">profile-{}.prof</a>', reverse('admin:api_profileartifact_download', args=[obj.pk]), obj.pk)
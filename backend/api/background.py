@@ -0,0 +1,20 @@
+# backend/api/background.py
+import functools
+
+from django.db import connection
+
+# Django opens a database connection per thread on first use and closes the
+# ones of request threads when the request ends. Nothing closes those of
+# threads the app starts itself (refills, re-exports, image builds), so each
+# would leak a connection: their targets are wrapped in closes_db_connection.
+
+
+def closes_db_connection(func):
+    """Decorator for a background thread's target: closes the thread's DB connection when it returns."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connection.close()
+    return wrapper
@@ -0,0 +1,222 @@
+# backend/api/bitcoin.py
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .background import closes_db_connection
+from .models import BitcoinAddress
+
+if TYPE_CHECKING:
+    # bitcoinlib (and its EC backends) is only imported once an address is actually needed.
+    from bitcoinlib.keys import HDKey
+
+# BIP84 (native segwit) account path. This is the same path `Wallet.create(..., witness_type='segwit')`
+# uses, so index 0 of the pool is the address the old wallet-based tip jar handed out.
+ACCOUNT_PATH = "m/84'/0'/0'"
+RECEIVE_CHAIN = 0
+
+# BIP44 gap limit: a wallet restored from the seed stops scanning the receive
+# chain after this many consecutive addresses without a transaction, and
+# never sees a payment further out. So at most GAP_LIMIT - 1 addresses past
+# the last paid one are handed out; after that, visitors get the unpaid
+# address that was handed out longest ago again.
+GAP_LIMIT = 20
+# Whether handed-out addresses got paid is checked on mempool.space, at most this often.
+USAGE_CHECK_INTERVAL = 600
+USAGE_CHECK_KEY = "bitcoin_address_usage_check"
+
+logger = logging.getLogger('api')
+
+_receive_chain_key = None
+_receive_chain_lock = threading.Lock()
+_refill_lock = threading.Lock()
+_usage_check_lock = threading.Lock()
+
+# ==============================================================================
+# KEY DERIVATION (IN MEMORY, NO WALLET DATABASE)
+# ==============================================================================
+
+def account_key_from_mnemonic(mnemonic: str) -> "HDKey":
+    """Derives the public BIP84 account key from a mnemonic seed phrase."""
+    from bitcoinlib.keys import HDKey
+    from bitcoinlib.mnemonic import Mnemonic
+
+    root = HDKey.from_seed(Mnemonic().to_seed(mnemonic), witness_type='segwit')
+    return root.subkey_for_path(ACCOUNT_PATH).public()
+
+def account_key_from_xpub(xpub: str) -> "HDKey":
+    """Loads the public account key from an exported xpub/zpub."""
+    from bitcoinlib.keys import HDKey
+
+    return HDKey(xpub, witness_type='segwit')
+
+def derive_receive_addresses(account_key: "HDKey", start: int, count: int) -> list[tuple[int, str]]:
+    """Returns (index, address) pairs for m/84'/0'/0'/0/<start..start+count-1>."""
+    chain_key = account_key.child_public(RECEIVE_CHAIN)
+    return [(index, chain_key.child_public(index).address()) for index in range(start, start + count)]
+
+def get_receive_chain_key() -> "HDKey | None":
+    """
+    Returns the receive-chain key for this process, derived once from
+    BITCOIN_ACCOUNT_XPUB (preferred) or BITCOIN_WALLET_MNEMONIC.
+    """
+    global _receive_chain_key
+    if _receive_chain_key is None:
+        with _receive_chain_lock:
+            if _receive_chain_key is None:
+                xpub = settings.BITCOIN_ACCOUNT_XPUB
+                mnemonic = os.getenv('BITCOIN_WALLET_MNEMONIC')
+                if xpub:
+                    account_key = account_key_from_xpub(xpub)
+                elif mnemonic:
+                    account_key = account_key_from_mnemonic(mnemonic)
+                else:
+                    logger.error("Neither BITCOIN_ACCOUNT_XPUB nor BITCOIN_WALLET_MNEMONIC is set.")
+                    return None
+                _receive_chain_key = account_key.child_public(RECEIVE_CHAIN)
+    return _receive_chain_key
+
+# ==============================================================================
+# ADDRESS POOL
+# ==============================================================================
+
+def fill_address_pool(target: int | None = None) -> int:
+    """
+    Tops the pool of unassigned addresses up to `target` rows and returns how
+    many were created. Safe to run from several workers at once: indexes are
+    unique, so a concurrent fill simply skips the rows another worker won
+    (and doesn't count them).
+    """
+    target = target or settings.BITCOIN_ADDRESS_POOL_SIZE
+    chain_key = get_receive_chain_key()
+    if chain_key is None:
+        return 0
+
+    missing = target - BitcoinAddress.objects.filter(assigned_at__isnull=True).count()
+    if missing <= 0:
+        return 0
+
+    last_index = BitcoinAddress.objects.aggregate(last=Max('index'))['last']
+    start = 0 if last_index is None else last_index + 1
+    # One insert per row (a pool is a few dozen rows, filled in the background):
+    # bulk_create(ignore_conflicts=True) can't tell which rows it skipped.
+    created = 0
+    for index in range(start, start + missing):
+        address = chain_key.child_public(index).address()
+        try:
+            with transaction.atomic():
+                BitcoinAddress.objects.create(index=index, address=address)
+        except IntegrityError:
+            continue
+        created += 1
+    return created
+
+@closes_db_connection
+def _refill_worker():
+    try:
+        created = fill_address_pool()
+        if created:
+            logger.info("Refilled Bitcoin address pool with %d address(es).", created)
+    except Exception:
+        logger.exception("Error refilling Bitcoin address pool")
+    finally:
+        _refill_lock.release()
+
+def refill_address_pool_async():
+    """Starts a background refill unless one is already running in this process."""
+    if not _refill_lock.acquire(blocking=False):
+        return
+    threading.Thread(target=_refill_worker, name="bitcoin-address-refill", daemon=True).start()
+
+def max_issuable_index() -> int:
+    """The highest index that may be handed out: GAP_LIMIT - 1 past the last paid address."""
+    last_used = BitcoinAddress.objects.filter(used_at__isnull=False).aggregate(last=Max('index'))['last']
+    return (-1 if last_used is None else last_used) + GAP_LIMIT - 1
+
+def _claim_next_address(max_index: int) -> tuple[BitcoinAddress | None, bool]:
+    """(address, whether it was handed out before), or (None, False) if the pool has none left."""
+    with transaction.atomic():
+        addresses = BitcoinAddress.objects.select_for_update(skip_locked=True)
+        row = addresses.filter(assigned_at__isnull=True, index__lte=max_index).order_by('index').first()
+        reused = row is None
+        if reused:
+            row = addresses.filter(assigned_at__isnull=False, used_at__isnull=True).order_by('assigned_at', 'index').first()
+        if row is not None:
+            row.assigned_at = timezone.now()
+            row.save(update_fields=['assigned_at'])
+    return row, reused and row is not None
+
+def assign_address() -> str | None:
+    """
+    Hands out the lowest address nobody has been given yet, within the gap
+    limit; once that is used up, the unpaid address handed out longest ago.
+    The pool is refilled in the background once it runs low, and reusing an
+    address starts a check for payments, which moves the gap limit window.
+    """
+    max_index = max_issuable_index()
+    row, reused = _claim_next_address(max_index)
+    if row is None:
+        # Empty pool (fresh database or a burst of visitors): fill it inline once.
+        fill_address_pool()
+        row, reused = _claim_next_address(max_index)
+        if row is None:
+            return None
+
+    if reused:
+        check_address_usage_async()
+    remaining = BitcoinAddress.objects.filter(assigned_at__isnull=True).count()
+    if remaining < settings.BITCOIN_ADDRESS_POOL_LOW_WATER:
+        refill_address_pool_async()
+    return row.address
+
+# ==============================================================================
+# PAYMENT CHECK
+# ==============================================================================
+
+def check_address_usage() -> int:
+    """
+    Marks handed-out addresses that have a transaction (confirmed or in the
+    mempool) as used, from mempool.space. At most GAP_LIMIT - 1 addresses are
+    unpaid at a time, so this is a bounded number of lookups. Returns how many
+    addresses were newly marked.
+    """
+    from .metrics import upstream_request
+    from .views.constants import MEMPOOL_API_URL
+
+    marked = 0
+    for row in BitcoinAddress.objects.filter(assigned_at__isnull=False, used_at__isnull=True).order_by('index'):
+        response = upstream_request('GET', f"{MEMPOOL_API_URL}/address/{row.address}", timeout=10)
+        response.raise_for_status()
+        stats = response.json()
+        if stats['chain_stats']['tx_count'] or stats['mempool_stats']['tx_count']:
+            row.used_at = timezone.now()
+            row.save(update_fields=['used_at'])
+            marked += 1
+    return marked
+
+@closes_db_connection
+def _usage_check_worker():
+    try:
+        marked = check_address_usage()
+        if marked:
+            logger.info("%d Bitcoin address(es) received a payment.", marked)
+    except Exception:
+        logger.exception("Error checking Bitcoin address usage")
+    finally:
+        _usage_check_lock.release()
+
+def check_address_usage_async():
+    """Starts a background payment check, unless any worker ran one in the last USAGE_CHECK_INTERVAL."""
+    if not _usage_check_lock.acquire(blocking=False):
+        return
+    if not cache.add(USAGE_CHECK_KEY, True, timeout=USAGE_CHECK_INTERVAL):
+        _usage_check_lock.release()
+        return
+    threading.Thread(target=_usage_check_worker, name="bitcoin-address-usage", daemon=True).start()
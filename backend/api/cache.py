@@ -0,0 +1,339 @@
+# backend/api/cache.py
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django_redis.cache import RedisCache
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+
+logger = logging.getLogger('api')
+
+_REDIS_ERRORS = (RedisConnectionError, RedisTimeoutError, OSError)
+# Stored in L1 as-is; anything else is pickled so callers can't mutate the cached copy.
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+_MISSING = object()
+
+# ==============================================================================
+# L1: PER-PROCESS TIER
+# ==============================================================================
+
+class LocalTier:
+    """
+    A bounded, TTL'd LRU shared by every thread of one process. It only serves
+    reads while its invalidation listener is subscribed; if the subscription
+    drops (or hasn't started yet) it is emptied and bypassed until it's back,
+    so a missed invalidation can never be served.
+    """
+
+    def __init__(self, max_entries, max_bytes, timeout):
+        self.max_entries, self.max_bytes, self.timeout = max_entries, max_bytes, timeout
+        self.origin = uuid.uuid4().hex
+        self.pid = os.getpid()
+        self.active = False
+        # Bumped on every invalidation; a value read from Redis is only kept if
+        # no invalidation arrived while it was in flight.
+        self.generation = 0
+        self.stats = {'l1_hits': 0, 'l2_hits': 0, 'misses': 0, 'invalidations': 0}
+        self._entries = OrderedDict()  # key -> (expires_at, payload, pickled, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._listener = None
+
+    # --- Reads & writes ---
+    def get(self, key):
+        if not self.active:
+            return _MISSING
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            if entry[0] <= time.monotonic():
+                self._discard(key)
+                return _MISSING
+            self._entries.move_to_end(key)
+        _, payload, pickled, _ = entry
+        return pickle.loads(payload) if pickled else payload
+
+    def set(self, key, value, ttl, generation=None):
+        """Stores `value` for at most `ttl` seconds (None = the tier's own timeout)."""
+        if not self.active:
+            return
+        ttl = self.timeout if ttl is None else min(ttl, self.timeout)
+        if ttl <= 0:
+            return
+        pickled = not isinstance(value, _IMMUTABLE_TYPES)
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL) if pickled else value
+        size = len(payload) if isinstance(payload, (str, bytes)) else 64
+        if size > self.max_bytes // 4:
+            return  # Not worth evicting a quarter of the tier for
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._discard(key)
+            self._entries[key] = (time.monotonic() + ttl, payload, pickled, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[3]
+
+    # --- Invalidation ---
+    def invalidate(self, keys=None):
+        """Drops the given keys, or everything when `keys` is None."""
+        with self._lock:
+            self.generation += 1
+            self.stats['invalidations'] += 1
+            if keys is None:
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                for key in keys:
+                    self._discard(key)
+
+    def set_active(self, active):
+        self.invalidate()
+        self.active = active
+
+    def handle_message(self, data):
+        message = json.loads(data)
+        if message['origin'] != self.origin:
+            self.invalidate(message['keys'])
+
+    # --- Listener ---
+    def ensure_listener(self, get_redis, channel):
+        if self._listener is not None:
+            return
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, args=(get_redis, channel), name="cache-invalidation", daemon=True
+                )
+                self._listener.start()
+
+    def _listen(self, get_redis, channel):
+        backoff = 1
+        while True:
+            pubsub = None
+            try:
+                pubsub = get_redis().pubsub()
+                pubsub.subscribe(channel)
+                for message in pubsub.listen():
+                    if message['type'] == 'subscribe':
+                        self.set_active(True)
+                        backoff = 1
+                    elif message['type'] == 'message':
+                        self.handle_message(message['data'])
+            except Exception as e:
+                logger.warning("Cache invalidation listener disconnected: %s", e)
+            finally:
+                self.set_active(False)
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+    def snapshot_stats(self):
+        stats = dict(self.stats, entries=len(self._entries), bytes=self._bytes, active=self.active)
+        lookups = stats['l1_hits'] + stats['l2_hits'] + stats['misses']
+        stats['l1_hit_ratio'] = stats['l1_hits'] / lookups if lookups else 0.0
+        # Share of the lookups that reached Redis and found the key there.
+        l2_lookups = lookups - stats['l1_hits']
+        stats['l2_hit_ratio'] = stats['l2_hits'] / l2_lookups if l2_lookups else 0.0
+        stats['hit_ratio'] = (stats['l1_hits'] + stats['l2_hits']) / lookups if lookups else 0.0
+        return stats
+
+
+_tiers = {}
+_tiers_lock = threading.Lock()
+
+def _get_tier(name, max_entries, max_bytes, timeout):
+    """One tier per cache configuration per process (a forked worker starts with an empty one)."""
+    with _tiers_lock:
+        tier = _tiers.get(name)
+        if tier is None or tier.pid != os.getpid():
+            tier = _tiers[name] = LocalTier(max_entries, max_bytes, timeout)
+        return tier
+
+def cache_stats() -> dict:
+    """Per-tier hit/miss counts and ratios of every two-tier cache in this process."""
+    return {name: tier.snapshot_stats() for name, tier in _tiers.items() if tier.pid == os.getpid()}
+
+# ==============================================================================
+# CACHE BACKEND
+# ==============================================================================
+
+class TieredRedisCache(RedisCache):
+    """
+    django-redis with a small in-process L1 in front of it. Reads are served
+    from L1 when possible; every write or delete updates L1 locally and is
+    published on a Redis pub/sub channel so the other workers drop their
+    copies. L1 entries never outlive the key's remaining TTL in Redis.
+
+    OPTIONS (besides django-redis' own):
+        L1_MAX_ENTRIES   default 1000
+        L1_MAX_BYTES     default 32 MB
+        L1_TIMEOUT       default 300 s; upper bound on any L1 entry's life
+        L1_CHANNEL       default "cache-invalidation"
+    """
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        options = params.get('OPTIONS', {})
+        self._channel = options.get('L1_CHANNEL', 'cache-invalidation')
+        self._l1_options = (
+            int(options.get('L1_MAX_ENTRIES', 1000)),
+            int(options.get('L1_MAX_BYTES', 32 * 1024 * 1024)),
+            float(options.get('L1_TIMEOUT', 300)),
+        )
+
+    @property
+    def tier(self) -> LocalTier:
+        tier = _get_tier(self._channel, *self._l1_options)
+        tier.ensure_listener(lambda: self.client.get_client(write=True), self._channel)
+        return tier
+
+    def _key(self, key, version=None) -> str:
+        return str(self.client.make_key(key, version=version))
+
+    def _publish(self, keys):
+        """
+        Drops `keys` (None = everything) from this process's L1 and tells every
+        other worker to do the same. Returns the L1 generation right after.
+        """
+        tier = self.tier
+        tier.invalidate(keys)
+        generation = tier.generation
+        try:
+            self.client.get_client(write=True).publish(
+                self._channel, json.dumps({'origin': tier.origin, 'keys': keys})
+            )
+        except _REDIS_ERRORS as e:
+            logger.warning("Could not publish cache invalidation: %s", e)
+        return generation
+
+    # --- Reads ---
+    def _fetch(self, keys):
+        """GET and PTTL for each key in one round trip: {key: (value, ttl seconds or None)}."""
+        pipe = self.client.get_client(write=False).pipeline(transaction=False)
+        for key in keys:
+            pipe.get(key)
+            pipe.pttl(key)
+        results = pipe.execute()
+        found = {}
+        for key, raw, pttl in zip(keys, results[::2], results[1::2]):
+            if raw is not None:
+                found[key] = (self.client.decode(raw), pttl / 1000 if pttl > 0 else None)
+        return found
+
+    def get_many(self, keys, version=None):
+        tier = self.tier
+        made = {self._key(key, version): key for key in keys}
+        result, pending = {}, []
+        for made_key, key in made.items():
+            value = tier.get(made_key)
+            if value is _MISSING:
+                pending.append(made_key)
+            else:
+                result[key] = value
+        tier.stats['l1_hits'] += len(result)
+        if not pending:
+            return result
+
+        generation = tier.generation
+        try:
+            fetched = self._fetch(pending)
+        except _REDIS_ERRORS:
+            if self._ignore_exceptions:
+                return result
+            raise
+        tier.stats['l2_hits'] += len(fetched)
+        tier.stats['misses'] += len(pending) - len(fetched)
+        for made_key, (value, ttl) in fetched.items():
+            tier.set(made_key, value, ttl, generation=generation)
+            result[made[made_key]] = value
+        return result
+
+    def get(self, key, default=None, version=None, client=None):
+        if client is not None:
+            return super().get(key, default=default, version=version, client=client)
+        return self.get_many([key], version=version).get(key, default)
+
+    # --- Writes ---
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None, nx=False, xx=False):
+        stored = super().set(key, value, timeout=timeout, version=version, client=client, nx=nx, xx=xx)
+        made_key = self._key(key, version)
+        generation = self._publish([made_key])
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        # nx/xx writes may not have stored `value`; let the next read fetch whatever is there.
+        if stored and not (nx or xx) and (timeout is None or timeout > 0):
+            self.tier.set(made_key, value, timeout, generation=generation)
+        return stored
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        added = super().add(key, value, timeout=timeout, version=version, client=client)
+        if added:
+            self._publish([self._key(key, version)])
+        return added
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        result = super().set_many(data, timeout=timeout, version=version, client=client)
+        self._publish([self._key(key, version) for key in data])
+        return result
+
+    def delete(self, key, version=None, prefix=None, client=None):
+        deleted = super().delete(key, version=version, prefix=prefix, client=client)
+        self._publish([self._key(key, version)])
+        return deleted
+
+    def delete_many(self, keys, version=None, client=None):
+        result = super().delete_many(keys, version=version, client=client)
+        self._publish([self._key(key, version) for key in keys])
+        return result
+
+    def delete_pattern(self, *args, **kwargs):
+        result = super().delete_pattern(*args, **kwargs)
+        self._publish(None)
+        return result
+
+    def clear(self):
+        result = super().clear()
+        self._publish(None)
+        return result
+
+    def incr(self, key, delta=1, version=None, client=None, ignore_key_check=False):
+        value = super().incr(key, delta=delta, version=version, client=client, ignore_key_check=ignore_key_check)
+        self._publish([self._key(key, version)])
+        return value
+
+    def decr(self, key, delta=1, version=None, client=None):
+        value = super().decr(key, delta=delta, version=version, client=client)
+        self._publish([self._key(key, version)])
+        return value
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        touched = super().touch(key, timeout=timeout, version=version, client=client)
+        self._publish([self._key(key, version)])
+        return touched
+
+    def expire(self, key, timeout, version=None, client=None):
+        result = super().expire(key, timeout, version=version, client=client)
+        self._publish([self._key(key, version)])
+        return result
+
+    def persist(self, key, version=None, client=None):
+        result = super().persist(key, version=version, client=client)
+        self._publish([self._key(key, version)])
+        return result
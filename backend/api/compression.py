@@ -0,0 +1,58 @@
+# backend/api/compression.py
+import gzip
+
+# Content that is compressed once and then served as stored (the API
+# snapshot files, the contribution SVG): gzip level 9 and brotli quality 11,
+# too slow for per-request compression but fine ahead of time. The brotli
+# copy is skipped when the Brotli package isn't installed.
+
+# Each encoding is a different byte sequence, so it needs its own strong ETag
+# (a cache must not answer a gzip revalidation with the identity body).
+ENCODING_ETAG_SUFFIXES = {'gzip': '-gz', 'br': '-br'}
+
+
+def get_brotli():
+    """The brotli module, or None when it isn't installed."""
+    try:
+        import brotli
+        return brotli
+    except ImportError:
+        return None
+
+def compress(content: bytes) -> dict:
+    """{'gzip': bytes, 'br': bytes or None} for `content`."""
+    brotli = get_brotli()
+    return {
+        'gzip': gzip.compress(content, compresslevel=9, mtime=0),
+        'br': brotli.compress(content, quality=11) if brotli is not None else None,
+    }
+
+def accepted_encodings(header: str) -> set[str]:
+    """Content codings in an Accept-Encoding header, minus those refused with q=0."""
+    accepted = set()
+    for part in header.split(','):
+        coding, *params = [item.strip() for item in part.split(';')]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding.lower())
+    return accepted
+
+def encoded_etag(etag: str, encoding: str | None) -> str:
+    """The strong ETag `etag` of the identity body, suffixed for `encoding`: '"abc"' -> '"abc-br"'."""
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}{ENCODING_ETAG_SUFFIXES[encoding]}"'
+
+def preferred_encoding(request, has_br=True) -> str | None:
+    """'br', 'gzip' or None (identity): the smallest stored copy the client accepts."""
+    accepted = accepted_encodings(request.headers.get('Accept-Encoding', ''))
+    if has_br and 'br' in accepted:
+        return 'br'
+    return 'gzip' if 'gzip' in accepted else None
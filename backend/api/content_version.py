@@ -0,0 +1,41 @@
+# backend/api/content_version.py
+import time
+
+from django.core.cache import cache
+from django.utils import timezone
+
+# Every content model has a version token in the shared cache, bumped by the
+# save/delete/m2m signals in signals.py. Views derive their ETags from these
+# tokens, so checking whether a client's copy is current is one cache lookup
+# and never touches the database.
+VERSION_KEY_PREFIX = "content_version"
+VERSION_TIMEOUT = None  # Versions never expire on their own
+
+
+def _version_key(name: str) -> str:
+    return f"{VERSION_KEY_PREFIX}:{name}"
+
+
+def _new_version(last_modified=None) -> dict:
+    last_modified = last_modified or timezone.now()
+    return {'token': f"{time.time_ns():x}", 'last_modified': int(last_modified.timestamp())}
+
+
+def bump_content_version(*names: str, last_modified=None):
+    """Marks the given content types (model names, e.g. 'post') as changed."""
+    cache.set_many({_version_key(name): _new_version(last_modified) for name in names}, timeout=VERSION_TIMEOUT)
+
+
+def get_content_versions(*names: str) -> dict:
+    """
+    Returns {name: {'token', 'last_modified'}} for the given content types.
+    A version missing from the cache (first boot, eviction) is started fresh,
+    which only costs clients one full response.
+    """
+    keys = {_version_key(name): name for name in names}
+    found = cache.get_many(keys.keys())
+    missing = {key: _new_version() for key in keys if key not in found}
+    if missing:
+        cache.set_many(missing, timeout=VERSION_TIMEOUT)
+        found.update(missing)
+    return {keys[key]: version for key, version in found.items()}
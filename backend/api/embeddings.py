@@ -0,0 +1,344 @@
+# backend/api/embeddings.py
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger('api')
+
+# Sentence similarity for the skill matcher and the chat's retrieval step.
+# EMBEDDING_BACKEND picks the implementation:
+#
+#   remote  the Hugging Face Inference API (sentence-similarity task); a
+#           network round trip per query, on a free tier that cold-starts
+#   local   a sentence-transformers model (BERT encoder + mean pooling)
+#           loaded once per worker from EMBEDDING_MODEL_PATH and run on the
+#           CPU: the tokenizer from tokenizer.json (`tokenizers`), the
+#           weights from model.safetensors, evaluated with numpy. If the
+#           directory also holds model.onnx and onnxruntime is installed,
+#           that runs the encoder instead.
+#
+# The local backend keeps document embeddings (knowledge base entries,
+# project descriptions) in memory, so a query costs one encoder pass over
+# the query text alone.
+
+# Cached document vectors per worker (384 floats each for MiniLM, ~1.5 kB).
+DOCUMENT_CACHE_SIZE = 4096
+# sentence-transformers' max_seq_length for MiniLM; sentence_bert_config.json overrides it.
+DEFAULT_MAX_SEQ_LENGTH = 256
+
+
+class EmbeddingError(Exception):
+    """The backend couldn't score the sentences (not configured, upstream failure, bad model)."""
+
+
+class EmbeddingBackend:
+    """Scores `sentences` by cosine similarity to `source`."""
+    name = None
+
+    @property
+    def configured(self) -> bool:
+        return True
+
+    def similarities(self, source: str, sentences: list[str]) -> list[float]:
+        raise NotImplementedError
+
+    def warm(self, sentences=()):
+        """Loads whatever the first query would otherwise wait for."""
+
+# ==============================================================================
+# REMOTE (HUGGING FACE INFERENCE API)
+# ==============================================================================
+
+class RemoteEmbeddingBackend(EmbeddingBackend):
+    name = 'remote'
+    timeout = 20
+
+    @property
+    def configured(self) -> bool:
+        return bool(os.getenv('HUGGINGFACE_API_TOKEN'))
+
+    def similarities(self, source, sentences):
+        from .metrics import upstream_request
+        from .views.constants import HUGGINGFACE_EMBEDDING_MODEL_URL
+
+        token = os.getenv('HUGGINGFACE_API_TOKEN')
+        if not token:
+            raise EmbeddingError("Hugging Face API token is not set.")
+        headers = {"Authorization": f"Bearer {token}"}
+        payload = {"inputs": {"source_sentence": source, "sentences": sentences}}
+        try:
+            response = upstream_request('POST', HUGGINGFACE_EMBEDDING_MODEL_URL, headers=headers, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            scores = response.json()
+        except Exception as e:
+            raise EmbeddingError(f"Hugging Face API request failed: {e}") from e
+        if not isinstance(scores, list):
+            logger.error("Unexpected response from Hugging Face API: %s", scores)
+            raise EmbeddingError("Invalid response format from embedding API.")
+        return [float(score) for score in scores]
+
+# ==============================================================================
+# LOCAL (CPU)
+# ==============================================================================
+
+def _layer_norm(x, weight, bias, eps):
+    import numpy as np
+
+    mean = x.mean(axis=-1, keepdims=True)
+    variance = ((x - mean) ** 2).mean(axis=-1, keepdims=True)
+    return (x - mean) / np.sqrt(variance + eps) * weight + bias
+
+def _gelu(x):
+    from scipy.special import erf
+
+    return 0.5 * x * (1.0 + erf(x / 1.4142135623730951))
+
+def _gelu_tanh(x):
+    import numpy as np
+
+    return 0.5 * x * (1.0 + np.tanh(0.7978845608028654 * (x + 0.044715 * x ** 3)))
+
+ACTIVATIONS = {'gelu': _gelu, 'gelu_new': _gelu_tanh, 'gelu_pytorch_tanh': _gelu_tanh}
+
+
+class NumpyBertEncoder:
+    """
+    The forward pass of a BERT-style encoder (MiniLM, BGE-small, ...) from
+    its safetensors weights, in float32 numpy. Weights are transposed and the
+    query/key/value projections fused once at load, so each layer is four
+    matrix products.
+    """
+
+    def __init__(self, model_dir: Path, config: dict):
+        import numpy as np
+        from safetensors.numpy import load_file
+
+        tensors = load_file(str(model_dir / 'model.safetensors'))
+        # Bare BertModel checkpoints have no prefix; BertFor* ones nest it under "bert.".
+        prefix = 'bert.' if 'bert.embeddings.word_embeddings.weight' in tensors else ''
+
+        def weight(name):
+            return tensors[prefix + name].astype(np.float32)
+
+        self.heads = config['num_attention_heads']
+        self.eps = config.get('layer_norm_eps', 1e-12)
+        activation = config.get('hidden_act', 'gelu')
+        if activation not in ACTIVATIONS:
+            raise EmbeddingError(f"Unsupported activation {activation!r}")
+        self.activation = ACTIVATIONS[activation]
+        self.word_embeddings = weight('embeddings.word_embeddings.weight')
+        self.position_embeddings = weight('embeddings.position_embeddings.weight')
+        self.token_type_embeddings = weight('embeddings.token_type_embeddings.weight')
+        self.embeddings_norm = (weight('embeddings.LayerNorm.weight'), weight('embeddings.LayerNorm.bias'))
+        self.layers = []
+        for i in range(config['num_hidden_layers']):
+            layer = f'encoder.layer.{i}.'
+            attention = layer + 'attention.'
+            self.layers.append({
+                'qkv': np.concatenate([weight(f'{attention}self.{part}.weight') for part in ('query', 'key', 'value')]).T.copy(),
+                'qkv_bias': np.concatenate([weight(f'{attention}self.{part}.bias') for part in ('query', 'key', 'value')]),
+                'attention_out': weight(f'{attention}output.dense.weight').T.copy(),
+                'attention_out_bias': weight(f'{attention}output.dense.bias'),
+                'attention_norm': (weight(f'{attention}output.LayerNorm.weight'), weight(f'{attention}output.LayerNorm.bias')),
+                'intermediate': weight(f'{layer}intermediate.dense.weight').T.copy(),
+                'intermediate_bias': weight(f'{layer}intermediate.dense.bias'),
+                'output': weight(f'{layer}output.dense.weight').T.copy(),
+                'output_bias': weight(f'{layer}output.dense.bias'),
+                'output_norm': (weight(f'{layer}output.LayerNorm.weight'), weight(f'{layer}output.LayerNorm.bias')),
+            })
+
+    def __call__(self, input_ids, attention_mask, token_type_ids):
+        """Last hidden states, (batch, tokens, hidden), for padded int64 batches."""
+        import numpy as np
+
+        batch, length = input_ids.shape
+        x = (self.word_embeddings[input_ids] + self.position_embeddings[:length][None]
+             + self.token_type_embeddings[token_type_ids])
+        x = _layer_norm(x, *self.embeddings_norm, self.eps)
+        hidden = x.shape[-1]
+        head_size = hidden // self.heads
+        # Padding positions get a large negative score before the softmax.
+        mask_bias = ((1.0 - attention_mask[:, None, None, :].astype(np.float32)) * -1e9).astype(np.float32)
+        scale = np.float32(1.0 / np.sqrt(head_size))
+        for layer in self.layers:
+            qkv = x @ layer['qkv'] + layer['qkv_bias']
+            qkv = qkv.reshape(batch, length, 3, self.heads, head_size).transpose(2, 0, 3, 1, 4)
+            query, key, value = qkv[0], qkv[1], qkv[2]
+            scores = (query @ key.transpose(0, 1, 3, 2)) * scale + mask_bias
+            scores -= scores.max(axis=-1, keepdims=True)
+            probabilities = np.exp(scores)
+            probabilities /= probabilities.sum(axis=-1, keepdims=True)
+            context = (probabilities @ value).transpose(0, 2, 1, 3).reshape(batch, length, hidden)
+            x = _layer_norm(x + context @ layer['attention_out'] + layer['attention_out_bias'], *layer['attention_norm'], self.eps)
+            intermediate = self.activation(x @ layer['intermediate'] + layer['intermediate_bias'])
+            x = _layer_norm(x + intermediate @ layer['output'] + layer['output_bias'], *layer['output_norm'], self.eps)
+        return x
+
+
+class OnnxEncoder:
+    """The same encoder exported to model.onnx, run by onnxruntime on the CPU."""
+
+    def __init__(self, model_dir: Path):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        # Gunicorn runs several workers per machine; don't let each one claim every core.
+        options.intra_op_num_threads = settings.EMBEDDING_THREADS
+        self.session = onnxruntime.InferenceSession(str(model_dir / 'model.onnx'), options, providers=['CPUExecutionProvider'])
+        self.inputs = {item.name for item in self.session.get_inputs()}
+
+    def __call__(self, input_ids, attention_mask, token_type_ids):
+        feed = {'input_ids': input_ids, 'attention_mask': attention_mask, 'token_type_ids': token_type_ids}
+        return self.session.run(None, {name: value for name, value in feed.items() if name in self.inputs})[0]
+
+
+class LocalEmbeddingBackend(EmbeddingBackend):
+    """
+    Mean-pooled, L2-normalised sentence embeddings from a local model
+    directory (config.json, tokenizer.json, model.safetensors and/or
+    model.onnx, optionally sentence_bert_config.json), computed in batches
+    of EMBEDDING_BATCH_SIZE texts of similar length.
+    """
+    name = 'local'
+
+    def __init__(self, model_dir, batch_size=None):
+        self.model_dir = Path(model_dir)
+        self.batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        self._encoder = None
+        self._tokenizer = None
+        self._load_lock = threading.Lock()
+        self._documents = OrderedDict()  # sha1 of text -> vector, least recently used first
+        self._documents_lock = threading.Lock()
+
+    @property
+    def configured(self) -> bool:
+        return (self.model_dir / 'tokenizer.json').exists()
+
+    def load(self):
+        """Reads the tokenizer and weights; once per process, on first use or from the warmup."""
+        if self._encoder is not None:
+            return
+        with self._load_lock:
+            if self._encoder is not None:
+                return
+            try:
+                self._tokenizer, self._encoder = self._load()
+            except EmbeddingError:
+                raise
+            except Exception as e:
+                raise EmbeddingError(f"Can't load embedding model from {self.model_dir}: {e}") from e
+
+    def _load(self):
+        from tokenizers import Tokenizer
+
+        config = json.loads((self.model_dir / 'config.json').read_text())
+        max_length = min(config.get('max_position_embeddings', 512), DEFAULT_MAX_SEQ_LENGTH)
+        sentence_config = self.model_dir / 'sentence_bert_config.json'
+        if sentence_config.exists():
+            max_length = json.loads(sentence_config.read_text()).get('max_seq_length', max_length)
+        tokenizer = Tokenizer.from_file(str(self.model_dir / 'tokenizer.json'))
+        tokenizer.enable_truncation(max_length)
+        tokenizer.no_padding()  # Each batch is padded to its own longest text below
+
+        encoder = None
+        if (self.model_dir / 'model.onnx').exists():
+            try:
+                encoder = OnnxEncoder(self.model_dir)
+            except ImportError:
+                logger.info("model.onnx found but onnxruntime isn't installed; using the safetensors weights.")
+        if encoder is None:
+            encoder = NumpyBertEncoder(self.model_dir, config)
+        return tokenizer, encoder
+
+    def embed(self, texts: list[str]):
+        """(len(texts), hidden) float32 array of unit vectors."""
+        import numpy as np
+
+        self.load()
+        encodings = self._tokenizer.encode_batch(list(texts))
+        vectors = [None] * len(encodings)
+        # Similar lengths in a batch keep padding (wasted compute) low.
+        order = sorted(range(len(encodings)), key=lambda i: len(encodings[i].ids))
+        for start in range(0, len(order), self.batch_size):
+            indexes = order[start:start + self.batch_size]
+            length = max(len(encodings[i].ids) for i in indexes)
+            input_ids = np.zeros((len(indexes), length), dtype=np.int64)
+            attention_mask = np.zeros((len(indexes), length), dtype=np.int64)
+            token_type_ids = np.zeros((len(indexes), length), dtype=np.int64)
+            for row, i in enumerate(indexes):
+                ids = encodings[i].ids
+                input_ids[row, :len(ids)] = ids
+                attention_mask[row, :len(ids)] = 1
+                token_type_ids[row, :len(ids)] = encodings[i].type_ids
+            hidden = self._encoder(input_ids, attention_mask, token_type_ids)
+            # Mean over the real tokens, then unit length: cosine similarity becomes a dot product.
+            mask = attention_mask[:, :, None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            pooled /= np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+            for row, i in enumerate(indexes):
+                vectors[i] = pooled[row]
+        return np.stack(vectors).astype(np.float32) if vectors else np.zeros((0, 0), dtype=np.float32)
+
+    def embed_documents(self, texts: list[str]):
+        """Like embed(), but reuses the vectors of texts seen before (the same documents come with every query)."""
+        import numpy as np
+
+        keys = [hashlib.sha1(text.encode()).hexdigest() for text in texts]
+        with self._documents_lock:
+            cached = {key: self._documents.get(key) for key in keys}
+        missing = list({key: text for key, text in zip(keys, texts) if cached[key] is None}.items())
+        if missing:
+            for (key, _), vector in zip(missing, self.embed([text for _, text in missing])):
+                cached[key] = vector
+        with self._documents_lock:
+            for key in keys:
+                self._documents[key] = cached[key]
+                self._documents.move_to_end(key)
+            while len(self._documents) > DOCUMENT_CACHE_SIZE:
+                self._documents.popitem(last=False)
+        return np.stack([cached[key] for key in keys])
+
+    def similarities(self, source, sentences):
+        if not sentences:
+            return []
+        try:
+            query = self.embed([source])[0]
+            return [float(score) for score in self.embed_documents(sentences) @ query]
+        except EmbeddingError:
+            raise
+        except Exception as e:
+            raise EmbeddingError(f"Local embedding failed: {e}") from e
+
+    def warm(self, sentences=()):
+        self.load()
+        if sentences:
+            self.embed_documents(list(sentences))
+
+# ==============================================================================
+# SELECTION
+# ==============================================================================
+
+BACKENDS = {
+    'remote': lambda: RemoteEmbeddingBackend(),
+    'local': lambda: LocalEmbeddingBackend(settings.EMBEDDING_MODEL_PATH),
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_embedding_backend() -> EmbeddingBackend:
+    """This process's backend, per EMBEDDING_BACKEND; the local model loads on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if settings.EMBEDDING_BACKEND not in BACKENDS:
+                    raise EmbeddingError(f"Unknown EMBEDDING_BACKEND {settings.EMBEDDING_BACKEND!r}")
+                _backend = BACKENDS[settings.EMBEDDING_BACKEND]()
+    return _backend
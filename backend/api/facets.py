@@ -0,0 +1,62 @@
+# backend/api/facets.py
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Post, Project, Tag
+
+
+def prefetch_tags():
+    """
+    The `tags` prefetch of every serialized project/post queryset. Ordered by
+    tag id, like the through rows of the fast list path (ValuesRepresentation),
+    so both produce the tags in the same order.
+    """
+    return Prefetch('tags', queryset=Tag.objects.order_by('id'))
+
+def parse_tag_slugs(query_params) -> list[str]:
+    """Tag slugs from `?tags=a,b` (all must match) plus the older single `?tag=a`."""
+    slugs = [slug.strip() for slug in query_params.get('tags', '').split(',') if slug.strip()]
+    if query_params.get('tag'):
+        slugs.append(query_params['tag'])
+    return sorted(set(slugs))
+
+def tagged_with_all(queryset, slugs):
+    """
+    Narrows a Project or Post queryset to the rows carrying every tag in
+    `slugs`. Done as `pk IN (one grouped query on the through table)`, so it
+    composes with the cursor pagination and `.values()` of the list views.
+    """
+    if not slugs:
+        return queryset
+    m2m_field = queryset.model._meta.get_field('tags')
+    owner = m2m_field.m2m_field_name()
+    matching = (
+        m2m_field.remote_field.through.objects.filter(tag__slug__in=slugs)
+        .values(owner)
+        .annotate(matched=Count('tag', distinct=True))
+        .filter(matched=len(slugs))
+        .values(owner)
+    )
+    return queryset.filter(pk__in=matching)
+
+def _count_per_tag(through_queryset):
+    counts = through_queryset.filter(tag=OuterRef('pk')).values('tag').annotate(count=Count('*')).values('count')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+def tag_facets(slugs=()):
+    """
+    Every tag with the number of projects and published posts carrying it, in
+    one query (one correlated count per tag and type, no join fan-out). With
+    `slugs` the counts are intersections: how many of the items tagged with
+    all of `slugs` also carry each tag, i.e. what adding that tag to the
+    filter would leave.
+    """
+    projects = tagged_with_all(Project.objects.all(), slugs)
+    posts = tagged_with_all(Post.objects.filter(is_published=True), slugs)
+    project_tags = Project.tags.through.objects.filter(project__in=projects.values('pk'))
+    post_tags = Post.tags.through.objects.filter(post__in=posts.values('pk'))
+    return list(
+        Tag.objects.annotate(project_count=_count_per_tag(project_tags), post_count=_count_per_tag(post_tags))
+        .order_by('name')
+        .values('name', 'slug', 'project_count', 'post_count')
+    )
@@ -0,0 +1,113 @@
+# backend/api/heatmap.py
+import hashlib
+import math
+from datetime import date
+from xml.sax.saxutils import escape
+
+from .compression import compress
+
+# The same palettes the frontend calendar used: level 0 (no contributions) to 4.
+THEMES = {
+    'light': {'levels': ("#ebedf0", "#9be9a8", "#40c463", "#30a14e", "#216e39"), 'text': "#57606a"},
+    'dark': {'levels': ("#161b22", "#0e4429", "#006d32", "#26a641", "#39d353"), 'text': "#8b949e"},
+}
+DEFAULT_THEME = 'light'
+
+# Layout, in SVG user units (the viewBox scales to the container).
+CELL = 11
+STEP = 14  # Cell plus gap
+LEFT = 32  # Weekday labels
+TOP = 20   # Month labels
+LEGEND = 28
+WEEKDAY_LABELS = {1: "Mon", 3: "Wed", 5: "Fri"}
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# ==============================================================================
+# RENDERING
+# ==============================================================================
+
+def contribution_level(count: int, max_count: int) -> int:
+    """0 for no contributions, else 1-4 by quarter of the busiest day."""
+    if count <= 0 or max_count <= 0:
+        return 0
+    return min(4, max(1, math.ceil(4 * count / max_count)))
+
+def _month_labels(weeks):
+    """(week index, label) where a new month starts, skipping labels that would overlap."""
+    labels, last_month, last_index = [], None, -3
+    for index, week in enumerate(weeks):
+        days = week['contributionDays']
+        if not days:
+            continue
+        month = date.fromisoformat(days[0]['date']).month
+        if month != last_month:
+            if index - last_index >= 3:
+                labels.append((index, MONTHS[month - 1]))
+                last_index = index
+            last_month = month
+    return labels
+
+def render_contributions_svg(calendar: dict, theme: str = DEFAULT_THEME) -> bytes:
+    """
+    The contribution calendar (GitHub's contributionCalendar: weeks of days
+    with date, weekday and contributionCount) as a self-contained SVG
+    heatmap: month and weekday labels, one square per day with a tooltip,
+    and a total/legend line.
+    """
+    palette = THEMES[theme]
+    weeks = calendar.get('weeks') or []
+    max_count = max((day['contributionCount'] for week in weeks for day in week['contributionDays']), default=0)
+    total = calendar.get('totalContributions', 0)
+    width = LEFT + len(weeks) * STEP
+    height = TOP + 7 * STEP + LEGEND
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="{width}" height="{height}" '
+        f'role="img" aria-labelledby="title">',
+        f'<title id="title">{total} contributions in the last year</title>',
+        f'<style>text{{font:10px -apple-system,BlinkMacSystemFont,"Segoe UI",Helvetica,Arial,sans-serif;fill:{palette["text"]}}}'
+        + "".join(f'.l{level}{{fill:{color}}}' for level, color in enumerate(palette['levels']))
+        + '</style>',
+    ]
+    for index, label in _month_labels(weeks):
+        parts.append(f'<text x="{LEFT + index * STEP}" y="{TOP - 8}">{label}</text>')
+    for weekday, label in WEEKDAY_LABELS.items():
+        parts.append(f'<text x="0" y="{TOP + weekday * STEP + CELL - 2}">{label}</text>')
+
+    for index, week in enumerate(weeks):
+        x = LEFT + index * STEP
+        for day in week['contributionDays']:
+            count = day['contributionCount']
+            day_date = date.fromisoformat(day['date'])
+            noun = "contribution" if count == 1 else "contributions"
+            parts.append(
+                f'<rect x="{x}" y="{TOP + day["weekday"] * STEP}" width="{CELL}" height="{CELL}" rx="2" '
+                f'class="l{contribution_level(count, max_count)}">'
+                f'<title>{count or "No"} {noun} on {MONTHS[day_date.month - 1]} {day_date.day}, {day_date.year}</title></rect>'
+            )
+
+    legend_y = TOP + 7 * STEP + 10
+    parts.append(f'<text x="{LEFT}" y="{legend_y + CELL - 2}">{escape(f"{total} contributions in the last year")}</text>')
+    legend_x = width - 5 * STEP - 30
+    parts.append(f'<text x="{legend_x - 28}" y="{legend_y + CELL - 2}">Less</text>')
+    for level in range(5):
+        parts.append(f'<rect x="{legend_x + level * STEP}" y="{legend_y}" width="{CELL}" height="{CELL}" rx="2" class="l{level}"/>')
+    parts.append(f'<text x="{legend_x + 5 * STEP + 2}" y="{legend_y + CELL - 2}">More</text>')
+    parts.append('</svg>')
+    return "".join(parts).encode()
+
+# ==============================================================================
+# PRE-COMPRESSION
+# ==============================================================================
+
+def precompress(content: bytes) -> dict:
+    """
+    {'etag', 'identity', 'gzip', 'br'} for one rendered SVG, compressed once
+    at the highest levels so every response is a straight copy. 'br' is None
+    when brotli isn't installed.
+    """
+    return {
+        'etag': f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+        'identity': content,
+        **compress(content),
+    }
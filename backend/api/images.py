@@ -0,0 +1,229 @@
+# backend/api/images.py
+import hashlib
+import io
+import logging
+import os
+import re
+import threading
+
+from django.conf import settings
+from django.db import transaction
+
+from .background import closes_db_connection
+from .content_version import bump_content_version
+from .models import Project
+
+logger = logging.getLogger('api')
+
+# Variants live in MEDIA_ROOT/<IMAGE_DIR>/ as <source hash>-<width>w.<ext>.
+# The hash covers the source bytes and ENCODER_VERSION, so a name always maps
+# to the same bytes and can be cached forever; bump ENCODER_VERSION when the
+# widths or encoder settings below change.
+IMAGE_DIR = "project-images"
+ENCODER_VERSION = "1"
+WIDTHS = (320, 640, 960, 1280)
+# format -> (extension, content type, Pillow save options)
+FORMATS = {
+    'avif': ('avif', 'image/avif', {'quality': 50, 'speed': 6}),
+    'webp': ('webp', 'image/webp', {'quality': 80, 'method': 4}),
+}
+NAME_PATTERN = re.compile(r'^[0-9a-f]{16}-\d{1,4}w\.(avif|webp)$')
+
+# Source images are arbitrary URLs: refuse anything that would hog a worker.
+MAX_SOURCE_BYTES = 15 * 1024 * 1024
+MAX_SOURCE_PIXELS = 40_000_000
+FETCH_TIMEOUT_SECONDS = 15
+
+
+class ImageError(Exception):
+    """The source image couldn't be fetched or decoded."""
+
+
+def image_dir() -> str:
+    return os.path.join(settings.MEDIA_ROOT, IMAGE_DIR)
+
+def available_formats():
+    from PIL import features
+
+    # AVIF needs a Pillow built with libavif; WebP is in every wheel.
+    return [name for name in FORMATS if features.check(name)]
+
+# ==============================================================================
+# FETCH & ENCODE
+# ==============================================================================
+
+def fetch_source(url: str) -> bytes:
+    """Downloads the original image, refusing bodies over MAX_SOURCE_BYTES."""
+    import requests
+
+    from .metrics import upstream_request
+
+    try:
+        response = upstream_request('GET', url, timeout=FETCH_TIMEOUT_SECONDS, stream=True)
+    except requests.RequestException as e:
+        raise ImageError(f"Can't fetch {url}: {e}") from e
+    try:
+        if response.status_code != 200:
+            raise ImageError(f"HTTP {response.status_code} from {url}")
+        if int(response.headers.get('Content-Length') or 0) > MAX_SOURCE_BYTES:
+            raise ImageError(f"{url} is larger than {MAX_SOURCE_BYTES} bytes")
+        body = bytearray()
+        for chunk in response.iter_content(64 * 1024):
+            body += chunk
+            if len(body) > MAX_SOURCE_BYTES:
+                raise ImageError(f"{url} is larger than {MAX_SOURCE_BYTES} bytes")
+        return bytes(body)
+    except requests.RequestException as e:
+        raise ImageError(f"Can't fetch {url}: {e}") from e
+    finally:
+        response.close()
+
+def _open(source: bytes):
+    from PIL import Image, ImageOps
+
+    try:
+        image = Image.open(io.BytesIO(source))
+        if image.width * image.height > MAX_SOURCE_PIXELS:
+            raise ImageError(f"{image.width}x{image.height} image is too large")
+        image = ImageOps.exif_transpose(image)  # Phone photos carry their rotation in EXIF
+        image.load()
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ImageError(f"Can't decode image: {e}") from e
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    return image.convert('RGBA' if has_alpha else 'RGB')
+
+def target_widths(source_width: int) -> list[int]:
+    """The fixed widths below the source's (never upscaled), plus the source width if it is below the largest."""
+    widths = [width for width in WIDTHS if width < source_width]
+    if source_width < WIDTHS[-1]:
+        widths.append(source_width)
+    return widths
+
+def encode_variants(source: bytes) -> dict[str, dict[int, bytes]]:
+    """{format: {width: encoded bytes}} for every available format and target width."""
+    from PIL import Image
+
+    image = _open(source)
+    variants = {name: {} for name in available_formats()}
+    for width in target_widths(image.width):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+        for name in variants:
+            _, _, options = FORMATS[name]
+            buffer = io.BytesIO()
+            resized.save(buffer, format=name.upper(), **options)
+            variants[name][width] = buffer.getvalue()
+    return variants
+
+# ==============================================================================
+# STORAGE
+# ==============================================================================
+
+def _write_atomic(path: str, data: bytes):
+    # Readers never see a half-written file, and concurrent writers of the same name just race to an identical result.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def store_variants(source: bytes) -> dict[str, dict[str, str]]:
+    """
+    Encodes and writes the variants of `source`, skipping names already on
+    disk (same hash, same bytes). Returns {format: {width: file name}}, the
+    shape stored in Project.image_variants.
+    """
+    digest = hashlib.sha256(ENCODER_VERSION.encode() + source).hexdigest()[:16]
+    os.makedirs(image_dir(), exist_ok=True)
+    stored = {}
+    for name, widths in encode_variants(source).items():
+        extension = FORMATS[name][0]
+        stored[name] = {}
+        for width, data in widths.items():
+            file_name = f"{digest}-{width}w.{extension}"
+            path = os.path.join(image_dir(), file_name)
+            if not os.path.exists(path):
+                _write_atomic(path, data)
+            stored[name][str(width)] = file_name
+    return stored
+
+def variant_names(variants) -> set[str]:
+    return {file_name for widths in (variants or {}).values() for file_name in widths.values()}
+
+def variants_present(variants) -> bool:
+    return all(os.path.exists(os.path.join(image_dir(), name)) for name in variant_names(variants))
+
+def prune_unreferenced() -> int:
+    """Deletes variant files no project points at any more. Returns how many."""
+    referenced = set()
+    for variants in Project.objects.values_list('image_variants', flat=True):
+        referenced |= variant_names(variants)
+    removed = 0
+    if os.path.isdir(image_dir()):
+        for file_name in os.listdir(image_dir()):
+            if NAME_PATTERN.match(file_name) and file_name not in referenced:
+                os.remove(os.path.join(image_dir(), file_name))
+                removed += 1
+    return removed
+
+# ==============================================================================
+# PROJECTS
+# ==============================================================================
+
+def needs_variants(project) -> bool:
+    """True when the stored variants weren't built from the current image URL (or their files are gone)."""
+    if (project.image or '') != project.image_source:
+        return True
+    return bool(project.image) and not variants_present(project.image_variants)
+
+def update_project_image(project) -> bool:
+    """
+    Rebuilds the variants of one project if its image URL changed since they
+    were built. Returns True if the row was updated. On a fetch or decode
+    failure the old variants stay and the next call retries.
+    """
+    if not needs_variants(project):
+        return False
+    url = project.image or ''
+    variants = store_variants(fetch_source(url)) if url else {}
+    # update() rather than save(): no signals, so no loop back into this function.
+    updated = Project.objects.filter(pk=project.pk, image=project.image).update(image_source=url, image_variants=variants)
+    if updated:
+        bump_content_version('project')
+    return bool(updated)
+
+def update_project_images(force=False) -> dict[str, int]:
+    """Brings every project's variants up to date. Returns counts of updated/failed/unchanged."""
+    counts = {'updated': 0, 'failed': 0, 'unchanged': 0}
+    for project in Project.objects.only('id', 'image', 'image_source', 'image_variants').order_by('id'):
+        if force:
+            project.image_source = None
+        try:
+            counts['updated' if update_project_image(project) else 'unchanged'] += 1
+        except ImageError as e:
+            logger.warning("Error building images for project %s: %s", project.pk, e)
+            counts['failed'] += 1
+    return counts
+
+@closes_db_connection
+def _image_worker(pk):
+    try:
+        project = Project.objects.filter(pk=pk).only('id', 'image', 'image_source', 'image_variants').first()
+        if project is not None and update_project_image(project):
+            logger.info("Built image variants for project %s.", pk)
+    except Exception:
+        logger.exception("Error building images for project %s", pk)
+
+def schedule_project_image_update(project):
+    """
+    After the admin's transaction commits, rebuilds the project's variants in
+    a background thread if its image URL changed, so the save doesn't wait
+    on the download and encoding.
+    """
+    if not needs_variants(project):
+        return
+
+    def start():
+        thread = threading.Thread(target=_image_worker, args=(project.pk,), name="project-images", daemon=True)
+        thread.start()
+
+    transaction.on_commit(start)
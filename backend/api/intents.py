@@ -0,0 +1,194 @@
+# backend/api/intents.py
+import logging
+import re
+import threading
+from typing import NamedTuple
+
+logger = logging.getLogger('api')
+
+# Career chat intents. A routed question gets every knowledge base entry of
+# that type as context (no retrieval call); anything else goes through the
+# keyword filter + semantic search in career_chat.
+#
+# Matching is on whole tokens, not substrings ("network" is not "work",
+# "stackoverflow" is not "stack"), and multi-word phrases win over their
+# words ("work experience" is experience, not a project). Each matched
+# phrase adds its weight to its intent; a weak word alone ("work",
+# "history") isn't enough to route.
+INTENT_KEYWORDS = {
+    'project': {
+        'project': 3, 'projects': 3, 'portfolio': 2.5, 'side project': 3.5, 'side projects': 3.5,
+        'built': 2, 'build': 1, 'app': 2, 'apps': 2, 'application': 1, 'applications': 1,
+        'repo': 2, 'repos': 2, 'repository': 2, 'repositories': 2, 'github': 1.5, 'demo': 2, 'demos': 2,
+        'showcase': 2, 'work': 1, 'your work': 2.5, 'his work': 2.5, 'made': 1, 'created': 1,
+    },
+    'experience': {
+        'experience': 3, 'experiences': 3, 'resume': 3, 'cv': 3, 'work experience': 4.5, 'work history': 4.5,
+        'job history': 4.5, 'employment': 3, 'employment history': 4.5, 'job': 2, 'jobs': 2, 'employer': 2.5,
+        'employers': 2.5, 'career': 2, 'worked at': 3, 'worked for': 3, 'worked': 2, 'your work experience': 4.5, 'your work history': 4.5, 'company': 2,
+        'companies': 2, 'role': 2, 'roles': 2, 'position': 1.5, 'positions': 1.5, 'history': 1.5,
+        'background': 1.5, 'professional background': 3.5, 'summarize experience': 4.5, 'responsibilities': 2.5,
+    },
+    'certification': {
+        'certification': 3, 'certifications': 3, 'certified': 3, 'certificate': 3, 'certificates': 3,
+        'credential': 3, 'credentials': 3, 'education': 2.5, 'degree': 2.5, 'degrees': 2.5, 'course': 2,
+        'courses': 2, 'coursera': 3, 'university': 2, 'college': 2, 'qualification': 2.5,
+        'qualifications': 2.5, 'studied': 1.5, 'study': 1.5, 'diploma': 2.5,
+    },
+    'blog': {
+        'blog': 3, 'blogs': 3, 'blog post': 4.5, 'blog posts': 4.5, 'post': 2.5, 'posts': 2.5,
+        'article': 3, 'articles': 3, 'writing': 2, 'write': 2, 'written': 2, 'wrote': 2, 'essay': 2.5,
+        'essays': 2.5, 'published': 2, 'publish': 1.5, 'read': 1,
+    },
+    'tech_stack': {
+        'tech stack': 4.5, 'stack': 2.5, 'tech': 2.5, 'technology': 2.5, 'technologies': 2.5, 'skill': 2.5,
+        'skills': 2.5, 'skillset': 3, 'language': 2, 'languages': 2, 'programming language': 3.5,
+        'programming languages': 3.5, 'framework': 2.5, 'frameworks': 2.5, 'tool': 2, 'tools': 2,
+        'tooling': 2, 'library': 2, 'libraries': 2, 'proficient': 2, 'familiar with': 1.5, 'expertise': 2,
+    },
+}
+# A question routes when its best intent scores at least MIN_SCORE and holds
+# at least MIN_CONFIDENCE of the best two intents' combined score.
+MIN_SCORE = 2.0
+MIN_CONFIDENCE = 0.6
+
+# Example questions per intent. With the local embedding backend (no network
+# call) their mean vector is a prototype: a question the keywords can't place
+# routes to the nearest prototype if it is close enough.
+INTENT_EXAMPLES = {
+    'project': ["What have you built?", "Show me things you made", "Which apps did you ship?",
+                "What are you working on?"],
+    'experience': ["Where have you worked?", "Summarize your professional background",
+                   "What did you do at your last company?", "Tell me about your career so far"],
+    'certification': ["What certifications do you hold?", "Did you go to university?",
+                      "Which courses have you completed?", "What qualifications do you have?"],
+    'blog': ["What have you written lately?", "Show me your latest articles", "Do you have a blog?",
+             "What do you write about?"],
+    'tech_stack': ["What is your tech stack?", "Which programming languages do you know?",
+                   "What frameworks do you use?", "What are your strongest skills?"],
+}
+PROTOTYPE_MIN_SIMILARITY = 0.5
+PROTOTYPE_MIN_MARGIN = 0.05
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[+#]+)?")
+
+
+class Route(NamedTuple):
+    intent: str | None  # None: answer from retrieval over the whole knowledge base
+    method: str         # 'keywords', 'prototype' or 'retrieval'
+    confidence: float
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower().replace("'", ""))
+
+# ==============================================================================
+# KEYWORD AUTOMATON
+# ==============================================================================
+
+class KeywordAutomaton:
+    """
+    A token trie of every keyword phrase, built once. scan() walks the
+    question left to right taking the longest phrase that starts at each
+    token, so the cost is linear in the question, not in the keyword table.
+    """
+
+    def __init__(self, keywords: dict[str, dict[str, float]]):
+        self.root = {}
+        for intent, phrases in keywords.items():
+            for phrase, weight in phrases.items():
+                node = self.root
+                for token in tokenize(phrase):
+                    node = node.setdefault(token, {})
+                node.setdefault(None, []).append((intent, weight))  # None marks the end of a phrase
+
+    def scan(self, tokens: list[str]) -> dict[str, float]:
+        """{intent: summed weight} of the phrases found in `tokens`."""
+        scores = {}
+        i = 0
+        while i < len(tokens):
+            node, match, end = self.root, None, i
+            for j in range(i, len(tokens)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if None in node:
+                    match, end = node[None], j + 1
+            if match is None:
+                i += 1
+                continue
+            for intent, weight in match:
+                scores[intent] = scores.get(intent, 0.0) + weight
+            i = end
+        return scores
+
+
+def decide(scores: dict[str, float], min_score=MIN_SCORE, min_confidence=MIN_CONFIDENCE):
+    """(intent, confidence) if one intent clearly wins, else (None, confidence)."""
+    if not scores:
+        return None, 0.0
+    ranked = sorted(scores.values(), reverse=True)
+    best = max(scores, key=scores.get)
+    runner_up = ranked[1] if len(ranked) > 1 else 0.0
+    confidence = ranked[0] / (ranked[0] + runner_up)
+    if ranked[0] >= min_score and confidence >= min_confidence:
+        return best, confidence
+    return None, confidence
+
+# ==============================================================================
+# ROUTER
+# ==============================================================================
+
+class IntentRouter:
+    """Keywords first; for the undecided, the intent prototypes if the embedding backend is local."""
+
+    def __init__(self, keywords=INTENT_KEYWORDS, examples=INTENT_EXAMPLES):
+        self.automaton = KeywordAutomaton(keywords)
+        self.examples = examples
+
+    def route_keywords(self, question: str) -> Route:
+        intent, confidence = decide(self.automaton.scan(tokenize(question)))
+        return Route(intent, 'keywords' if intent else 'retrieval', confidence)
+
+    def route(self, question: str, backend=None) -> Route:
+        route = self.route_keywords(question)
+        if route.intent is None and backend is not None and backend.name == 'local' and backend.configured:
+            from .embeddings import EmbeddingError
+
+            try:
+                return self.route_prototypes(question, backend) or route
+            except EmbeddingError as e:
+                logger.warning("Error routing by intent prototypes: %s", e)
+        return route
+
+    def route_prototypes(self, question: str, backend):
+        import numpy as np
+
+        intents = list(self.examples)
+        # The example vectors stay in the backend's document cache after the first call.
+        prototypes = []
+        for intent in intents:
+            mean = backend.embed_documents(self.examples[intent]).mean(axis=0)
+            prototypes.append(mean / np.linalg.norm(mean))
+        similarities = np.stack(prototypes) @ backend.embed([question])[0]
+        order = np.argsort(-similarities)
+        best, runner_up = float(similarities[order[0]]), float(similarities[order[1]])
+        if best >= PROTOTYPE_MIN_SIMILARITY and best - runner_up >= PROTOTYPE_MIN_MARGIN:
+            return Route(intents[order[0]], 'prototype', best)
+        return None
+
+    def warm(self, backend):
+        if backend.name == 'local' and backend.configured:
+            backend.warm([example for examples in self.examples.values() for example in examples])
+
+
+_router = None
+_router_lock = threading.Lock()
+
+def get_intent_router() -> IntentRouter:
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = IntentRouter()
+    return _router
@@ -0,0 +1,22 @@
+# backend/api/management/commands/build_project_images.py
+from django.core.management.base import BaseCommand
+
+from api.images import prune_unreferenced, update_project_images
+
+
+class Command(BaseCommand):
+    help = "Fetches project images whose URL changed (or whose files are missing) and stores their resized WebP/AVIF variants."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true',
+                            help="Re-fetch every image, even if its URL is unchanged.")
+        parser.add_argument('--prune', action='store_true',
+                            help="Delete variant files no project refers to any more.")
+
+    def handle(self, *args, **options):
+        counts = update_project_images(force=options['force'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Project images: {counts['updated']} updated, {counts['unchanged']} unchanged, {counts['failed']} failed."
+        ))
+        if options['prune']:
+            self.stdout.write(f"Removed {prune_unreferenced()} unreferenced file(s).")
@@ -0,0 +1,153 @@
+# backend/api/management/commands/check_query_plans.py
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from api.seed import Rollback, seed
+
+# For each hot endpoint: the tables every one of its queries must read through
+# an index, and (`ordered`) the table whose rows must come out of an index
+# already in the response order, with no sort step. Dropping or changing an
+# index behind these (migration 0015, the unique constraints on slugs and
+# through tables) makes the check fail instead of silently turning into a
+# sequential scan in production.
+PLAN_CHECKS = {
+    '/api/projects/': {'indexed': ['api_project', 'api_project_tags'], 'ordered': 'api_project'},
+    '/api/projects/?tag=budget-tag-0': {'indexed': ['api_project', 'api_project_tags', 'api_tag']},
+    '/api/projects/?tags=budget-tag-0,budget-tag-1': {'indexed': ['api_project', 'api_project_tags', 'api_tag']},
+    '/api/posts/': {'indexed': ['api_post', 'api_post_tags'], 'ordered': 'api_post'},
+    '/api/posts/?tag=budget-tag-0': {'indexed': ['api_post', 'api_post_tags', 'api_tag']},
+    '/api/posts/budget-post-0/': {'indexed': ['api_post', 'api_post_tags', 'api_tag']},
+    '/api/certifications/': {'indexed': ['api_certification'], 'ordered': 'api_certification'},
+    '/api/work-experience/': {'indexed': ['api_workexperience'], 'ordered': 'api_workexperience'},
+}
+
+# ==============================================================================
+# PLAN READERS
+# ==============================================================================
+# Each returns (tables read without an index, tables whose rows get sorted) for one query.
+
+def _postgresql_plan(cursor, sql):
+    cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    scanned, sorted_tables = set(), set()
+
+    def relations(node):
+        found = {node['Relation Name']} if 'Relation Name' in node else set()
+        for child in node.get('Plans', []):
+            found |= relations(child)
+        return found
+
+    def walk(node):
+        if node['Node Type'] == 'Seq Scan':
+            scanned.add(node['Relation Name'])
+        if node['Node Type'] in ('Sort', 'Incremental Sort'):
+            sorted_tables.update(relations(node))
+        for child in node.get('Plans', []):
+            walk(child)
+
+    walk(plan[0]['Plan'])
+    return scanned, sorted_tables
+
+def _sqlite_plan(cursor, sql):
+    cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+    details = [row[3] for row in cursor.fetchall()]
+    # SQLite names tables by their alias in the plan (U0, U1 in subqueries); map them back.
+    aliases = _sqlite_aliases(sql)
+    scanned, sorted_tables, read = set(), set(), set()
+    for detail in details:
+        words = detail.split()
+        if words[0] in ('SCAN', 'SEARCH'):
+            table = aliases.get(words[1], words[1])
+            read.add(table)
+            # A bare SCAN walks the table itself. On a rowid table that is the primary key b-tree,
+            # so a LIMITed walk in primary key order (no sort step) is an index range scan too.
+            if words[0] == 'SCAN' and 'USING' not in words:
+                scanned.add(table)
+    sorts = any(detail.startswith('USE TEMP B-TREE FOR') and 'ORDER BY' in detail for detail in details)
+    if sorts:
+        sorted_tables |= read
+    elif ' LIMIT ' in sql:
+        scanned.clear()
+    return scanned, sorted_tables
+
+def _sqlite_aliases(sql):
+    words = sql.replace('(', ' ').replace(')', ' ').split()
+    aliases = {}
+    for i, word in enumerate(words[:-1]):
+        if words[i - 1] in ('FROM', 'JOIN') and words[i + 1] not in ('ON', 'WHERE', 'INNER', 'LEFT', 'ORDER', 'GROUP'):
+            aliases[words[i + 1].strip('"')] = word.strip('"')
+    return aliases
+
+PLAN_READERS = {
+    'postgresql': _postgresql_plan,
+    'sqlite': _sqlite_plan,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds a realistic number of rows inside a rolled-back transaction, runs EXPLAIN on "
+        "every query of the hot API endpoints and fails if one reads a table without an index "
+        "(or sorts rows an index should return in order). Schema regression check for CI."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help="Projects, posts, certifications and jobs to seed.")
+        parser.add_argument('--verbose', action='store_true', help="Print every query's plan.")
+
+    def handle(self, *args, **options):
+        read_plan = PLAN_READERS.get(connection.vendor)
+        if read_plan is None:
+            raise CommandError(f"No plan reader for {connection.vendor}.")
+
+        failures = []
+        with override_settings(
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+            ALLOWED_HOSTS=['testserver'],
+            SECURE_SSL_REDIRECT=False,
+        ):
+            client = Client()
+            try:
+                with transaction.atomic():
+                    seed(options['rows'])
+                    with connection.cursor() as cursor:
+                        cursor.execute("ANALYZE")
+                        if connection.vendor == 'postgresql':
+                            # A few thousand rows still fit in a handful of pages, where the planner
+                            # rightly prefers a sequential scan. Making it the last resort shows
+                            # whether an index *can* serve the query, which is what must not regress.
+                            cursor.execute("SET LOCAL enable_seqscan = off")
+                    for url, expected in PLAN_CHECKS.items():
+                        failures += self.check_endpoint(client, read_plan, url, expected, options['verbose'])
+                    raise Rollback
+            except Rollback:
+                pass
+
+        if failures:
+            raise CommandError("Query plan regressed:\n  " + "\n  ".join(failures))
+        self.stdout.write(self.style.SUCCESS("Every hot query is served by an index."))
+
+    def check_endpoint(self, client, read_plan, url, expected, verbose):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        problems = [] if response.status_code == 200 else [f"HTTP {response.status_code}"]
+        with connection.cursor() as cursor:
+            for query in queries.captured_queries:
+                sql = query['sql']
+                if not sql.startswith('SELECT'):
+                    continue
+                scanned, sorted_tables = read_plan(cursor, sql)
+                problems += [f"sequential scan of {table}" for table in sorted(scanned & set(expected['indexed']))]
+                if expected.get('ordered') in sorted_tables:
+                    problems.append(f"{expected['ordered']} rows sorted instead of read in index order")
+                if verbose:
+                    self.stdout.write(f"      {sql[:160]}")
+                    self.stdout.write(f"        seq: {sorted(scanned) or '-'}  sorted: {sorted(sorted_tables) or '-'}")
+        self.stdout.write(f"{'FAIL' if problems else 'ok':<5} {url}" + (f"  ({'; '.join(problems)})" if problems else ""))
+        return [f"{url}: {problem}" for problem in problems]
@@ -0,0 +1,21 @@
+# backend/api/management/commands/download_embedding_model.py
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# What LocalEmbeddingBackend reads; the PyTorch weights and other exports are skipped.
+MODEL_FILES = ['config.json', 'tokenizer.json', 'model.safetensors', 'sentence_bert_config.json']
+
+
+class Command(BaseCommand):
+    help = "Downloads the sentence-transformers model for EMBEDDING_BACKEND=local into EMBEDDING_MODEL_PATH."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repo', default=settings.EMBEDDING_MODEL_REPO,
+                            help="Hugging Face model repository to download.")
+
+    def handle(self, *args, **options):
+        from huggingface_hub import snapshot_download
+
+        path = snapshot_download(repo_id=options['repo'], allow_patterns=MODEL_FILES,
+                                 local_dir=settings.EMBEDDING_MODEL_PATH)
+        self.stdout.write(self.style.SUCCESS(f"Downloaded {options['repo']} to {path}."))
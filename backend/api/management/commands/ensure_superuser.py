@@ -0,0 +1,24 @@
+# backend/api/management/commands/ensure_superuser.py
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = ("Creates the superuser from DJANGO_SUPERUSER_USERNAME / DJANGO_SUPERUSER_PASSWORD if it doesn't exist. "
+            "Run once per deploy (build.sh), not in every worker.")
+
+    def handle(self, *args, **options):
+        username = os.getenv('DJANGO_SUPERUSER_USERNAME')
+        password = os.getenv('DJANGO_SUPERUSER_PASSWORD')
+        if not (username and password):
+            self.stdout.write("DJANGO_SUPERUSER_USERNAME / DJANGO_SUPERUSER_PASSWORD not set. Skipping.")
+            return
+
+        User = get_user_model()
+        if User.objects.filter(username=username).exists():
+            self.stdout.write(f"Superuser '{username}' already exists. Skipping creation.")
+            return
+        User.objects.create_superuser(username=username, password=password)
+        self.stdout.write(self.style.SUCCESS(f"Superuser '{username}' created."))
@@ -0,0 +1,26 @@
+# backend/api/management/commands/export_api_snapshot.py
+from django.core.management.base import BaseCommand
+
+from api.snapshot import export_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Writes every read-only content endpoint to content-hashed, pre-compressed (gzip/brotli) "
+        "JSON files under API_SNAPSHOT_ROOT (served by /api/snapshot/), plus a manifest mapping "
+        "API paths to them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output-dir', help="Write somewhere other than API_SNAPSHOT_ROOT.")
+        parser.add_argument('--no-prune', action='store_true',
+                            help="Keep snapshot files that are no longer referenced by any manifest.")
+
+    def handle(self, *args, **options):
+        summary = export_snapshot(output_dir=options['output_dir'], prune=not options['no_prune'])
+        if not summary['brotli']:
+            self.stdout.write(self.style.WARNING("Brotli is not installed; only gzip copies were written."))
+        self.stdout.write(self.style.SUCCESS(
+            f"Exported {summary['endpoints']} endpoint(s): {summary['written']} new file(s), "
+            f"{summary['removed']} stale file(s) removed."
+        ))
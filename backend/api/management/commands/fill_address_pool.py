@@ -0,0 +1,17 @@
+# backend/api/management/commands/fill_address_pool.py
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.bitcoin import fill_address_pool
+
+
+class Command(BaseCommand):
+    help = "Pre-derives unassigned Bitcoin receive addresses so the tip jar never waits on key derivation."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=settings.BITCOIN_ADDRESS_POOL_SIZE,
+                            help="Number of unassigned addresses to keep in the pool.")
+
+    def handle(self, *args, **options):
+        created = fill_address_pool(options['size'])
+        self.stdout.write(self.style.SUCCESS(f"Added {created} address(es) to the pool."))
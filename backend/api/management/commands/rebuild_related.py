@@ -0,0 +1,12 @@
+# backend/api/management/commands/rebuild_related.py
+from django.core.management.base import BaseCommand
+
+from api.related import update_related
+
+
+class Command(BaseCommand):
+    help = "Recomputes the stored related projects/posts of every item from the shared-tag similarity."
+
+    def handle(self, *args, **options):
+        written = update_related()
+        self.stdout.write(self.style.SUCCESS(f"Updated related content on {written} item(s)."))
@@ -0,0 +1,24 @@
+# backend/api/management/commands/render_posts.py
+from django.core.management.base import BaseCommand
+
+from api.models import Post
+
+
+class Command(BaseCommand):
+    help = "Backfills the pre-rendered HTML, table of contents, excerpt and reading stats of blog posts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--missing-only', action='store_true',
+                            help="Only render posts that have no stored HTML yet.")
+
+    def handle(self, *args, **options):
+        posts = Post.objects.all()
+        if options['missing_only']:
+            posts = posts.filter(content_html='').exclude(content='')
+        rendered = 0
+        for post in posts.iterator():
+            post.render_content()
+            # update_fields keeps updated_date (and so Last-Modified) untouched.
+            post.save(update_fields=['content_html', 'toc', 'excerpt', 'word_count', 'reading_time'])
+            rendered += 1
+        self.stdout.write(self.style.SUCCESS(f"Rendered {rendered} post(s)."))
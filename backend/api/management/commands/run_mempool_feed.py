@@ -0,0 +1,27 @@
+# backend/api/management/commands/run_mempool_feed.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.mempool_feed import FEED_LEADER_TIMEOUT, MempoolFeed
+
+
+class Command(BaseCommand):
+    help = "Runs the mempool.space WebSocket feed in the foreground (e.g. as a Render background worker)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', help="Override MEMPOOL_WS_URL, e.g. ws://127.0.0.1:8765 for a local stub.")
+
+    def handle(self, *args, **options):
+        feed = MempoolFeed(url=options['url'])
+        self.stdout.write(f"Connecting to {feed.url}...")
+        try:
+            while True:
+                if feed.acquire_leadership():
+                    feed.run_forever()
+                else:
+                    # A web worker already holds the feed; take over if it goes away.
+                    time.sleep(FEED_LEADER_TIMEOUT / 2)
+        except KeyboardInterrupt:
+            feed.stop()
+            feed.release_leadership()
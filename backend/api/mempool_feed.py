@@ -0,0 +1,262 @@
+# backend/api/mempool_feed.py
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .content_version import bump_content_version
+
+logger = logging.getLogger('api')
+
+# The feed writes to the same key the snapshot endpoint reads, so GET
+# /api/mempool-stats/ serves live data for as long as the feed is connected.
+MEMPOOL_STATS_CACHE_KEY = "mempool_stats"
+LIVE_STATE_TIMEOUT = 300  # Keep live data around a little longer than the 60 s snapshot
+FEED_LEADER_KEY = "mempool_feed_leader"
+FEED_LEADER_TIMEOUT = 30
+RECONNECT_BACKOFF_MAX = 20  # Stay below FEED_LEADER_TIMEOUT so a reconnect loop keeps leadership
+
+# Leadership is a plain Redis key (not a Django cache entry, which the L1 tier
+# would copy into each worker) holding the leader's token. Renewing and
+# releasing compare the token and act in one script, so a worker whose lease
+# ran out can never extend or delete the lease another worker has since taken.
+#
+#   KEYS[1]  leader key
+#   ARGV[1]  token
+#   ARGV[2]  lease, ms (renew only)
+# Returns 1 if the caller held the lease, else 0.
+LEADER_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+LEADER_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_feed = None
+_feed_lock = threading.Lock()
+_redis = None
+_redis_lock = threading.Lock()
+# Serializes the in-process fallback (LocMem has no atomic compare-and-set).
+_local_lock = threading.Lock()
+
+def _leader_redis():
+    """(client, renew script, release script), or None when the cache isn't Redis (local development)."""
+    global _redis
+    if _redis is None:
+        with _redis_lock:
+            if _redis is None:
+                try:
+                    from django_redis import get_redis_connection
+                    client = get_redis_connection('default')
+                    _redis = (client, client.register_script(LEADER_RENEW_SCRIPT),
+                              client.register_script(LEADER_RELEASE_SCRIPT))
+                except (ImportError, NotImplementedError):
+                    _redis = False
+    return _redis or None
+
+# ==============================================================================
+# MESSAGE HANDLING
+# ==============================================================================
+
+def apply_message(state: dict, message: dict) -> bool:
+    """
+    Merges one mempool.space WebSocket message into `state` (which has the same
+    shape as the snapshot endpoint). Returns True if anything changed.
+    """
+    before = dict(state)
+    if 'blocks' in message and message['blocks']:
+        state['block_height'] = max(block['height'] for block in message['blocks'])
+    if 'block' in message:
+        state['block_height'] = max(state.get('block_height') or 0, message['block']['height'])
+    if 'fees' in message:
+        state['recommended_fees'] = message['fees']
+    if 'conversions' in message and 'USD' in message['conversions']:
+        state['price'] = message['conversions']['USD']
+    return state != before
+
+# ==============================================================================
+# UPSTREAM SUBSCRIPTION
+# ==============================================================================
+
+class MempoolFeed:
+    """
+    Holds the single upstream WebSocket subscription to mempool.space. Only one
+    process across all workers runs it at a time: leadership is a lease (a Redis
+    key, or the local cache in development) that the running feed keeps renewing.
+    """
+
+    def __init__(self, url=None):
+        self.url = url or settings.MEMPOOL_WS_URL
+        self.token = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self._stop = threading.Event()
+
+    # --- Leadership ---
+    def acquire_leadership(self) -> bool:
+        redis = _leader_redis()
+        if redis is not None:
+            client, _, _ = redis
+            return bool(client.set(FEED_LEADER_KEY, self.token, nx=True, px=FEED_LEADER_TIMEOUT * 1000))
+        with _local_lock:
+            return cache.add(FEED_LEADER_KEY, self.token, timeout=FEED_LEADER_TIMEOUT)
+
+    def is_leader(self) -> bool:
+        redis = _leader_redis()
+        if redis is not None:
+            client, _, _ = redis
+            return client.get(FEED_LEADER_KEY) == self.token.encode()
+        return cache.get(FEED_LEADER_KEY) == self.token
+
+    def renew_leadership(self) -> bool:
+        """Extends the lease if this feed still holds it. Returns whether it does."""
+        redis = _leader_redis()
+        if redis is not None:
+            _, renew, _ = redis
+            return bool(renew(keys=[FEED_LEADER_KEY], args=[self.token, FEED_LEADER_TIMEOUT * 1000]))
+        with _local_lock:
+            if cache.get(FEED_LEADER_KEY) != self.token:
+                return False
+            cache.set(FEED_LEADER_KEY, self.token, timeout=FEED_LEADER_TIMEOUT)
+            return True
+
+    def release_leadership(self):
+        redis = _leader_redis()
+        if redis is not None:
+            _, _, release = redis
+            release(keys=[FEED_LEADER_KEY], args=[self.token])
+            return
+        with _local_lock:
+            if cache.get(FEED_LEADER_KEY) == self.token:
+                cache.delete(FEED_LEADER_KEY)
+
+    # --- Lifecycle ---
+    def stop(self):
+        self._stop.set()
+
+    def initial_state(self) -> dict:
+        """Seeds the state from the cache, or from a REST snapshot (the WS feed has no hashrate)."""
+        state = cache.get(MEMPOOL_STATS_CACHE_KEY)
+        if state:
+            return dict(state)
+        from .views.mempool import fetch_mempool_data
+        return fetch_mempool_data() or {}
+
+    def publish(self, state: dict):
+        cache.set(MEMPOOL_STATS_CACHE_KEY, state, timeout=LIVE_STATE_TIMEOUT)
+        bump_content_version('mempool_stats')
+
+    def run_once(self, state: dict):
+        """Connects, subscribes and pumps messages until the socket drops or stop() is called."""
+        import websocket
+
+        ws = websocket.create_connection(self.url, timeout=FEED_LEADER_TIMEOUT / 3)
+        try:
+            ws.send(json.dumps({"action": "init"}))
+            ws.send(json.dumps({"action": "want", "data": ["blocks", "stats", "mempool-blocks"]}))
+            while not self._stop.is_set():
+                try:
+                    raw = ws.recv()
+                except websocket.WebSocketTimeoutException:
+                    # Quiet period: keep the connection and our leadership alive.
+                    ws.send(json.dumps({"action": "ping"}))
+                    if not self.renew_leadership():
+                        break
+                    continue
+                if not raw:
+                    break
+                message = json.loads(raw)
+                if apply_message(state, message):
+                    self.publish(state)
+                if not self.renew_leadership():
+                    break
+        finally:
+            ws.close()
+
+    def run_forever(self):
+        """
+        Keeps the upstream subscription alive, reconnecting with exponential
+        backoff. A clean close counts as a disconnect too, so an upstream that
+        keeps accepting and dropping the socket can't spin the loop; the
+        backoff only resets after a connection that stayed up for a while.
+        """
+        backoff = 1
+        state = self.initial_state()
+        if state:
+            self.publish(state)
+        try:
+            while not self._stop.is_set() and self.is_leader():
+                connected_at = time.monotonic()
+                try:
+                    self.run_once(state)
+                    reason = "closed by upstream"
+                except Exception as e:
+                    reason = f"disconnected: {e}"
+                if self._stop.is_set():
+                    break
+                if time.monotonic() - connected_at > RECONNECT_BACKOFF_MAX:
+                    backoff = 1
+                logger.warning("Mempool feed %s. Reconnecting in %ss.", reason, backoff)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, RECONNECT_BACKOFF_MAX)
+                if not self.renew_leadership():
+                    break
+        finally:
+            self.release_leadership()
+
+def ensure_feed_running():
+    """
+    Starts the upstream feed in a daemon thread of this worker if no other
+    process is already running it. Cheap to call on every stream request.
+    """
+    global _feed
+    if not settings.MEMPOOL_FEED_ENABLED:
+        return
+    with _feed_lock:
+        if _feed is not None and _feed.thread.is_alive():
+            return
+        feed = MempoolFeed()
+        if not feed.acquire_leadership():
+            return
+        feed.thread = threading.Thread(target=feed.run_forever, name="mempool-feed", daemon=True)
+        feed.thread.start()
+        _feed = feed
+
+# ==============================================================================
+# FAN-OUT TO BROWSERS (SERVER-SENT EVENTS)
+# ==============================================================================
+
+def mempool_event_stream(max_seconds=None, poll_interval=None):
+    """
+    Yields SSE frames whenever the cached state changes. Every client reads the
+    shared cache, so any number of browsers cost one upstream connection. The
+    stream ends after `max_seconds` so a sync worker is never held forever;
+    EventSource reconnects on its own.
+    """
+    max_seconds = max_seconds or settings.MEMPOOL_STREAM_MAX_SECONDS
+    poll_interval = poll_interval or settings.MEMPOOL_STREAM_POLL_SECONDS
+    deadline = time.monotonic() + max_seconds
+    last_sent = None
+    last_write = time.monotonic()
+
+    yield "retry: 3000\n\n"
+    while time.monotonic() < deadline:
+        state = cache.get(MEMPOOL_STATS_CACHE_KEY)
+        if state and state != last_sent:
+            yield f"data: {json.dumps(state)}\n\n"
+            last_sent = state
+            last_write = time.monotonic()
+        elif time.monotonic() - last_write > 15:
+            # Comment frame so proxies don't close an idle connection.
+            yield ": keep-alive\n\n"
+            last_write = time.monotonic()
+        time.sleep(poll_interval)
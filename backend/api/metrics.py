@@ -0,0 +1,128 @@
+# backend/api/metrics.py
+import os
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+
+from .profiling import record_span
+
+# Under gunicorn every worker is a separate process with its own counters.
+# With PROMETHEUS_MULTIPROC_DIR set (gunicorn.conf.py does it) each worker
+# writes its samples to files there and the scrape merges them, so
+# /api/metrics reports the totals of the whole server, whichever worker answers.
+MULTIPROCESS = bool(os.getenv('PROMETHEUS_MULTIPROC_DIR'))
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', "Time to produce a response, per route.",
+    ['method', 'route', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+CACHE_LOOKUPS = Counter(
+    'cache_lookups_total', "Cache lookups per key family.", ['family', 'result'],
+)
+UPSTREAM_LATENCY = Histogram(
+    'upstream_request_duration_seconds', "Duration of outbound calls, per upstream host.", ['host'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20),
+)
+UPSTREAM_ERRORS = Counter(
+    'upstream_request_errors_total', "Failed outbound calls, per upstream host.", ['host', 'reason'],
+)
+CHAT_ROUTES = Counter(
+    'chat_intent_routes_total', "Career chat questions per routed intent and how it was decided.", ['intent', 'method'],
+)
+LLM_FIRST_TOKEN = Histogram(
+    'llm_time_to_first_token_seconds', "Time from request to the first streamed LLM token.", ['model'],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 15),
+)
+LLM_STREAM_DURATION = Histogram(
+    'llm_stream_duration_seconds', "Total duration of a streamed LLM response.", ['model', 'outcome'],
+    buckets=(0.5, 1, 2, 4, 8, 15, 30, 60),
+)
+
+# ==============================================================================
+# INSTRUMENTATION HELPERS
+# ==============================================================================
+
+def record_cache_lookup(family: str, hit: bool):
+    CACHE_LOOKUPS.labels(family, 'hit' if hit else 'miss').inc()
+
+@contextmanager
+def observe_upstream(host: str):
+    """
+    Times an outbound call; an exception escaping the block counts as an
+    error. The call also shows up as a span in a staff-requested profile.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        UPSTREAM_ERRORS.labels(host, type(e).__name__).inc()
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        UPSTREAM_LATENCY.labels(host).observe(duration)
+        record_span('http', host, start, duration)
+
+_http_session = None
+
+def http_session():
+    """
+    This process's pooled requests.Session, so repeated calls to an upstream
+    reuse its keep-alive connection. Created per process: sockets must not be
+    shared with a forked worker.
+    """
+    global _http_session
+    if _http_session is None or _http_session[0] != os.getpid():
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _http_session = (os.getpid(), session)
+    return _http_session[1]
+
+def upstream_request(method: str, url: str, **kwargs):
+    """An HTTP call on the pooled session, with its duration and failures (including 4xx/5xx) recorded per host."""
+    host = urlsplit(url).hostname or 'unknown'
+    with observe_upstream(host):
+        response = http_session().request(method, url, **kwargs)
+    if response.status_code >= 400:
+        UPSTREAM_ERRORS.labels(host, f"http_{response.status_code // 100}xx").inc()
+    return response
+
+class LLMStreamTimer:
+    """Records time to first token and total duration of one streamed completion."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.start = time.perf_counter()
+        self.first_token_seen = False
+
+    def token(self):
+        if not self.first_token_seen:
+            self.first_token_seen = True
+            LLM_FIRST_TOKEN.labels(self.model).observe(time.perf_counter() - self.start)
+
+    def finish(self, outcome: str = 'ok'):
+        duration = time.perf_counter() - self.start
+        LLM_STREAM_DURATION.labels(self.model, outcome).observe(duration)
+        record_span('http', f"llm {self.model} ({outcome})", self.start, duration)
+
+# ==============================================================================
+# EXPOSITION
+# ==============================================================================
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus text exposition of every worker's metrics (or just this process's outside gunicorn)."""
+    if MULTIPROCESS:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
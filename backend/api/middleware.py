@@ -0,0 +1,130 @@
+# backend/api/middleware.py
+import logging
+import time
+
+from django.conf import settings
+from django.db import connection
+
+from . import profiling
+from .metrics import REQUEST_LATENCY
+
+logger = logging.getLogger('api.queries')
+
+
+class QueryStatsMiddleware:
+    """
+    Counts the SQL queries a request runs and the time spent in them, using a
+    connection execute wrapper (so it works with DEBUG off). The numbers are
+    logged at DEBUG for every API request (API_LOG_LEVEL=DEBUG shows them)
+    and, when QUERY_STATS_HEADER is on, returned in an `X-DB-Queries`
+    response header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = {'count': 0, 'time': 0.0}
+
+        def record(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                stats['count'] += 1
+                stats['time'] += time.perf_counter() - start
+
+        with connection.execute_wrapper(record):
+            response = self.get_response(request)
+
+        sql_ms = stats['time'] * 1000
+        if request.path.startswith('/api/'):
+            logger.debug("%s %s -> %s queries, %.1f ms SQL", request.method, request.path, stats['count'], sql_ms)
+        if settings.QUERY_STATS_HEADER:
+            response['X-DB-Queries'] = f"{stats['count']}; time={sql_ms:.1f}ms"
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Records every request's latency in the per-route histogram exposed at
+    /api/metrics. The route is the URL pattern that matched (never the raw
+    path), so label cardinality stays bounded. For streamed responses this is
+    the time until the response starts.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        match = getattr(request, 'resolver_match', None)
+        route = match.route if match else '<unmatched>'
+        REQUEST_LATENCY.labels(request.method, route, response.status_code).observe(time.perf_counter() - start)
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a single request when a staff user asks for it with an
+    `X-Profile: 1` header or `?_profile=1`: cProfile for the view plus every
+    SQL query and outbound HTTP call as a timed span. The result is stored as
+    a ProfileArtifact (downloadable as a .prof file from the admin) and the
+    response carries `X-Profile-Id`. Streamed responses are profiled until the
+    stream ends. Any other request costs one header and one query-string
+    lookup.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not profiling.wants_profile(request):
+            return self.get_response(request)
+        if not profiling.try_acquire():
+            response = self.get_response(request)
+            response['X-Profile'] = 'busy'  # Another request in this worker is being profiled
+            return response
+
+        session = profiling.ProfileSession()
+        try:
+            response = session.run(self.get_response, request)
+        except BaseException:
+            profiling.release()
+            raise
+
+        if response.streaming:
+            response.streaming_content = self._profile_stream(session, request, response, response.streaming_content)
+            response['X-Profile'] = 'saved when the stream ends'
+            return response
+        try:
+            artifact = self._save(session, request, response)
+        finally:
+            profiling.release()
+        if artifact is not None:
+            response['X-Profile-Id'] = str(artifact.pk)
+        return response
+
+    def _profile_stream(self, session, request, response, content):
+        iterator = iter(content)
+        try:
+            while True:
+                try:
+                    chunk = session.run(next, iterator)
+                except StopIteration:
+                    break
+                yield chunk
+        finally:
+            # Also runs when the client disconnects and the server closes the response.
+            try:
+                self._save(session, request, response)
+            finally:
+                profiling.release()
+
+    def _save(self, session, request, response):
+        try:
+            return session.save(request, response)
+        except Exception:
+            logger.exception("Error saving request profile for %s", request.path)
+            return None
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_contactsubmission'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BitcoinAddress',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveIntegerField(unique=True)),
+                ('address', models.CharField(max_length=100, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('assigned_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['index'],
+            },
+        ),
+    ]
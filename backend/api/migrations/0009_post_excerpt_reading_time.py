@@ -0,0 +1,67 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:18
+
+import math
+import re
+
+from django.db import migrations, models
+
+# Frozen copy of api/rendering.py as of this migration. Migrations must not
+# import application code: it changes (rendering now parses the Markdown
+# properly) and the backfill has to do what it did when it was written.
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 200
+
+_CODE_BLOCK_RE = re.compile(r"```.*?```|~~~.*?~~~", re.DOTALL)
+_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_MARKUP_RE = re.compile(r"^\s{0,3}(#{1,6}|>|[-*+]|\d+\.)\s+|[*_`~]+", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def markdown_to_plain_text(markdown):
+    text = _CODE_BLOCK_RE.sub(" ", markdown)
+    text = _IMAGE_RE.sub(r"\1", text)
+    text = _LINK_RE.sub(r"\1", text)
+    text = _MARKUP_RE.sub("", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def make_excerpt(plain_text, length=EXCERPT_LENGTH):
+    if len(plain_text) <= length:
+        return plain_text
+    return plain_text[:length].rsplit(" ", 1)[0].rstrip(".,;:") + "…"
+
+
+def reading_time_minutes(plain_text):
+    return max(1, math.ceil(len(plain_text.split()) / WORDS_PER_MINUTE))
+
+
+def backfill_excerpts(apps, schema_editor):
+    Post = apps.get_model("api", "Post")
+    db_alias = schema_editor.connection.alias
+    for post in Post.objects.using(db_alias).only('id', 'content'):
+        plain_text = markdown_to_plain_text(post.content)
+        post.excerpt = make_excerpt(plain_text)
+        post.reading_time = reading_time_minutes(plain_text)
+        post.save(update_fields=['excerpt', 'reading_time'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_bitcoinaddress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='reading_time',
+            field=models.PositiveSmallIntegerField(default=1, editable=False, help_text='Estimated minutes to read'),
+        ),
+        migrations.RunPython(backfill_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:48
+
+from django.db import migrations, models
+
+FULL_TEXT_INDEX = 'contact_fts_gin'
+
+def _full_text_index():
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    # Must stay identical to ContactSubmission.search_vector(), or searches won't use it.
+    return GinIndex(SearchVector('name', 'subject', 'message', config='english'), name=FULL_TEXT_INDEX)
+
+def add_full_text_index(apps, schema_editor):
+    # GIN / tsvector are PostgreSQL-only; SQLite (local development) just searches without it.
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('api', 'ContactSubmission'), _full_text_index())
+
+def remove_full_text_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('api', 'ContactSubmission'), _full_text_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_profileartifact'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactsubmission',
+            index=models.Index(fields=['-created_at'], name='contact_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactsubmission',
+            index=models.Index(fields=['email'], name='contact_email_idx'),
+        ),
+        migrations.RunPython(add_full_text_index, remove_full_text_index),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_contactsubmission_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='related',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='related',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_related_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='image_source',
+            field=models.URLField(blank=True, default='', editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_project_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['-date_issued'], name='cert_date_issued_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-published_date', '-id'], name='post_published_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workexperience',
+            index=models.Index(fields=['-start_date'], name='work_start_date_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bitcoinaddress',
+            name='used_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
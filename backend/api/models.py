@@ -1,6 +1,9 @@
 # backend/api/models.py
+from django.conf import settings
 from django.db import models
 from django.utils.text import slugify
+
+from .rendering import make_excerpt, reading_time_minutes, render_markdown
 # --- NEW TAG MODEL ---
 class Tag(models.Model):
     name = models.CharField(max_length=50, unique=True)
@@ -23,6 +26,9 @@ class WorkExperience(models.Model):
     
     class Meta:
         ordering = ['-start_date'] # Show newest jobs first
+        indexes = [
+            models.Index(fields=['-start_date'], name='work_start_date_idx'),
+        ]
 
     def __str__(self):
         return f"{self.job_title} at {self.company_name}"
@@ -33,6 +39,12 @@ class Certification(models.Model):
     credential_url = models.URLField(blank=True, null=True)
     date_issued = models.DateField()
 
+    class Meta:
+        indexes = [
+            # The certifications list is ordered newest first
+            models.Index(fields=['-date_issued'], name='cert_date_issued_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -43,7 +55,13 @@ class Project(models.Model):
     repository_url = models.URLField(blank=True, null=True)
     live_url = models.URLField(blank=True, null=True)
     image = models.URLField(max_length=500, blank=True, null=True)
+    # Resized WebP/AVIF copies of `image` (api.images): {format: {width: file name}},
+    # built from the URL in `image_source`; rebuilt when `image` changes.
+    image_source = models.URLField(max_length=500, blank=True, default='', editable=False)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     tags = models.ManyToManyField(Tag, blank=True, related_name="projects")
+    # Precomputed by api.related from shared tags: [{type, id, title, score} (+ slug for posts)]
+    related = models.JSONField(default=list, blank=True, editable=False)
     def __str__(self):
         return self.title
 
@@ -55,9 +73,23 @@ class Post(models.Model):
     updated_date = models.DateTimeField(auto_now=True)
     is_published = models.BooleanField(default=False)
     tags = models.ManyToManyField(Tag, blank=True, related_name="posts")
+    # Rendered once per edit (see `render_content`) so no client has to parse Markdown
+    content_html = models.TextField(blank=True, editable=False)
+    toc = models.JSONField(default=list, blank=True, editable=False, help_text="Table of contents: [{level, title, id}]")
+    excerpt = models.TextField(blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False, help_text="Estimated minutes to read")
+    # Precomputed by api.related from shared tags: [{type, id, title, score} (+ slug for posts)]
+    related = models.JSONField(default=list, blank=True, editable=False)
 
     class Meta:
         ordering = ['-published_date']
+        indexes = [
+            # The blog list and its cursor pagination: published posts by (published_date, id),
+            # newest first. Partial, so drafts don't take up space in it.
+            models.Index(fields=['-published_date', '-id'], condition=models.Q(is_published=True),
+                         name='post_published_date_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -66,8 +98,18 @@ class Post(models.Model):
         if not self.slug:
             from django.utils.text import slugify
             self.slug = slugify(self.title)
+        self.render_content()
         super().save(*args, **kwargs)
 
+    def render_content(self):
+        """Fills the pre-rendered HTML, table of contents, excerpt and reading stats from `content`."""
+        rendered = render_markdown(self.content)
+        self.content_html = rendered.html
+        self.toc = rendered.toc
+        self.excerpt = make_excerpt(rendered.plain_text)
+        self.word_count = rendered.word_count
+        self.reading_time = reading_time_minutes(rendered.plain_text)
+
 class ContactSubmission(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField()
@@ -75,8 +117,64 @@ class ContactSubmission(models.Model):
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # The admin's default ordering and its date filter
+            models.Index(fields=['-created_at'], name='contact_created_at_idx'),
+            models.Index(fields=['email'], name='contact_email_idx'),
+            # Plus, on PostgreSQL only, a GIN full-text index (migration 0012)
+        ]
+
+    def __str__(self):
+        return f"Message from {self.name} ({self.email}) re: {self.subject}"
+
+    @staticmethod
+    def search_vector():
+        """The expression behind the full-text index; queries must use it verbatim to hit the index."""
+        from django.contrib.postgres.search import SearchVector
+
+        return SearchVector('name', 'subject', 'message', config='english')
+
+class BitcoinAddress(models.Model):
+    """A receive address derived from the account xpub at m/84'/0'/0'/0/<index>."""
+    index = models.PositiveIntegerField(unique=True)
+    address = models.CharField(max_length=100, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    assigned_at = models.DateTimeField(blank=True, null=True)  # Last handed out (unpaid addresses are handed out again)
+    used_at = models.DateTimeField(blank=True, null=True)  # First seen with a transaction
+
+    class Meta:
+        ordering = ['index']
+
+    def __str__(self):
+        return f"#{self.index} {self.address}"
+
+class ProfileArtifact(models.Model):
+    """A cProfile dump plus SQL/HTTP spans of one staff-requested request (see ProfilingMiddleware)."""
+    created_at = models.DateTimeField(auto_now_add=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, blank=True, null=True, on_delete=models.SET_NULL, related_name='+')
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=500)
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField()
+    sql_count = models.PositiveIntegerField(default=0)
+    sql_ms = models.FloatField(default=0)
+    http_count = models.PositiveIntegerField(default=0)
+    http_ms = models.FloatField(default=0)
+    spans = models.JSONField(default=list, blank=True, help_text="[{kind, label, start_ms, duration_ms}]")
+    summary = models.TextField(blank=True)
+    # Kept in the database rather than MEDIA_ROOT: Render's disk doesn't survive a deploy.
+    stats = models.BinaryField(help_text="pstats dump; open with `python -m pstats` or snakeviz")
+
     class Meta:
         ordering = ['-created_at']
 
     def __str__(self):
-        return f"Message from {self.name} ({self.email}) re: {self.subject}"
\ No newline at end of file
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+    @classmethod
+    def prune(cls, keep: int):
+        """Deletes all but the newest `keep` profiles."""
+        stale = cls.objects.values_list('pk', flat=True)[keep:]
+        cls.objects.filter(pk__in=list(stale)).delete()
@@ -0,0 +1,48 @@
+# backend/api/pagination.py
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination
+
+
+class PostCursorPagination(CursorPagination):
+    """
+    Keyset pagination on (published_date, id): every page is an index range
+    scan, so page 500 of the blog costs the same as page 1.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-published_date', '-id')
+
+
+class ProjectCursorPagination(CursorPagination):
+    page_size = 24
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-id'
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin changelist paginator that doesn't run an exact COUNT(*) over a big
+    table on every page. On PostgreSQL it asks the planner how many rows the
+    (filtered, searched) queryset returns; only when that estimate is below
+    `exact_below` does it count exactly, so small results stay precise.
+    """
+    exact_below = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if connections[queryset.db].vendor == 'postgresql':
+            try:
+                plan = json.loads(queryset.order_by().explain(format='json'))
+                estimate = int(plan[0]['Plan']['Plan Rows'])
+            except (ValueError, KeyError, IndexError, TypeError):
+                estimate = 0
+            if estimate >= self.exact_below:
+                return estimate
+        return super().count
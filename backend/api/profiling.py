@@ -0,0 +1,127 @@
+# backend/api/profiling.py
+import cProfile
+import io
+import marshal
+import pstats
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connection
+
+# Spans kept per profile; the counts and totals still cover every query/call.
+MAX_SPANS = 500
+MAX_SQL_LENGTH = 500
+SUMMARY_FUNCTIONS = 40
+
+# The session of the request being profiled in this context, if any. Checked by
+# `record_span` on every outbound call, so it must stay a single cheap lookup.
+_current_session = ContextVar('profile_session', default=None)
+# cProfile hooks the whole interpreter (since Python 3.12 it sees every thread),
+# so only one request per process is profiled at a time.
+_profiling_lock = threading.Lock()
+
+# ==============================================================================
+# SPANS
+# ==============================================================================
+
+def record_span(kind: str, label: str, started: float, duration: float):
+    """Adds a span (perf_counter start, seconds) to the profile of the current request, if any."""
+    session = _current_session.get()
+    if session is not None:
+        session.add_span(kind, label, started, duration)
+
+# ==============================================================================
+# PROFILE SESSION
+# ==============================================================================
+
+class ProfileSession:
+    """cProfile plus SQL and outbound HTTP spans for one request (or one streamed response)."""
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.started = time.perf_counter()
+        self.spans = []
+        self.totals = {'sql': [0, 0.0], 'http': [0, 0.0]}
+
+    def add_span(self, kind, label, started, duration):
+        count_and_time = self.totals.setdefault(kind, [0, 0.0])
+        count_and_time[0] += 1
+        count_and_time[1] += duration
+        if len(self.spans) < MAX_SPANS:
+            self.spans.append({
+                'kind': kind, 'label': label,
+                'start_ms': round((started - self.started) * 1000, 2), 'duration_ms': round(duration * 1000, 2),
+            })
+
+    def _record_sql(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.add_span('sql', sql[:MAX_SQL_LENGTH], started, time.perf_counter() - started)
+
+    def run(self, func, *args):
+        """Calls `func(*args)` with the profiler, the SQL wrapper and the span context active."""
+        token = _current_session.set(self)
+        self.profiler.enable()
+        try:
+            with connection.execute_wrapper(self._record_sql):
+                return func(*args)
+        finally:
+            self.profiler.disable()
+            _current_session.reset(token)
+
+    def summary(self) -> str:
+        """Top functions by cumulative time, then the slowest spans."""
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats('cumulative').print_stats(SUMMARY_FUNCTIONS)
+        out.write("Slowest spans:\n")
+        for span in sorted(self.spans, key=lambda s: s['duration_ms'], reverse=True)[:20]:
+            out.write(f"  {span['duration_ms']:>9.2f} ms  @{span['start_ms']:>9.2f} ms  "
+                      f"{span['kind']:<5} {span['label'][:160]}\n")
+        return out.getvalue()
+
+    def save(self, request, response):
+        from .models import ProfileArtifact
+
+        self.profiler.create_stats()
+        # Before summary(): pstats.Stats() takes the stats out of the profiler.
+        stats = marshal.dumps(self.profiler.stats)
+        user = getattr(request, 'user', None)
+        artifact = ProfileArtifact.objects.create(
+            user=user if user is not None and user.is_authenticated else None,
+            method=request.method,
+            path=request.get_full_path()[:500],
+            status_code=response.status_code,
+            duration_ms=(time.perf_counter() - self.started) * 1000,
+            sql_count=self.totals['sql'][0],
+            sql_ms=self.totals['sql'][1] * 1000,
+            http_count=self.totals['http'][0],
+            http_ms=self.totals['http'][1] * 1000,
+            spans=self.spans,
+            summary=self.summary(),
+            stats=stats,
+        )
+        ProfileArtifact.prune(settings.PROFILE_ARTIFACT_LIMIT)
+        return artifact
+
+# ==============================================================================
+# TRIGGER
+# ==============================================================================
+
+def wants_profile(request) -> bool:
+    """Staff asked for a profile with `X-Profile: 1` or `?_profile=1`."""
+    if not settings.PROFILING_ENABLED:
+        return False
+    if request.headers.get('X-Profile') != '1' and request.GET.get('_profile') != '1':
+        return False
+    user = getattr(request, 'user', None)
+    return user is not None and user.is_staff
+
+def try_acquire() -> bool:
+    return _profiling_lock.acquire(blocking=False)
+
+def release():
+    _profiling_lock.release()
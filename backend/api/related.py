@@ -0,0 +1,173 @@
+# backend/api/related.py
+import logging
+import threading
+
+from django.db import transaction
+
+from .content_version import bump_content_version
+from .models import Post, Project
+
+logger = logging.getLogger('api')
+
+# Neighbours stored per item, and the least similarity worth showing.
+TOP_K = 4
+MIN_SCORE = 0.05
+# Rows of the similarity matrix materialised at once (ROW_CHUNK x items floats).
+ROW_CHUNK = 512
+
+# ==============================================================================
+# INCIDENCE MATRIX
+# ==============================================================================
+
+def _load_items():
+    """
+    Every recommendable item with its tag ids: projects, then published posts.
+    Returns ([(kind, values row)], [set of tag ids]), index-aligned.
+    """
+    items, tag_sets = [], []
+    sources = (
+        ('project', Project, Project.objects.values('id', 'title')),
+        ('post', Post, Post.objects.filter(is_published=True).values('id', 'title', 'slug')),
+    )
+    for kind, model, rows in sources:
+        rows = list(rows)
+        tags = {row['id']: set() for row in rows}
+        owner = model._meta.get_field('tags').m2m_field_name()
+        for owner_id, tag_id in model.tags.through.objects.filter(**{f"{owner}_id__in": list(tags)}).values_list(f"{owner}_id", 'tag_id'):
+            tags[owner_id].add(tag_id)
+        for row in rows:
+            items.append((kind, row))
+            tag_sets.append(tags[row['id']])
+    return items, tag_sets
+
+def _weighted_matrix(tag_sets):
+    """
+    Sparse items x tags matrix with IDF weights (a tag on every item says
+    little, a rare shared tag a lot), rows L2-normalised so a row product is
+    the cosine similarity.
+    """
+    import numpy as np
+    from scipy import sparse
+
+    tag_ids = sorted({tag for tags in tag_sets for tag in tags})
+    column = {tag: i for i, tag in enumerate(tag_ids)}
+    rows = np.repeat(np.arange(len(tag_sets)), [len(tags) for tags in tag_sets])
+    cols = np.fromiter((column[tag] for tags in tag_sets for tag in tags), dtype=np.int64, count=len(rows))
+    matrix = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(tag_sets), len(tag_ids)))
+
+    document_frequency = np.asarray(matrix.sum(axis=0)).ravel()
+    idf = np.log((1 + len(tag_sets)) / (1 + document_frequency)) + 1
+    matrix = matrix @ sparse.diags(idf)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms) @ matrix
+
+def _neighbours(matrix, rows):
+    """{row: [(other row, score)]}: top-k cosine neighbours of `rows`, one sparse product per chunk."""
+    import numpy as np
+
+    result = {}
+    rows = np.asarray(sorted(rows), dtype=np.int64)
+    for start in range(0, len(rows), ROW_CHUNK):
+        chunk = rows[start:start + ROW_CHUNK]
+        scores = (matrix[chunk] @ matrix.T).toarray()
+        scores[np.arange(len(chunk)), chunk] = 0  # Never related to itself
+        k = min(TOP_K, scores.shape[1] - 1)
+        if k <= 0:
+            result.update({row: [] for row in chunk})
+            continue
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for i, row in enumerate(chunk):
+            ranked = sorted(top[i], key=lambda j: (-scores[i, j], j))
+            result[int(row)] = [(int(j), float(scores[i, j])) for j in ranked if scores[i, j] >= MIN_SCORE]
+    return result
+
+def _entry(item, score):
+    kind, row = item
+    entry = {'type': kind, 'id': row['id'], 'title': row['title'], 'score': round(score, 4)}
+    if kind == 'post':
+        entry['slug'] = row['slug']
+    return entry
+
+# ==============================================================================
+# RECOMPUTE
+# ==============================================================================
+
+def update_related(changed=None) -> int:
+    """
+    Recomputes the stored `related` lists. With `changed` (a set of
+    (kind, id)), only the rows that can be affected are recomputed: the
+    changed items, every item sharing a tag with them, and every item whose
+    current list points at them. Without it, everything is. Returns the
+    number of rows written.
+    """
+    items, tag_sets = _load_items()
+    index = {(kind, row['id']): i for i, (kind, row) in enumerate(items)}
+    current = {
+        **{('project', pk): related for pk, related in Project.objects.values_list('id', 'related')},
+        **{('post', pk): related for pk, related in Post.objects.values_list('id', 'related')},
+    }
+
+    if changed is None:
+        affected = set(range(len(items)))
+    else:
+        changed = set(changed)
+        changed_tags = set().union(*(tag_sets[index[key]] for key in changed if key in index))
+        affected = {index[key] for key in changed if key in index}
+        affected |= {i for i, tags in enumerate(tag_sets) if tags & changed_tags}
+        affected |= {
+            index[key] for key, related in current.items()
+            if key in index and any((entry['type'], entry['id']) in changed for entry in related or [])
+        }
+
+    new = {key: [] for key in current if key not in index}  # Unpublished/removed from the pool
+    new.update({(items[row][0], items[row][1]['id']): [] for row in affected})
+    if affected and any(tag_sets):
+        matrix = _weighted_matrix(tag_sets)
+        for row, neighbours in _neighbours(matrix, affected).items():
+            kind, values = items[row]
+            new[(kind, values['id'])] = [_entry(items[j], score) for j, score in neighbours]
+
+    updates = {'project': [], 'post': []}
+    for (kind, pk), related in new.items():
+        if current.get((kind, pk)) != related:
+            model = Project if kind == 'project' else Post
+            updates[kind].append(model(pk=pk, related=related))
+    for kind, objects in updates.items():
+        if objects:
+            (Project if kind == 'project' else Post).objects.bulk_update(objects, ['related'], batch_size=500)
+    written = len(updates['project']) + len(updates['post'])
+    if written:
+        # bulk_update sends no signals; invalidate the detail responses ourselves.
+        bump_content_version(*[kind for kind, objects in updates.items() if objects])
+    return written
+
+# ==============================================================================
+# SCHEDULING (SIGNALS)
+# ==============================================================================
+
+# Changes waiting for a commit, per thread. Every scheduled callback drains
+# the whole set, so a bulk edit or delete of N items in one transaction costs
+# one recompute, not N (the later callbacks find nothing left to do).
+_pending = threading.local()
+
+def schedule_related_update(kind=None, pk=None):
+    """
+    Recomputes the neighbourhood of a changed item (kind=None: everything)
+    once the current transaction commits. Leftovers of a rolled-back
+    transaction are recomputed with the next commit, which writes nothing
+    if they didn't change.
+    """
+    if not hasattr(_pending, 'changed'):
+        _pending.changed = set()
+    _pending.changed.add(None if kind is None else (kind, pk))
+    transaction.on_commit(_run_update)
+
+def _run_update():
+    changed, _pending.changed = getattr(_pending, 'changed', set()), set()
+    if not changed:
+        return
+    try:
+        update_related(None if None in changed else changed)
+    except Exception:
+        logger.exception("Error updating related content")
@@ -0,0 +1,83 @@
+# backend/api/rendering.py
+import math
+import re
+from dataclasses import dataclass, field
+
+from django.utils.text import slugify
+from markdown_it import MarkdownIt
+
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 200
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Raw HTML in posts is escaped rather than passed through, and markdown-it's
+# link validation already drops javascript:/vbscript:/file: URLs, so the
+# stored HTML is safe to inject into the page as-is.
+_markdown = MarkdownIt('commonmark', {'html': False, 'linkify': False, 'typographer': False}).enable(
+    ['table', 'strikethrough']
+)
+
+
+@dataclass
+class RenderedMarkdown:
+    html: str
+    plain_text: str
+    toc: list = field(default_factory=list)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.plain_text.split())
+
+
+def _inline_text(token) -> str:
+    parts = []
+    for child in token.children or ():
+        if child.type in ('text', 'code_inline'):
+            parts.append(child.content)
+        elif child.type in ('softbreak', 'hardbreak'):
+            parts.append(" ")
+    return "".join(parts)
+
+
+def render_markdown(markdown: str) -> RenderedMarkdown:
+    """
+    Renders Markdown to sanitized HTML in one pass, giving every heading a
+    stable id and collecting the table of contents and the plain text
+    (used for the excerpt and word count) from the same token stream.
+    """
+    tokens = _markdown.parse(markdown or "")
+    toc, used_ids, text_parts = [], set(), []
+
+    for index, token in enumerate(tokens):
+        if token.type == 'heading_open':
+            title = _inline_text(tokens[index + 1])
+            base_id = slugify(title) or "section"
+            heading_id, suffix = base_id, 2
+            while heading_id in used_ids:
+                heading_id, suffix = f"{base_id}-{suffix}", suffix + 1
+            used_ids.add(heading_id)
+            token.attrSet('id', heading_id)
+            toc.append({'level': int(token.tag[1]), 'title': title, 'id': heading_id})
+        elif token.type == 'inline':
+            text_parts.append(_inline_text(token))
+
+    html = _markdown.renderer.render(tokens, _markdown.options, {})
+    plain_text = _WHITESPACE_RE.sub(" ", " ".join(text_parts)).strip()
+    return RenderedMarkdown(html=html, plain_text=plain_text, toc=toc)
+
+
+def markdown_to_plain_text(markdown: str) -> str:
+    """Readable prose from Markdown: no syntax, no code blocks."""
+    return render_markdown(markdown).plain_text
+
+
+def make_excerpt(plain_text: str, length: int = EXCERPT_LENGTH) -> str:
+    """Cuts plain text at a word boundary, adding an ellipsis if anything was dropped."""
+    if len(plain_text) <= length:
+        return plain_text
+    return plain_text[:length].rsplit(" ", 1)[0].rstrip(".,;:") + "…"
+
+
+def reading_time_minutes(plain_text: str) -> int:
+    return max(1, math.ceil(len(plain_text.split()) / WORDS_PER_MINUTE))
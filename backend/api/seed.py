@@ -0,0 +1,37 @@
+# backend/api/seed.py
+from datetime import date
+
+from .models import Certification, Post, Project, Tag, WorkExperience
+
+# Synthetic content for the query budget and plan tests, the EXPLAIN check
+# and the benchmarks. Always seeded inside a transaction that is rolled back
+# (raise Rollback), never into a real database.
+TAGS_PER_ITEM = 3
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(rows):
+    """Creates `rows` projects, posts, certifications and jobs, each project/post with a few tags."""
+    tags = Tag.objects.bulk_create([Tag(name=f"Budget Tag {i}", slug=f"budget-tag-{i}") for i in range(5)])
+    projects = Project.objects.bulk_create(
+        [Project(title=f"Budget project {i}", description="Seeded for query budgets") for i in range(rows)]
+    )
+    posts = Post.objects.bulk_create(
+        [Post(title=f"Budget post {i}", slug=f"budget-post-{i}", content="Seeded.", is_published=True) for i in range(rows)]
+    )
+    Project.tags.through.objects.bulk_create(
+        [Project.tags.through(project_id=p.id, tag_id=t.id) for p in projects for t in tags[:TAGS_PER_ITEM]]
+    )
+    Post.tags.through.objects.bulk_create(
+        [Post.tags.through(post_id=p.id, tag_id=t.id) for p in posts for t in tags[:TAGS_PER_ITEM]]
+    )
+    Certification.objects.bulk_create(
+        [Certification(name=f"Budget cert {i}", date_issued=date(2024, 1, 1)) for i in range(rows)]
+    )
+    WorkExperience.objects.bulk_create(
+        [WorkExperience(company_name="Budget Co", job_title=f"Role {i}", start_date=date(2020, 1, 1),
+                        responsibilities="Seeded.") for i in range(rows)]
+    )
@@ -1,4 +1,6 @@
 # backend/api/serializers.py
+from django.conf import settings
+from django.urls import reverse
 from rest_framework import serializers
 from .models import ContactSubmission, Project, Certification, Post, WorkExperience, Tag
 
@@ -12,12 +14,44 @@ class WorkExperienceSerializer(serializers.ModelSerializer):
         model = WorkExperience
         fields = '__all__'
 
+class ImageVariantsField(serializers.Field):
+    """
+    Project.image_variants as absolute URLs, smallest first:
+    {"avif": [{"width": 320, "url": ...}, ...], "webp": [...]}.
+    """
+    _url_prefix = None
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    @classmethod
+    def url_prefix(cls):
+        if cls._url_prefix is None:
+            path = reverse('project-image', args=['name'])
+            cls._url_prefix = settings.IMAGE_BASE_URL.rstrip('/') + path[:-len('name')]
+        return cls._url_prefix
+
+    def to_representation(self, value):
+        prefix = self.url_prefix()
+        return {
+            name: [{'width': int(width), 'url': prefix + file_name}
+                   for width, file_name in sorted(widths.items(), key=lambda item: int(item[0]))]
+            for name, widths in value.items()
+        }
+
 class ProjectSerializer(serializers.ModelSerializer):
         # This will include the full tag object (name and slug) in the project data.
     tags = TagSerializer(many=True, read_only=True)
+    image_variants = ImageVariantsField()
     class Meta:
         model = Project
-        fields = '__all__'
+        exclude = ['related', 'image_source']
+
+class ProjectDetailSerializer(ProjectSerializer):
+    """Adds the precomputed related projects and posts (see api/related.py)."""
+    class Meta(ProjectSerializer.Meta):
+        exclude = ['image_source']
 
 class CertificationSerializer(serializers.ModelSerializer):
     class Meta:
@@ -29,10 +63,86 @@ class PostSerializer(serializers.ModelSerializer):
     tags = TagSerializer(many=True, read_only=True)
     class Meta:
         model = Post
-        fields = '__all__'
+        # The Markdown source is rendered on save and pages show the stored HTML and TOC;
+        # `content` stays in the detail for API clients that render the Markdown themselves.
+        fields = ['id', 'tags', 'title', 'slug', 'content', 'content_html', 'toc', 'excerpt', 'word_count',
+                  'reading_time', 'published_date', 'updated_date', 'is_published', 'related']
         lookup_field = 'slug'
 
+class PostListSerializer(serializers.ModelSerializer):
+    """Slim representation for the blog index: no Markdown body, just what a card needs."""
+    tags = TagSerializer(many=True, read_only=True)
+    class Meta:
+        model = Post
+        fields = ['id', 'title', 'slug', 'excerpt', 'reading_time', 'published_date', 'updated_date', 'tags']
+
 class ContactSubmissionSerializer(serializers.ModelSerializer):
     class Meta:
         model = ContactSubmission
-        fields = ['name', 'email', 'subject', 'message'] # Only these fields are needed from the user
\ No newline at end of file
+        fields = ['name', 'email', 'subject', 'message'] # Only these fields are needed from the user
+
+# ==============================================================================
+# FAST READ PATH
+# ==============================================================================
+# Fields whose to_representation() returns database values unchanged.
+_PASSTHROUGH_FIELDS = (serializers.CharField, serializers.IntegerField, serializers.BooleanField, serializers.JSONField)
+
+def _converter(field):
+    return None if isinstance(field, _PASSTHROUGH_FIELDS) else field.to_representation
+
+class ValuesRepresentation:
+    """
+    Produces exactly what `serializer_class(..., many=True).data` would, but
+    from `.values()` rows instead of model instances: field introspection runs
+    once per serializer class, only fields that need formatting (dates) are
+    converted, and nested many-to-many serializers (tags) are filled from a
+    single query on the through table instead of one object per related row.
+    """
+
+    def __init__(self, serializer_class):
+        model = serializer_class.Meta.model
+        self.fields = []   # (name, source, converter) in serializer order
+        self.nested = {}   # name -> (m2m field, [(name, source, converter)] of the child serializer)
+        for name, field in serializer_class().fields.items():
+            if isinstance(field, serializers.ListSerializer):
+                child = [(child_name, f.source, _converter(f)) for child_name, f in field.child.fields.items()]
+                self.nested[name] = (model._meta.get_field(field.source), child)
+                self.fields.append((name, None, None))
+            else:
+                self.fields.append((name, field.source, _converter(field)))
+
+    @property
+    def value_fields(self):
+        columns = [source for _, source, _ in self.fields if source is not None]
+        return columns if 'id' in columns else ['id', *columns]
+
+    def _nested_values(self, m2m_field, child, ids):
+        through = m2m_field.remote_field.through
+        owner, target = m2m_field.m2m_field_name(), m2m_field.m2m_reverse_field_name()
+        related = {pk: [] for pk in ids}
+        # By target id: the order of facets.prefetch_tags(), which the serializer path uses.
+        rows = (through.objects.filter(**{f"{owner}_id__in": ids}).order_by(f"{target}_id")
+                .values_list(f"{owner}_id", *[f"{target}__{source}" for _, source, _ in child]))
+        for owner_id, *values in rows:
+            related[owner_id].append({
+                name: convert(value) if convert and value is not None else value
+                for (name, _, convert), value in zip(child, values)
+            })
+        return related
+
+    def represent(self, rows):
+        """Turns `.values(*self.value_fields)` rows into serializer-shaped dicts."""
+        rows = list(rows)
+        nested = {name: self._nested_values(m2m_field, child, [row['id'] for row in rows])
+                  for name, (m2m_field, child) in self.nested.items()} if rows else {}
+        data = []
+        for row in rows:
+            item = {}
+            for name, source, convert in self.fields:
+                if source is None:
+                    item[name] = nested[name][row['id']]
+                else:
+                    value = row[source]
+                    item[name] = convert(value) if convert and value is not None else value
+            data.append(item)
+        return data
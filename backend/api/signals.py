@@ -0,0 +1,71 @@
+# backend/api/signals.py
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .content_version import bump_content_version
+from .models import Certification, Post, Project, Tag, WorkExperience
+
+# Which content versions change when a model changes. Tags are nested in the
+# project and post representations, so renaming a tag invalidates those too.
+CONTENT_DEPENDENCIES = {
+    Project: ('project',),
+    Post: ('post',),
+    Certification: ('certification',),
+    WorkExperience: ('workexperience',),
+    Tag: ('tag', 'project', 'post'),
+}
+
+
+# Models whose rows take part in the related-content recommendations.
+RELATED_KINDS = {Project: 'project', Post: 'post'}
+
+
+def _schedule_snapshot_export():
+    # Re-export the static API snapshot once the admin's transaction has committed.
+    if settings.API_SNAPSHOT_AUTO_EXPORT:
+        from .snapshot import schedule_snapshot_export
+        transaction.on_commit(schedule_snapshot_export)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_version_on_content_change(sender, instance, **kwargs):
+    names = CONTENT_DEPENDENCIES.get(sender)
+    if not names:
+        return
+    # A saved post carries its own modification time; deletes happen "now".
+    last_modified = getattr(instance, 'updated_date', None) if kwargs.get('signal') is post_save else None
+    bump_content_version(*names, last_modified=last_modified)
+    _schedule_snapshot_export()
+    _schedule_related_update(sender, instance, deleted=kwargs.get('signal') is post_delete)
+    if sender is Project and kwargs.get('signal') is post_save and not kwargs.get('raw'):
+        from .images import schedule_project_image_update
+        schedule_project_image_update(instance)
+
+
+def _schedule_related_update(sender, instance, deleted=False):
+    from .related import schedule_related_update
+
+    if sender in RELATED_KINDS:
+        schedule_related_update(RELATED_KINDS[sender], instance.pk)
+    elif sender is Tag and deleted:
+        # Deleting a tag drops its through rows without any m2m_changed signal.
+        schedule_related_update()
+
+
+@receiver(m2m_changed, sender=Project.tags.through)
+def bump_version_on_project_tags_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_content_version('project')
+        _schedule_snapshot_export()
+        _schedule_related_update(Project, kwargs['instance'])
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def bump_version_on_post_tags_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_content_version('post')
+        _schedule_snapshot_export()
+        _schedule_related_update(Post, kwargs['instance'])
@@ -0,0 +1,171 @@
+# backend/api/snapshot.py
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .background import closes_db_connection
+from .compression import compress, get_brotli
+from .renderers import FastJSONRenderer
+
+logger = logging.getLogger('api')
+
+# Snapshot files live under API_SNAPSHOT_ROOT and are named
+# <name>.<content hash>.json, so the CDN and browsers can cache them forever.
+# manifest.json is the only unhashed file: it maps each API path to its
+# current snapshot URL. All of them are served by /api/snapshot/ (see
+# views/snapshot.py) rather than as static files, because WhiteNoise only
+# indexes STATIC_ROOT at startup and would miss re-exports after admin saves.
+SNAPSHOT_URL = "/api/snapshot/"
+MANIFEST_NAME = "manifest.json"
+ENCODING_EXTENSIONS = {'gzip': '.gz', 'br': '.br'}
+HASH_LENGTH = 12
+# Admin edits usually come in bursts (save, then tags, then another save);
+# wait this long after the last one before re-exporting.
+AUTO_EXPORT_DELAY_SECONDS = 5
+
+_renderer = FastJSONRenderer()
+_export_lock = threading.Lock()
+_pending_export = None
+_pending_export_lock = threading.Lock()
+
+# ==============================================================================
+# RENDERING
+# ==============================================================================
+
+def _render(data) -> bytes:
+    # Same renderer as the live API, so the files are byte-identical to its JSON responses.
+    return _renderer.render(data)
+
+def _render_list(viewset_class, serializer_class=None) -> bytes:
+    serializer_class = serializer_class or viewset_class.serializer_class
+    data = serializer_class(viewset_class.queryset.all(), many=True).data
+    if viewset_class.pagination_class is None:
+        return _render(data)
+    # A single, complete page in the shape of the cursor-paginated endpoints.
+    return _render(OrderedDict([('next', None), ('previous', None), ('results', data)]))
+
+def build_snapshot() -> dict[str, bytes]:
+    """Returns {API path: JSON bytes} for every read-only content endpoint."""
+    # Imported here: api.views serves the exported files and imports this module.
+    from .serializers import PostListSerializer
+    from .views.content import CertificationViewSet, PostViewSet, ProjectViewSet, TagViewSet, WorkExperienceViewSet
+
+    responses = {
+        '/api/projects/': _render_list(ProjectViewSet),
+        '/api/posts/': _render_list(PostViewSet, PostListSerializer),
+        '/api/certifications/': _render_list(CertificationViewSet),
+        '/api/work-experience/': _render_list(WorkExperienceViewSet),
+        '/api/tags/': _render_list(TagViewSet),
+    }
+    for post in PostViewSet.queryset.all():
+        responses[f'/api/posts/{post.slug}/'] = _render(PostViewSet.serializer_class(post).data)
+    return responses
+
+# ==============================================================================
+# WRITING
+# ==============================================================================
+
+def _write_atomic(path: str, content: bytes):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def _write_compressed(path: str, content: bytes) -> list[str]:
+    """Writes the file plus the .gz/.br siblings the snapshot view serves as stored."""
+    _write_atomic(path, content)
+    written = [path]
+    for encoding, compressed in compress(content).items():
+        if compressed is not None:
+            _write_atomic(path + ENCODING_EXTENSIONS[encoding], compressed)
+            written.append(path + ENCODING_EXTENSIONS[encoding])
+    return written
+
+def _snapshot_file_name(api_path: str, content: bytes) -> str:
+    # /api/posts/my-post/ -> posts/my-post.<hash>.json
+    name = api_path.removeprefix('/api/').strip('/')
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    return f"{name}.{digest}.json"
+
+def _read_manifest(output_dir: str) -> dict:
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'rb') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def export_snapshot(output_dir: str | None = None, prune: bool = True) -> dict:
+    """
+    Writes every content endpoint to pre-compressed, content-hashed JSON files
+    and then swaps in the new manifest. Files referenced by neither the new nor
+    the previous manifest are removed, so clients still holding the previous
+    manifest keep working. Returns a summary of what was written.
+    """
+    output_dir = output_dir or settings.API_SNAPSHOT_ROOT
+    with _export_lock:
+        previous = _read_manifest(output_dir)
+        manifest, written = {}, 0
+        for api_path, content in build_snapshot().items():
+            file_name = _snapshot_file_name(api_path, content)
+            path = os.path.join(output_dir, file_name)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                _write_compressed(path, content)
+                written += 1
+            manifest[api_path] = f"{SNAPSHOT_URL}{file_name}"
+
+        os.makedirs(output_dir, exist_ok=True)
+        _write_compressed(os.path.join(output_dir, MANIFEST_NAME), _render(manifest))
+
+        removed = _prune(output_dir, manifest, previous) if prune else 0
+    return {'endpoints': len(manifest), 'written': written, 'removed': removed, 'brotli': get_brotli() is not None}
+
+def _prune(output_dir: str, manifest: dict, previous: dict) -> int:
+    keep = {url.removeprefix(SNAPSHOT_URL) for url in (*manifest.values(), *previous.values())}
+    keep.add(MANIFEST_NAME)
+    removed = 0
+    for root, _, files in os.walk(output_dir):
+        for file_name in files:
+            path = os.path.join(root, file_name)
+            relative = os.path.relpath(path, output_dir).replace(os.sep, '/')
+            if relative.removesuffix('.gz').removesuffix('.br') not in keep:
+                os.remove(path)
+                removed += 1
+    return removed
+
+# ==============================================================================
+# AUTO EXPORT (ADMIN SAVES)
+# ==============================================================================
+
+@closes_db_connection
+def _export_worker():
+    global _pending_export
+    with _pending_export_lock:
+        _pending_export = None
+    try:
+        summary = export_snapshot()
+        logger.info("Re-exported API snapshot (%d new file(s)).", summary['written'])
+    except Exception:
+        logger.exception("Error exporting API snapshot")
+
+def schedule_snapshot_export():
+    """
+    Re-exports the snapshot shortly after content changes, when
+    API_SNAPSHOT_AUTO_EXPORT is on. Repeated calls within the delay collapse
+    into a single export.
+    """
+    global _pending_export
+    if not settings.API_SNAPSHOT_AUTO_EXPORT:
+        return
+    with _pending_export_lock:
+        if _pending_export is not None:
+            _pending_export.cancel()
+        _pending_export = threading.Timer(AUTO_EXPORT_DELAY_SECONDS, _export_worker)
+        _pending_export.name = "api-snapshot-export"
+        _pending_export.daemon = True
+        _pending_export.start()
@@ -0,0 +1,92 @@
+# backend/api/tests/test_admin.py
+import csv
+import io
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.test import TestCase, override_settings
+
+from api.models import ContactSubmission
+from api.pagination import EstimatedCountPaginator
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class ContactExportTests(TestCase):
+    URL = '/admin/api/contactsubmission/'
+
+    def setUp(self):
+        admin = get_user_model().objects.create_user('admin', password='x', is_staff=True, is_superuser=True)
+        self.client.force_login(admin)
+        self.formula = ContactSubmission.objects.create(
+            name="=HYPERLINK(\"http://evil\")", email="a@example.com", subject="+1 offer", message="-2+3\nsecond line")
+        self.plain = ContactSubmission.objects.create(
+            name="Ada", email="ada@example.com", subject="Hi, \"there\"", message="Plain; text")
+
+    def export(self, action, submissions):
+        response = self.client.post(self.URL, {
+            'action': action, '_selected_action': [submission.pk for submission in submissions],
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn(f'.{action.removeprefix("export_")}"', response['Content-Disposition'])
+        return b''.join(response.streaming_content).decode()
+
+    def test_csv_escapes_formula_cells(self):
+        rows = {int(row['id']): row for row in csv.DictReader(io.StringIO(self.export('export_csv', [self.formula])))}
+        row = rows[self.formula.pk]
+        self.assertEqual(row['name'], "'=HYPERLINK(\"http://evil\")")
+        self.assertEqual(row['subject'], "'+1 offer")
+        self.assertEqual(row['message'], "'-2+3\nsecond line")
+        self.assertEqual(row['email'], "a@example.com")
+
+    def test_csv_keeps_ordinary_cells(self):
+        content = self.export('export_csv', [self.formula, self.plain])
+        reader = csv.reader(io.StringIO(content))
+        self.assertEqual(next(reader), ['id', 'created_at', 'name', 'email', 'subject', 'message'])
+        rows = {int(row[0]): row for row in reader}
+        self.assertEqual(set(rows), {self.formula.pk, self.plain.pk})
+        self.assertEqual(rows[self.plain.pk][2:], ["Ada", "ada@example.com", "Hi, \"there\"", "Plain; text"])
+
+    def test_jsonl_exports_the_raw_values(self):
+        lines = self.export('export_jsonl', [self.formula]).splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['name'], self.formula.name)
+
+    def test_changelist_and_search(self):
+        response = self.client.get(self.URL, {'q': 'ada'})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "ada@example.com")
+        self.assertNotContains(response, ">a@example.com<")
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        for i in range(3):
+            ContactSubmission.objects.create(name=f"Person {i}", email=f"p{i}@example.com", subject="Hi", message="x")
+
+    def paginator(self):
+        return EstimatedCountPaginator(ContactSubmission.objects.all(), 2)
+
+    def on_postgresql(self, plan_rows):
+        plan = json.dumps([{'Plan': {'Plan Rows': plan_rows}}])
+        return (
+            mock.patch('api.pagination.connections', {'default': mock.Mock(vendor='postgresql')}),
+            mock.patch.object(QuerySet, 'explain', return_value=plan),
+        )
+
+    def test_exact_count_off_postgresql(self):
+        paginator = self.paginator()
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(paginator.num_pages, 2)
+
+    def test_large_estimate_skips_the_count(self):
+        connections, explain = self.on_postgresql(250000)
+        with connections, explain, self.assertNumQueries(0):
+            self.assertEqual(self.paginator().count, 250000)
+
+    def test_small_estimate_counts_exactly(self):
+        connections, explain = self.on_postgresql(40)
+        with connections, explain, self.assertNumQueries(1):
+            self.assertEqual(self.paginator().count, 3)
@@ -0,0 +1,75 @@
+# backend/api/tests/test_bitcoin.py
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from api import bitcoin
+from api.bitcoin import GAP_LIMIT, account_key_from_mnemonic, assign_address, check_address_usage, fill_address_pool
+from api.models import BitcoinAddress
+
+# BIP84 test vector: m/84'/0'/0'/0/0 of this mnemonic.
+MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+FIRST_ADDRESS = "bc1qcr8te4kr609gcawutmrza0j4xv80jy8z306fyu"
+
+
+def address_stats(tx_count):
+    stats = {'funded_txo_count': tx_count, 'spent_txo_count': 0, 'tx_count': tx_count}
+    return mock.Mock(status_code=200, json=lambda: {'chain_stats': stats, 'mempool_stats': dict(stats, tx_count=0)})
+
+
+class AddressPoolTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.xpub = account_key_from_mnemonic(MNEMONIC).wif()
+
+    def setUp(self):
+        settings = override_settings(BITCOIN_ACCOUNT_XPUB=self.xpub, BITCOIN_ADDRESS_POOL_SIZE=GAP_LIMIT)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        bitcoin._receive_chain_key = None
+        self.addCleanup(setattr, bitcoin, '_receive_chain_key', None)
+        # No background refills or payment checks: the tests drive them.
+        for name in ('refill_address_pool_async', 'check_address_usage_async'):
+            patcher = mock.patch.object(bitcoin, name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_first_address_matches_bip84(self):
+        self.assertEqual(assign_address(), FIRST_ADDRESS)
+
+    def test_unpaid_addresses_stay_below_the_gap_limit(self):
+        handed_out = [assign_address() for _ in range(3 * GAP_LIMIT)]
+        self.assertEqual(len(set(handed_out)), GAP_LIMIT - 1)
+        self.assertEqual(handed_out[GAP_LIMIT - 1], handed_out[0])  # Least recently handed out comes back first
+        bitcoin.check_address_usage_async.assert_called()
+
+    def test_payment_moves_the_window(self):
+        for _ in range(GAP_LIMIT - 1):
+            assign_address()
+        BitcoinAddress.objects.filter(index=5).update(used_at='2026-01-01T00:00Z')
+        fill_address_pool()
+        fresh = {assign_address() for _ in range(6)}
+        self.assertEqual(set(BitcoinAddress.objects.filter(index__range=(19, 24)).values_list('address', flat=True)), fresh)
+
+    def test_fill_counts_only_the_rows_it_inserted(self):
+        chain_key = bitcoin.get_receive_chain_key()
+
+        def child_public(index):
+            if index == 3:
+                # Another worker inserts index 3 first.
+                BitcoinAddress.objects.create(index=3, address=chain_key.child_public(3).address())
+            return chain_key.child_public(index)
+
+        racing = mock.Mock(child_public=child_public)
+        with mock.patch.object(bitcoin, 'get_receive_chain_key', return_value=racing):
+            self.assertEqual(fill_address_pool(5), 4)
+        self.assertEqual(BitcoinAddress.objects.count(), 5)
+
+    def test_usage_check_marks_paid_addresses(self):
+        paid = assign_address()
+        assign_address()
+        with mock.patch('api.metrics.upstream_request',
+                        side_effect=lambda method, url, **kwargs: address_stats(1 if url.endswith(paid) else 0)):
+            self.assertEqual(check_address_usage(), 1)
+        self.assertEqual(list(BitcoinAddress.objects.filter(used_at__isnull=False).values_list('address', flat=True)), [paid])
@@ -0,0 +1,91 @@
+# backend/api/tests/test_bootstrap.py
+import importlib
+import os
+import threading
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from api.models import Tag
+
+# api.views re-exports the view function under the module's name.
+bootstrap = importlib.import_module('api.views.bootstrap')
+
+SECTION_ORDER = [
+    'errors', 'projects', 'work_experience', 'certifications', 'tags',
+    'github_stats', 'github_contributions', 'nostr_profile', 'latest_note', 'mempool_stats',
+]
+
+
+def failing():
+    raise RuntimeError("upstream returned 502")
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class BootstrapSnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Tag.objects.create(name="Django", slug="django")
+        # NOSTR_NPUB unset: both Nostr sections are unconfigured, not failing.
+        environ = {key: value for key, value in os.environ.items() if key != 'NOSTR_NPUB'}
+        patches = [
+            mock.patch.dict(os.environ, environ, clear=True),
+            mock.patch.dict(bootstrap.INTEGRATION_SECTIONS, {
+                'github_stats': (lambda: {'public_repos': 12}, ('github_stats',)),
+                'github_contributions': (failing, ('github_contributions',)),
+                'mempool_stats': (lambda: None, ('mempool_stats',)),
+            }),
+            mock.patch.object(bootstrap, '_reported_unconfigured', set()),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def build(self, **kwargs):
+        with self.assertLogs('api', 'INFO') as logs:
+            snapshot = bootstrap.build_bootstrap_snapshot(**kwargs)
+        return snapshot, logs.output
+
+    def test_shape_with_failing_empty_and_unconfigured_sections(self):
+        snapshot, logs = self.build()
+
+        self.assertEqual(list(snapshot), SECTION_ORDER)
+        self.assertEqual([tag['slug'] for tag in snapshot['tags']], ['django'])
+        self.assertEqual(snapshot['github_stats'], {'public_repos': 12})
+        self.assertIsNone(snapshot['github_contributions'])
+        self.assertIsNone(snapshot['mempool_stats'])
+        self.assertIsNone(snapshot['nostr_profile'])
+        self.assertIsNone(snapshot['latest_note'])
+        # Only real failures are errors; the unconfigured Nostr sections are not.
+        self.assertEqual(snapshot['errors'], {'github_contributions': "Unavailable.", 'mempool_stats': "Unavailable."})
+        self.assertTrue(any("'github_contributions' failed" in line for line in logs))
+
+    def test_unconfigured_section_is_logged_once_at_info(self):
+        _, first = self.build()
+        _, second = self.build()
+
+        unconfigured = [line for line in first if "not configured" in line]
+        self.assertEqual(len(unconfigured), 2)  # nostr_profile and latest_note
+        self.assertTrue(all(line.startswith("INFO:api:") for line in unconfigured))
+        self.assertFalse(any("not configured" in line for line in second))
+
+    def test_slow_section_times_out(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        slow = (lambda: release.wait(5) and {'block_height': 1}, ('mempool_stats',))
+        with mock.patch.dict(bootstrap.INTEGRATION_SECTIONS, {'mempool_stats': slow}):
+            snapshot, _ = self.build(timeout=0.2)
+
+        self.assertIsNone(snapshot['mempool_stats'])
+        self.assertEqual(snapshot['errors']['mempool_stats'], "Timed out.")
+
+    def test_conditional_get(self):
+        with self.assertLogs('api', 'INFO'):
+            response = self.client.get('/api/bootstrap/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.json()), SECTION_ORDER)
+
+        not_modified = self.client.get('/api/bootstrap/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
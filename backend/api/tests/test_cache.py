@@ -0,0 +1,164 @@
+# backend/api/tests/test_cache.py
+import time
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase
+from fakeredis import FakeConnection
+
+from api.cache import _MISSING, LocalTier, TieredRedisCache
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class WorkerCache(TieredRedisCache):
+    """
+    The backend as one worker process sees it. In production each process
+    has a single L1 per channel; here every instance gets its own, so two
+    instances behave like two gunicorn workers sharing one Redis.
+    """
+
+    @property
+    def tier(self) -> LocalTier:
+        if not hasattr(self, '_worker_tier'):
+            self._worker_tier = LocalTier(*self._l1_options)
+        self._worker_tier.ensure_listener(lambda: self.client.get_client(write=True), self._channel)
+        return self._worker_tier
+
+
+class TieredRedisCacheTests(SimpleTestCase):
+    L1_TIMEOUT = 60
+
+    def setUp(self):
+        # fakeredis keeps one in-memory server per address, shared by both workers.
+        params = {'OPTIONS': {
+            'CONNECTION_POOL_KWARGS': {'connection_class': FakeConnection},
+            'L1_CHANNEL': f"cache-invalidation-{uuid.uuid4().hex}",
+            'L1_TIMEOUT': self.L1_TIMEOUT,
+        }}
+        self.a = WorkerCache('redis://fake-redis:6379/0', params)
+        self.b = WorkerCache('redis://fake-redis:6379/0', params)
+        self.a.client.get_client(write=True).flushall()
+        for worker in (self.a, self.b):
+            self.assertTrue(wait_for(lambda: worker.tier.active), "invalidation listener never subscribed")
+
+    def invalidated(self, worker, action):
+        """Runs `action` and waits until `worker` has received the invalidation it publishes."""
+        before = worker.tier.stats['invalidations']
+        result = action()
+        self.assertTrue(wait_for(lambda: worker.tier.stats['invalidations'] > before))
+        return result
+
+    def cached_in_l1(self, worker, key):
+        return worker.tier.get(worker._key(key)) is not _MISSING
+
+    # --- Invalidation across workers ---
+    def test_write_on_one_worker_drops_the_other_workers_copy(self):
+        self.invalidated(self.b, lambda: self.a.set('greeting', {'text': "hello"}))
+        self.assertEqual(self.b.get('greeting'), {'text': "hello"})
+        self.assertTrue(self.cached_in_l1(self.b, 'greeting'))
+
+        self.invalidated(self.b, lambda: self.a.set('greeting', {'text': "bye"}))
+        self.assertFalse(self.cached_in_l1(self.b, 'greeting'))
+        self.assertEqual(self.b.get('greeting'), {'text': "bye"})
+
+        self.invalidated(self.b, lambda: self.a.delete('greeting'))
+        self.assertIsNone(self.b.get('greeting'))
+
+    def test_clear_drops_every_key_on_the_other_worker(self):
+        self.invalidated(self.b, lambda: self.a.set_many({'one': 1, 'two': 2}))
+        self.assertEqual(self.b.get_many(['one', 'two']), {'one': 1, 'two': 2})
+
+        self.invalidated(self.b, self.a.clear)
+        self.assertEqual(self.b.tier.snapshot_stats()['entries'], 0)
+        self.assertEqual(self.b.get_many(['one', 'two']), {})
+
+    def test_l1_serves_repeat_reads(self):
+        self.invalidated(self.b, lambda: self.a.set('key', "value"))
+        self.b.get('key')
+        with mock.patch.object(self.b, '_fetch', side_effect=AssertionError("went to Redis")):
+            self.assertEqual(self.b.get('key'), "value")
+        self.assertEqual(self.b.tier.stats['l1_hits'], 1)
+
+    # --- The set/invalidate race ---
+    def test_value_read_while_an_invalidation_arrives_is_not_kept(self):
+        self.invalidated(self.b, lambda: self.a.set('key', "old"))
+        fetch = self.b._fetch
+
+        def fetch_then_overwrite(keys):
+            # The value is read from Redis, then another worker replaces it
+            # before this read would have stored the old value in L1.
+            found = fetch(keys)
+            self.invalidated(self.b, lambda: self.a.set('key', "new"))
+            return found
+
+        with mock.patch.object(self.b, '_fetch', side_effect=fetch_then_overwrite):
+            self.assertEqual(self.b.get('key'), "old")
+        self.assertFalse(self.cached_in_l1(self.b, 'key'))
+        self.assertEqual(self.b.get('key'), "new")
+
+    def test_stale_generation_is_not_stored(self):
+        tier = self.a.tier
+        generation = tier.generation
+        tier.invalidate(['other'])
+        tier.set('key', "stale", None, generation=generation)
+        self.assertIs(tier.get('key'), _MISSING)
+        tier.set('key', "fresh", None, generation=tier.generation)
+        self.assertEqual(tier.get('key'), "fresh")
+
+    # --- TTL ---
+    def test_l1_entry_expires_with_the_redis_ttl(self):
+        now = time.monotonic()
+        with mock.patch('api.cache.time.monotonic', return_value=now):
+            self.a.set('short', "value", timeout=5)
+            self.a.set('forever', "value", timeout=None)
+            self.assertTrue(self.cached_in_l1(self.a, 'short'))
+        with mock.patch('api.cache.time.monotonic', return_value=now + 6):
+            self.assertFalse(self.cached_in_l1(self.a, 'short'))
+            self.assertTrue(self.cached_in_l1(self.a, 'forever'))
+        # No entry outlives L1_TIMEOUT, whatever its Redis TTL.
+        with mock.patch('api.cache.time.monotonic', return_value=now + self.L1_TIMEOUT + 1):
+            self.assertFalse(self.cached_in_l1(self.a, 'forever'))
+        self.assertEqual(self.a.get('forever'), "value")
+
+    def test_value_read_from_redis_keeps_its_remaining_ttl(self):
+        self.invalidated(self.b, lambda: self.a.set('key', "value", timeout=5))
+        now = time.monotonic()
+        with mock.patch('api.cache.time.monotonic', return_value=now):
+            self.b.get('key')
+        with mock.patch('api.cache.time.monotonic', return_value=now + 6):
+            self.assertFalse(self.cached_in_l1(self.b, 'key'))
+
+    # --- Isolation from callers ---
+    def test_cached_values_are_isolated_from_mutation(self):
+        value = {'tags': ["django"]}
+        self.a.set('post', value)
+        value['tags'].append("mutated after set")
+        first = self.a.get('post')
+        first['tags'].append("mutated after get")
+
+        self.assertEqual(self.a.get('post'), {'tags': ["django"]})
+        self.assertEqual(self.a.tier.stats['l1_hits'], 2)
+
+    # --- add / incr / delete ---
+    def test_add_incr_delete(self):
+        self.assertTrue(self.invalidated(self.b, lambda: self.a.add('counter', 1)))
+        self.assertFalse(self.a.add('counter', 5))
+        self.assertEqual(self.b.get('counter'), 1)
+
+        self.assertEqual(self.invalidated(self.b, lambda: self.a.incr('counter')), 2)
+        self.assertEqual(self.b.get('counter'), 2)
+        self.assertEqual(self.invalidated(self.b, lambda: self.a.incr('counter', 3)), 5)
+        self.assertEqual(self.b.get('counter'), 5)
+
+        self.assertTrue(self.invalidated(self.b, lambda: self.a.delete('counter')))
+        self.assertIsNone(self.b.get('counter'))
+        self.assertTrue(self.b.add('counter', 10))
+        self.assertEqual(self.b.get('counter'), 10)
@@ -0,0 +1,88 @@
+# backend/api/tests/test_conditional_get.py
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from api.models import Post, Project, Tag
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tag = Tag.objects.create(name="Django", slug="django")
+        self.project = Project.objects.create(title="Portfolio", description="This site.")
+        self.project.tags.add(self.tag)
+        self.post = Post.objects.create(title="Hello", slug="hello", content="# Hi", is_published=True)
+        self.post.tags.add(self.tag)
+
+    def etag(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+
+    def assertNotModified(self, url, etag):
+        # Answered from the cached content versions alone: no query, no serializer.
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_if_none_match_answers_304(self):
+        for url in ('/api/projects/', '/api/posts/', '/api/posts/hello/', '/api/tags/', '/api/certifications/'):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertTrue(response['ETag'].startswith('"'))
+                self.assertIn('Last-Modified', response)
+                self.assertNotModified(url, response['ETag'])
+
+    def test_if_none_match_with_a_stale_etag_gets_the_body(self):
+        response = self.client.get('/api/projects/', HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['title'], "Portfolio")
+
+    def test_query_string_order_does_not_change_the_etag(self):
+        self.assertEqual(self.etag('/api/projects/?tags=django&page_size=5'),
+                         self.etag('/api/projects/?page_size=5&tags=django'))
+        self.assertNotEqual(self.etag('/api/projects/?tags=django'), self.etag('/api/projects/'))
+
+    def test_save_changes_the_etag(self):
+        projects, posts = self.etag('/api/projects/'), self.etag('/api/posts/')
+        self.project.title = "Portfolio v2"
+        self.project.save()
+
+        self.assertNotEqual(self.etag('/api/projects/'), projects)
+        self.assertEqual(self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=projects).status_code, 200)
+        # Other content types keep their validators.
+        self.assertEqual(self.etag('/api/posts/'), posts)
+
+    def test_delete_changes_the_etag(self):
+        detail = self.etag('/api/posts/hello/')
+        Post.objects.create(title="Other", slug="other", content="x", is_published=True).delete()
+        self.assertNotEqual(self.etag('/api/posts/hello/'), detail)
+
+    def test_m2m_change_changes_the_etag(self):
+        other = Tag.objects.create(name="Nostr", slug="nostr")
+        projects, posts = self.etag('/api/projects/'), self.etag('/api/posts/')
+
+        self.project.tags.add(other)
+        self.assertNotEqual(self.etag('/api/projects/'), projects)
+        self.assertEqual(self.etag('/api/posts/'), posts)
+
+        posts = self.etag('/api/posts/')
+        self.post.tags.remove(self.tag)
+        self.assertNotEqual(self.etag('/api/posts/'), posts)
+
+        projects = self.etag('/api/projects/')
+        self.project.tags.clear()
+        self.assertNotEqual(self.etag('/api/projects/'), projects)
+
+    def test_tag_rename_changes_the_project_and_post_etags(self):
+        # Tags are nested in both representations (see CONTENT_DEPENDENCIES in signals.py).
+        before = {url: self.etag(url) for url in ('/api/tags/', '/api/projects/', '/api/posts/', '/api/posts/hello/')}
+        self.tag.name = "Django REST"
+        self.tag.save()
+
+        for url, etag in before.items():
+            with self.subTest(url=url):
+                self.assertNotEqual(self.etag(url), etag)
+        self.assertEqual(self.client.get('/api/projects/').json()['results'][0]['tags'][0]['name'], "Django REST")
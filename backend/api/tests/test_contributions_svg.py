@@ -0,0 +1,47 @@
+# backend/api/tests/test_contributions_svg.py
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api.heatmap import precompress
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg"><rect/></svg>' * 20
+URL = '/api/github-contributions.svg'
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class ContributionsSvgTests(SimpleTestCase):
+    def setUp(self):
+        self.entry = precompress(SVG)
+        patcher = mock.patch('api.views.github.get_contributions_svg', return_value=self.entry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, encoding='', **headers):
+        return self.client.get(URL, HTTP_ACCEPT_ENCODING=encoding, **headers)
+
+    def test_each_encoding_has_its_own_etag(self):
+        identity, gzip, br = self.get(), self.get('gzip'), self.get('gzip, br')
+        self.assertNotIn('Content-Encoding', identity)
+        self.assertEqual(gzip['Content-Encoding'], 'gzip')
+        self.assertEqual(br['Content-Encoding'], 'br')
+        base = self.entry['etag']
+        self.assertEqual(identity['ETag'], base)
+        self.assertEqual(gzip['ETag'], f'{base[:-1]}-gz"')
+        self.assertEqual(br['ETag'], f'{base[:-1]}-br"')
+        for response in (identity, gzip, br):
+            self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_revalidation_matches_only_the_same_encoding(self):
+        gzip_etag = self.get('gzip')['ETag']
+        self.assertEqual(self.get('gzip', HTTP_IF_NONE_MATCH=gzip_etag).status_code, 304)
+        self.assertEqual(self.get('', HTTP_IF_NONE_MATCH=gzip_etag).status_code, 200)
+        self.assertEqual(self.get('br', HTTP_IF_NONE_MATCH=gzip_etag).status_code, 200)
+
+    def test_if_none_match_is_parsed_not_searched(self):
+        etag = self.entry['etag']
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=f'"other", W/{etag}').status_code, 304)
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH='*').status_code, 304)
+        # The tag inside a longer (or unquoted) value is not a match.
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=f'"x{etag[1:]}').status_code, 200)
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH=etag.strip('"')).status_code, 200)
@@ -0,0 +1,106 @@
+# backend/api/tests/test_embeddings.py
+import json
+import math
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+from safetensors.numpy import load_file
+from tokenizers import Tokenizer
+
+from api.embeddings import EmbeddingError, LocalEmbeddingBackend
+
+# A 2-layer, 16-wide BERT with random weights (seed 0) and a 50-token
+# WordPiece vocabulary: the same files as a real sentence-transformers model,
+# small enough to bundle. Its similarities mean nothing; its forward pass is
+# checked against reference_embedding() below.
+TINY_MODEL = Path(__file__).resolve().parent / 'fixtures' / 'tiny-bert'
+
+SENTENCES = [
+    "Show me your projects",
+    "What skills do you have?",
+    "Tell me about your work experience with Python and Django",
+    "Bitcoin",
+]
+
+
+def reference_embedding(text):
+    """Textbook BERT forward pass + mean pooling, one head and one token at a time."""
+    config = json.loads((TINY_MODEL / 'config.json').read_text())
+    weights = load_file(str(TINY_MODEL / 'model.safetensors'))
+    ids = Tokenizer.from_file(str(TINY_MODEL / 'tokenizer.json')).encode(text).ids
+    heads, eps = config['num_attention_heads'], config['layer_norm_eps']
+    head_size = config['hidden_size'] // heads
+
+    def norm(x, name):
+        mean, variance = x.mean(axis=-1, keepdims=True), x.var(axis=-1, keepdims=True)
+        return (x - mean) / np.sqrt(variance + eps) * weights[f'{name}.weight'] + weights[f'{name}.bias']
+
+    def dense(x, name):
+        return x @ weights[f'{name}.weight'].T + weights[f'{name}.bias']
+
+    x = np.stack([
+        weights['embeddings.word_embeddings.weight'][token] + weights['embeddings.position_embeddings.weight'][position]
+        + weights['embeddings.token_type_embeddings.weight'][0]
+        for position, token in enumerate(ids)
+    ])
+    x = norm(x, 'embeddings.LayerNorm')
+    for i in range(config['num_hidden_layers']):
+        layer = f'encoder.layer.{i}'
+        query, key, value = (dense(x, f'{layer}.attention.self.{part}') for part in ('query', 'key', 'value'))
+        context = np.zeros_like(x)
+        for head in range(heads):
+            part = slice(head * head_size, (head + 1) * head_size)
+            scores = query[:, part] @ key[:, part].T / math.sqrt(head_size)
+            probabilities = np.exp(scores - scores.max(axis=-1, keepdims=True))
+            probabilities /= probabilities.sum(axis=-1, keepdims=True)
+            context[:, part] = probabilities @ value[:, part]
+        x = norm(x + dense(context, f'{layer}.attention.output.dense'), f'{layer}.attention.output.LayerNorm')
+        intermediate = dense(x, f'{layer}.intermediate.dense')
+        intermediate = np.vectorize(lambda v: 0.5 * v * (1 + math.erf(v / math.sqrt(2))))(intermediate)
+        x = norm(x + dense(intermediate, f'{layer}.output.dense'), f'{layer}.output.LayerNorm')
+    pooled = x.mean(axis=0)
+    return pooled / np.linalg.norm(pooled)
+
+
+class LocalEmbeddingBackendTests(SimpleTestCase):
+    def setUp(self):
+        self.backend = LocalEmbeddingBackend(TINY_MODEL, batch_size=8)
+
+    def test_matches_reference_forward_pass(self):
+        vectors = self.backend.embed(SENTENCES)
+        for text, vector in zip(SENTENCES, vectors):
+            np.testing.assert_allclose(vector, reference_embedding(text), atol=1e-5)
+
+    def test_unit_vectors(self):
+        vectors = self.backend.embed(SENTENCES)
+        self.assertEqual(vectors.shape, (len(SENTENCES), 16))
+        np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, atol=1e-6)
+
+    def test_padding_does_not_change_vectors(self):
+        # Batched, the short sentences are padded to the longest one; alone they aren't.
+        alone = LocalEmbeddingBackend(TINY_MODEL, batch_size=1).embed(SENTENCES)
+        np.testing.assert_allclose(self.backend.embed(SENTENCES), alone, atol=1e-5)
+
+    def test_documents_are_embedded_once(self):
+        with mock.patch.object(self.backend, 'embed', wraps=self.backend.embed) as embed:
+            first = self.backend.embed_documents(SENTENCES)
+            second = self.backend.embed_documents(list(reversed(SENTENCES)))
+        embed.assert_called_once()
+        np.testing.assert_array_equal(second, first[::-1])
+
+    def test_similarities(self):
+        scores = self.backend.similarities(SENTENCES[0], SENTENCES)
+        self.assertEqual(len(scores), len(SENTENCES))
+        self.assertAlmostEqual(scores[0], 1.0, places=5)
+        self.assertTrue(all(score < 1.0 for score in scores[1:]))
+        self.assertEqual(self.backend.similarities(SENTENCES[0], []), [])
+
+    def test_unusable_model_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            backend = LocalEmbeddingBackend(Path(directory))
+            self.assertFalse(backend.configured)
+            with self.assertRaises(EmbeddingError):
+                backend.similarities("question", ["document"])
@@ -0,0 +1,120 @@
+# backend/api/tests/test_intents.py
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from api.embeddings import EmbeddingError
+from api.intents import INTENT_KEYWORDS, IntentRouter, KeywordAutomaton, Route, decide, tokenize
+
+# Two intents whose examples embed to orthogonal axes, so a question's vector picks its prototype.
+EXAMPLES = {'project': ["What have you built?"], 'blog': ["What have you written?"]}
+AXES = {"What have you built?": [1.0, 0.0, 0.0], "What have you written?": [0.0, 1.0, 0.0]}
+
+
+class FakeBackend:
+    def __init__(self, name='local', configured=True, vector=(0.0, 0.0, 1.0), error=None):
+        self.name, self.configured = name, configured
+        self.vector, self.error = np.asarray(vector), error
+        self.embed_documents = mock.Mock(side_effect=lambda texts: np.array([AXES[text] for text in texts]))
+
+    def embed(self, texts):
+        if self.error:
+            raise self.error
+        return np.array([self.vector / np.linalg.norm(self.vector)])
+
+
+class TokenizeTests(SimpleTestCase):
+    def test_tokens(self):
+        self.assertEqual(tokenize("What's your C++ / C# work-history?"), ['whats', 'your', 'c++', 'c#', 'work', 'history'])
+
+
+class KeywordAutomatonTests(SimpleTestCase):
+    def setUp(self):
+        self.automaton = KeywordAutomaton(INTENT_KEYWORDS)
+
+    def scan(self, text):
+        return self.automaton.scan(tokenize(text))
+
+    def test_longest_phrase_wins(self):
+        # "your work experience" is one experience phrase, not "work" (a project word) + "experience".
+        self.assertEqual(self.scan("Tell me about your work experience"), {'experience': 4.5})
+        self.assertEqual(self.scan("your work"), {'project': 2.5})
+        self.assertEqual(self.scan("work"), {'project': 1})
+
+    def test_falls_back_to_a_shorter_phrase(self):
+        # "work experiences" isn't a phrase: "work" and "experiences" count separately.
+        self.assertEqual(self.scan("work experiences"), {'project': 1, 'experience': 3})
+
+    def test_whole_tokens_only(self):
+        for text in ("network", "networking", "stackoverflow", "homework", "reposted"):
+            with self.subTest(text=text):
+                self.assertEqual(self.scan(text), {})
+        self.assertEqual(self.scan("network tools"), {'tech_stack': 2})
+
+    def test_repeated_phrases_add_up(self):
+        self.assertEqual(self.scan("blog, blog posts and a blog post"), {'blog': 3 + 4.5 + 4.5})
+
+    def test_phrase_shared_by_two_intents(self):
+        automaton = KeywordAutomaton({'a': {'side project': 2}, 'b': {'side project': 1, 'side': 5}})
+        self.assertEqual(automaton.scan(tokenize("my side project")), {'a': 2, 'b': 1})
+        self.assertEqual(automaton.scan(tokenize("side")), {'b': 5})
+
+
+class DecideTests(SimpleTestCase):
+    def test_no_scores(self):
+        self.assertEqual(decide({}), (None, 0.0))
+
+    def test_minimum_score(self):
+        self.assertEqual(decide({'project': 1.5}), (None, 1.0))
+        self.assertEqual(decide({'project': 2.0}), ('project', 1.0))
+
+    def test_minimum_confidence(self):
+        self.assertEqual(decide({'project': 3, 'experience': 2}), ('project', 0.6))
+        intent, confidence = decide({'project': 3, 'experience': 2.5, 'blog': 2.9})
+        self.assertIsNone(intent)
+        self.assertAlmostEqual(confidence, 3 / 5.9)
+
+    def test_custom_thresholds(self):
+        self.assertEqual(decide({'blog': 1}, min_score=1), ('blog', 1.0))
+        self.assertEqual(decide({'blog': 3, 'project': 1}, min_confidence=0.8), (None, 0.75))
+
+
+class IntentRouterTests(SimpleTestCase):
+    UNDECIDED = "Anything interesting lately?"
+
+    def setUp(self):
+        self.router = IntentRouter(examples=EXAMPLES)
+
+    def test_keywords(self):
+        self.assertEqual(self.router.route("What's your tech stack?"), Route('tech_stack', 'keywords', 1.0))
+        self.assertEqual(self.router.route(self.UNDECIDED), Route(None, 'retrieval', 0.0))
+
+    def test_keyword_match_skips_the_backend(self):
+        backend = FakeBackend(vector=(1, 0, 0))
+        self.assertEqual(self.router.route("Show me your projects", backend).method, 'keywords')
+        backend.embed_documents.assert_not_called()
+
+    def test_prototypes_with_the_local_backend(self):
+        route = self.router.route(self.UNDECIDED, FakeBackend(vector=(0.2, 1, 0)))
+        self.assertEqual((route.intent, route.method), ('blog', 'prototype'))
+        self.assertAlmostEqual(route.confidence, 1 / np.hypot(0.2, 1))
+
+    def test_prototypes_need_a_close_and_clear_winner(self):
+        for vector in ((0, 0, 1), (1, 1, 0)):  # Too far from both, or a tie
+            with self.subTest(vector=vector):
+                self.assertEqual(self.router.route(self.UNDECIDED, FakeBackend(vector=vector)),
+                                 Route(None, 'retrieval', 0.0))
+
+    def test_falls_back_when_the_backend_is_not_local(self):
+        for backend in (FakeBackend(name='openai', vector=(1, 0, 0)),
+                        FakeBackend(configured=False, vector=(1, 0, 0))):
+            with self.subTest(name=backend.name, configured=backend.configured):
+                self.assertEqual(self.router.route(self.UNDECIDED, backend), Route(None, 'retrieval', 0.0))
+                backend.embed_documents.assert_not_called()
+
+    def test_falls_back_on_an_embedding_error(self):
+        backend = FakeBackend(error=EmbeddingError("model missing"))
+        with self.assertLogs('api', 'WARNING') as logs:
+            self.assertEqual(self.router.route(self.UNDECIDED, backend), Route(None, 'retrieval', 0.0))
+        self.assertIn("model missing", logs.output[0])
@@ -0,0 +1,169 @@
+# backend/api/tests/test_mempool_feed.py
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from api.mempool_feed import MEMPOOL_STATS_CACHE_KEY, MempoolFeed
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class LeadershipTests(SimpleTestCase):
+    def setUp(self):
+        self.feeds = [MempoolFeed(url='ws://unused'), MempoolFeed(url='ws://unused')]
+
+    def tearDown(self):
+        for feed in self.feeds:
+            feed.release_leadership()
+
+    def test_only_one_feed_leads(self):
+        first, second = self.feeds
+        self.assertTrue(first.acquire_leadership())
+        self.assertFalse(second.acquire_leadership())
+        self.assertTrue(first.renew_leadership())
+        self.assertFalse(second.renew_leadership())
+
+    def test_non_owner_cannot_release(self):
+        first, second = self.feeds
+        first.acquire_leadership()
+        second.release_leadership()
+        self.assertTrue(first.is_leader())
+        first.release_leadership()
+        self.assertTrue(second.acquire_leadership())
+
+    def test_lapsed_leader_cannot_renew_a_new_lease(self):
+        first, second = self.feeds
+        first.acquire_leadership()
+        # First's lease runs out (e.g. a long GC pause) and second takes over.
+        first.release_leadership()
+        self.assertTrue(second.acquire_leadership())
+        self.assertFalse(first.renew_leadership())
+        self.assertTrue(second.is_leader())
+
+
+class ReconnectTests(SimpleTestCase):
+    """run_forever with run_once stubbed out: an upstream that accepts and closes the socket right away."""
+
+    def setUp(self):
+        self.feed = MempoolFeed(url='ws://unused')
+        self.assertTrue(self.feed.acquire_leadership())
+        self.addCleanup(self.feed.release_leadership)
+        self.waits = []
+
+    def run_forever(self, reconnects, connection_seconds=1):
+        def wait(seconds):
+            self.waits.append(seconds)
+            if len(self.waits) == reconnects:
+                self.feed._stop.set()
+            return self.feed._stop.is_set()
+
+        clock = iter(range(0, 10_000, connection_seconds))
+        with mock.patch.object(self.feed, 'initial_state', return_value={}), \
+                mock.patch.object(self.feed, 'run_once') as run_once, \
+                mock.patch.object(self.feed._stop, 'wait', side_effect=wait), \
+                mock.patch.object(self.feed, 'renew_leadership', wraps=self.feed.renew_leadership) as renew, \
+                mock.patch('api.mempool_feed.time.monotonic', side_effect=lambda: next(clock)), \
+                self.assertLogs('api', 'WARNING') as logs:
+            self.feed.run_forever()
+        self.assertIn("Mempool feed closed by upstream. Reconnecting in 1s.", logs.output[0])
+        return run_once, renew
+
+    def test_clean_close_backs_off_and_renews(self):
+        run_once, renew = self.run_forever(reconnects=6)
+        self.assertEqual(self.waits, [1, 2, 4, 8, 16, 20])
+        self.assertEqual(run_once.call_count, 6)
+        self.assertEqual(renew.call_count, 6)
+
+    def test_backoff_resets_after_a_long_connection(self):
+        self.run_forever(reconnects=3, connection_seconds=60)
+        self.assertEqual(self.waits, [1, 1, 1])
+
+    def test_stops_reconnecting_without_leadership(self):
+        with mock.patch.object(self.feed, 'renew_leadership', return_value=False), \
+                mock.patch.object(self.feed, 'initial_state', return_value={}), \
+                mock.patch.object(self.feed, 'run_once') as run_once, \
+                mock.patch.object(self.feed._stop, 'wait', side_effect=self.waits.append), \
+                self.assertLogs('api', 'WARNING'):
+            self.feed.run_forever()
+        self.assertEqual(run_once.call_count, 1)
+        self.assertEqual(self.waits, [1])
+        self.assertFalse(self.feed.is_leader())
+
+
+class FeedAgainstStubTests(SimpleTestCase):
+    """Runs the feed against benchmarks/stubs/mempool_ws.py, which pushes a block every 0.2 s."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.port = free_port()
+        cls.stub = subprocess.Popen(
+            [sys.executable, '-u', 'benchmarks/stubs/mempool_ws.py', '--port', str(cls.port), '--interval', '0.2'],
+            cwd=BACKEND_DIR, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        cls.stub.stdout.readline()  # Printed once it is listening
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stub.terminate()
+        cls.stub.wait()
+        cls.stub.stdout.close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.delete(MEMPOOL_STATS_CACHE_KEY)
+        self.feed = MempoolFeed(url=f"ws://127.0.0.1:{self.port}/api/v1/ws")
+        self.assertTrue(self.feed.acquire_leadership())
+
+    def tearDown(self):
+        self.feed.stop()
+        self.feed.release_leadership()
+
+    def test_publishes_init_then_new_blocks(self):
+        thread = threading.Thread(target=self.feed.run_once, args=({},), daemon=True)
+        thread.start()
+
+        self.assertTrue(wait_for(lambda: cache.get(MEMPOOL_STATS_CACHE_KEY)))
+        first = cache.get(MEMPOOL_STATS_CACHE_KEY)
+        self.assertEqual(set(first), {'block_height', 'recommended_fees', 'price'})
+        self.assertTrue(wait_for(lambda: cache.get(MEMPOOL_STATS_CACHE_KEY)['block_height'] > first['block_height']))
+
+        self.feed.stop()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+    def test_stops_when_leadership_is_lost(self):
+        thread = threading.Thread(target=self.feed.run_once, args=({},), daemon=True)
+        thread.start()
+        self.assertTrue(wait_for(lambda: cache.get(MEMPOOL_STATS_CACHE_KEY)))
+
+        self.feed.release_leadership()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class StreamViewTests(SimpleTestCase):
+    def test_stream_is_off_by_default(self):
+        self.assertEqual(self.client.get('/api/mempool-stats/stream/').status_code, 204)
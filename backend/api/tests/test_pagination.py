@@ -0,0 +1,79 @@
+# backend/api/tests/test_pagination.py
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from api.models import Post, Project, Tag
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        tag = Tag.objects.create(name="Django", slug="django")
+        posts = [Post.objects.create(title=f"Post {i}", slug=f"post-{i}", content="x", is_published=True)
+                 for i in range(23)]
+        Post.objects.create(title="Draft", slug="draft", content="x", is_published=False)
+        # Most posts share one published_date, so the cursor must break ties on id.
+        same_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        Post.objects.filter(pk__in=[post.pk for post in posts[3:20]]).update(published_date=same_time)
+        Post.objects.filter(pk__in=[post.pk for post in posts[20:]]).update(
+            published_date=datetime(2023, 1, 1, tzinfo=timezone.utc))
+        for post in posts[::2]:
+            post.tags.add(tag)
+        for i in range(11):
+            Project.objects.create(title=f"Project {i}", description="x")
+
+    def walk(self, url):
+        """Follows `next` from `url` to the last page; returns the pages."""
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            page = response.json()
+            self.assertEqual(set(page), {'next', 'previous', 'results'})
+            pages.append(page)
+            url = page['next']
+        return pages
+
+    def walk_back(self, url):
+        pages = []
+        while url:
+            page = self.client.get(url).json()
+            pages.append(page)
+            url = page['previous']
+        return pages
+
+    def ids(self, pages):
+        return [item['id'] for page in pages for item in page['results']]
+
+    def test_posts_every_page_without_duplicates_or_gaps(self):
+        expected = list(Post.objects.filter(is_published=True).order_by('-published_date', '-id')
+                        .values_list('id', flat=True))
+        for page_size in (1, 3, 5, 20):
+            with self.subTest(page_size=page_size):
+                pages = self.walk(f'/api/posts/?page_size={page_size}')
+                self.assertEqual(self.ids(pages), expected)
+                self.assertIsNone(pages[0]['previous'])
+                self.assertTrue(all(len(page['results']) == page_size for page in pages[:-1]))
+
+    def test_posts_walk_back_from_the_last_page(self):
+        pages = self.walk('/api/posts/?page_size=4')
+        back = self.walk_back(pages[-1]['previous'])
+        self.assertEqual(self.ids(reversed(back)), self.ids(pages[:-1]))
+
+    def test_filtered_posts(self):
+        expected = list(Post.objects.filter(is_published=True, tags__slug='django')
+                        .order_by('-published_date', '-id').values_list('id', flat=True))
+        self.assertEqual(self.ids(self.walk('/api/posts/?tags=django&page_size=3')), expected)
+
+    def test_projects_every_page(self):
+        expected = list(Project.objects.order_by('-id').values_list('id', flat=True))
+        pages = self.walk('/api/projects/?page_size=4')
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(self.ids(pages), expected)
+
+    def test_default_and_maximum_page_size(self):
+        self.assertEqual(len(self.client.get('/api/posts/').json()['results']), 20)
+        self.assertEqual(len(self.client.get('/api/posts/?page_size=1000').json()['results']), 23)
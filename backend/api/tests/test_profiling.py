@@ -0,0 +1,70 @@
+# backend/api/tests/test_profiling.py
+import marshal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from api.models import ProfileArtifact, Project
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False, PROFILING_ENABLED=True)
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Project.objects.create(title="Portfolio", description="This site.")
+        User = get_user_model()
+        self.staff = User.objects.create_user('staff', password='x', is_staff=True, is_superuser=True)
+        self.visitor = User.objects.create_user('visitor', password='x')
+
+    def test_staff_request_stores_a_profile(self):
+        self.client.force_login(self.staff)
+        response = self.client.get('/api/projects/?page_size=5', HTTP_X_PROFILE='1')
+        self.assertEqual(response.status_code, 200)
+
+        artifact = ProfileArtifact.objects.get()
+        self.assertEqual(response['X-Profile-Id'], str(artifact.pk))
+        self.assertEqual(artifact.user, self.staff)
+        self.assertEqual((artifact.method, artifact.path, artifact.status_code),
+                         ('GET', '/api/projects/?page_size=5', 200))
+        self.assertGreater(artifact.duration_ms, 0)
+        # The view's queries are recorded as spans; the stats are a loadable pstats dump.
+        self.assertGreater(artifact.sql_count, 0)
+        self.assertEqual(len([span for span in artifact.spans if span['kind'] == 'sql']), artifact.sql_count)
+        self.assertTrue(any('api_project' in span['label'] for span in artifact.spans))
+        self.assertIn("Slowest spans:", artifact.summary)
+        self.assertIsInstance(marshal.loads(bytes(artifact.stats)), dict)
+
+    def test_query_parameter_also_triggers_a_profile(self):
+        self.client.force_login(self.staff)
+        response = self.client.get('/api/projects/?_profile=1')
+        self.assertEqual(response['X-Profile-Id'], str(ProfileArtifact.objects.get().pk))
+
+    def test_admin_downloads_the_stats(self):
+        self.client.force_login(self.staff)
+        artifact_id = self.client.get('/api/projects/', HTTP_X_PROFILE='1')['X-Profile-Id']
+        response = self.client.get(f'/admin/api/profileartifact/{artifact_id}/download/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, bytes(ProfileArtifact.objects.get().stats))
+
+    def test_other_requests_are_not_profiled(self):
+        self.client.get('/api/projects/', HTTP_X_PROFILE='1')  # Anonymous
+        self.client.force_login(self.visitor)
+        self.client.get('/api/projects/', HTTP_X_PROFILE='1')
+        self.client.force_login(self.staff)
+        response = self.client.get('/api/projects/')  # Not asked for
+        self.assertNotIn('X-Profile-Id', response)
+        self.assertFalse(ProfileArtifact.objects.exists())
+
+    @override_settings(PROFILING_ENABLED=False)
+    def test_disabled(self):
+        self.client.force_login(self.staff)
+        response = self.client.get('/api/projects/', HTTP_X_PROFILE='1')
+        self.assertNotIn('X-Profile-Id', response)
+        self.assertFalse(ProfileArtifact.objects.exists())
+
+    @override_settings(PROFILE_ARTIFACT_LIMIT=2)
+    def test_only_the_newest_profiles_are_kept(self):
+        self.client.force_login(self.staff)
+        ids = [self.client.get(f'/api/projects/?n={i}', HTTP_X_PROFILE='1')['X-Profile-Id'] for i in range(3)]
+        self.assertEqual(sorted(ProfileArtifact.objects.values_list('pk', flat=True)), sorted(map(int, ids[1:])))
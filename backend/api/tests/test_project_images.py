@@ -0,0 +1,38 @@
+# backend/api/tests/test_project_images.py
+import os
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from api.images import image_dir
+
+NAME = '0123456789abcdef-480w.webp'
+URL = f'/api/project-images/{NAME}'
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class ProjectImageTests(SimpleTestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings = override_settings(MEDIA_ROOT=media.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        os.makedirs(image_dir())
+        with open(os.path.join(image_dir(), NAME), 'wb') as f:
+            f.write(b'RIFF....WEBP')
+
+    def test_serves_variant_as_immutable(self):
+        response = self.client.get(URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/webp')
+        self.assertEqual(response['ETag'], f'"{NAME}"')
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_if_none_match(self):
+        self.assertEqual(self.client.get(URL, HTTP_IF_NONE_MATCH=f'W/"{NAME}"').status_code, 304)
+        self.assertEqual(self.client.get(URL, HTTP_IF_NONE_MATCH=f'"x{NAME}"').status_code, 200)
+
+    def test_unknown_names(self):
+        self.assertEqual(self.client.get('/api/project-images/..%2Fsecret.webp').status_code, 404)
+        self.assertEqual(self.client.get('/api/project-images/fedcba9876543210-480w.webp').status_code, 404)
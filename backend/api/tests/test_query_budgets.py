@@ -0,0 +1,56 @@
+# backend/api/tests/test_query_budgets.py
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+
+from api.seed import Rollback, seed
+
+# Number of SQL queries each endpoint runs, independent of how many rows it
+# returns. A list endpoint that starts issuing one query per row (N+1) fails
+# as soon as it is seeded with more than a few rows.
+QUERY_BUDGETS = {
+    '/api/projects/': 2,                     # projects + prefetched tags
+    '/api/projects/?tag=budget-tag-0': 2,
+    '/api/projects/?tags=budget-tag-0,budget-tag-1': 2,
+    '/api/posts/': 2,                        # posts + prefetched tags
+    '/api/posts/?tag=budget-tag-0': 2,
+    '/api/posts/budget-post-0/': 2,
+    '/api/tags/': 1,
+    '/api/tags/?with_counts=1': 1,            # one correlated count per tag and type
+    '/api/tags/?with_counts=1&tags=budget-tag-0,budget-tag-1': 1,
+    '/api/certifications/': 1,
+    '/api/work-experience/': 1,
+}
+# Full-text search needs PostgreSQL.
+POSTGRES_QUERY_BUDGETS = {
+    '/api/search/?q=budget': 4,              # (projects + tags) + (posts + tags)
+}
+SIZES = [10, 100, 1000]
+
+
+# A dummy cache makes every request do its real work instead of hitting the response cache.
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+    ALLOWED_HOSTS=['testserver'],
+    SECURE_SSL_REDIRECT=False,
+)
+class QueryBudgetTests(TestCase):
+    def assert_budgets(self, budgets):
+        for rows in SIZES:
+            try:
+                with transaction.atomic():
+                    seed(rows)
+                    for url, budget in budgets.items():
+                        with self.subTest(url=url, rows=rows), self.assertNumQueries(budget):
+                            response = self.client.get(url)
+                            self.assertEqual(response.status_code, 200)
+                    raise Rollback
+            except Rollback:
+                pass
+
+    def test_query_budgets(self):
+        self.assert_budgets(QUERY_BUDGETS)
+
+    def test_search_query_budget(self):
+        if connection.vendor != 'postgresql':
+            self.skipTest("Full-text search needs PostgreSQL.")
+        self.assert_budgets(POSTGRES_QUERY_BUDGETS)
@@ -0,0 +1,39 @@
+# backend/api/tests/test_query_plans.py
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+
+from api.management.commands.check_query_plans import PLAN_READERS
+from api.models import Certification
+
+ROWS = 1000
+
+
+class QueryPlanTests(TestCase):
+    """The check_query_plans harness, run inside the test transaction (its seeding is rolled back with it)."""
+
+    def check_plans(self):
+        out = StringIO()
+        call_command('check_query_plans', rows=ROWS, stdout=out)
+        return out.getvalue()
+
+    def test_hot_queries_use_indexes(self):
+        self.assertIn("Every hot query is served by an index.", self.check_plans())
+
+    def test_dropped_index_fails_the_check(self):
+        # DDL is transactional on SQLite and PostgreSQL, so the index comes back with the rollback.
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX {connection.ops.quote_name('cert_date_issued_idx')}")
+        with self.assertRaisesMessage(CommandError, '/api/certifications/'):
+            self.check_plans()
+
+    def test_plan_reader_flags_sequential_scans(self):
+        read_plan = PLAN_READERS[connection.vendor]
+        table = Certification._meta.db_table
+        with connection.cursor() as cursor:
+            scanned, _ = read_plan(cursor, f"SELECT * FROM {table} WHERE name = 'x'")
+            self.assertEqual(scanned, {table})
+            scanned, _ = read_plan(cursor, f"SELECT * FROM {table} WHERE id = 1")
+            self.assertEqual(scanned, set())
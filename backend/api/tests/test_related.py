@@ -0,0 +1,98 @@
+# backend/api/tests/test_related.py
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+
+from api import related
+from api.models import Post, Project, Tag
+
+
+class RelatedContentTests(TestCase):
+    """
+    The signals recompute `related` on commit. TestCase never commits, so
+    every change runs inside captureOnCommitCallbacks(execute=True).
+    """
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            python, django, self.nostr, bitcoin = (
+                Tag.objects.create(name=name, slug=name.lower()) for name in ("Python", "Django", "Nostr", "Bitcoin"))
+            self.backend = Project.objects.create(title="Backend", description="x")
+            self.backend.tags.add(python, django)
+            self.site = Project.objects.create(title="Site", description="x")
+            self.site.tags.add(django)
+            self.orm = Post.objects.create(title="ORM", slug="orm", content="x", is_published=True)
+            self.orm.tags.add(python, django)
+            self.relays = Post.objects.create(title="Relays", slug="relays", content="x", is_published=True)
+            self.relays.tags.add(self.nostr, bitcoin)
+            self.zaps = Post.objects.create(title="Zaps", slug="zaps", content="x", is_published=True)
+            self.zaps.tags.add(self.nostr)
+
+    def neighbours(self, item):
+        item.refresh_from_db()
+        return {(entry['type'], entry['id']) for entry in item.related}
+
+    def test_lists_after_creation(self):
+        self.assertEqual(self.neighbours(self.backend), {('project', self.site.pk), ('post', self.orm.pk)})
+        self.assertEqual(self.neighbours(self.relays), {('post', self.zaps.pk)})
+        self.assertEqual(self.neighbours(self.zaps), {('post', self.relays.pk)})
+        entry = next(entry for entry in self.zaps.related)
+        self.assertEqual({key: entry[key] for key in ('title', 'slug')}, {'title': "Relays", 'slug': "relays"})
+        self.assertTrue(0 < entry['score'] <= 1)
+
+    def test_tag_edit_updates_the_neighbours(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.site.tags.add(self.nostr)
+
+        self.assertIn(('post', self.zaps.pk), self.neighbours(self.site))
+        # The other side of the new edge is recomputed too.
+        self.assertIn(('project', self.site.pk), self.neighbours(self.zaps))
+        self.assertIn(('project', self.site.pk), self.neighbours(self.relays))
+
+    def test_delete_removes_the_item_from_other_lists(self):
+        orm = ('post', self.orm.pk)
+        self.assertIn(orm, self.neighbours(self.backend))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.orm.delete()
+
+        self.assertNotIn(orm, self.neighbours(self.backend))
+        self.assertNotIn(orm, self.neighbours(self.site))
+
+    def test_unpublishing_removes_the_post_and_empties_its_list(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.relays.is_published = False
+            self.relays.save()
+
+        self.assertEqual(self.neighbours(self.zaps), set())
+        self.assertEqual(self.neighbours(self.relays), set())
+
+    def test_rollback_leftovers_are_recomputed_with_the_next_commit(self):
+        # A stale list (bulk updates send no signals) that the next save of `zaps` would fix...
+        Post.objects.filter(pk=self.zaps.pk).update(related=[])
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                self.zaps.title = "Zaps!"
+                self.zaps.save()
+                raise RuntimeError
+        # ...but that save rolled back, and its callback with it.
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.neighbours(self.zaps), set())
+
+        # The next commit, of an item outside zaps' neighbourhood, picks up the leftover.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.backend.title = "Backend v2"
+            self.backend.save()
+        self.assertEqual(self.neighbours(self.zaps), {('post', self.relays.pk)})
+        self.assertEqual(self.zaps.title, "Zaps")
+
+    def test_one_recompute_per_transaction(self):
+        with mock.patch('api.related.update_related', wraps=related.update_related) as update:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                for post in (self.orm, self.relays, self.zaps):
+                    post.title += " (edited)"
+                    post.save()
+        self.assertEqual(len(callbacks), 3)
+        update.assert_called_once()
+        self.assertEqual(update.call_args.args[0], {('post', self.orm.pk), ('post', self.relays.pk),
+                                                    ('post', self.zaps.pk)})
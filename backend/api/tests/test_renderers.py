@@ -0,0 +1,108 @@
+# backend/api/tests/test_renderers.py
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from api.models import Post, Project, Tag
+from api.renderers import FastJSONRenderer
+
+UTC = datetime.timezone.utc
+
+
+def render_both(data):
+    return JSONRenderer().render(data), FastJSONRenderer().render(data)
+
+
+class RendererCompatibilityTests(SimpleTestCase):
+    PAYLOADS = {
+        'empty': [],
+        'scalars': [0, -1, 2 ** 53 + 1, True, False, None, "", 0.5, -0.0, 100.0, 1e16, 1e300, 5e-324],
+        'text': {'ascii': "plain", 'unicode': "naïve 日本語 🚀", 'escapes': "quote \" backslash \\ tab \t nl \n",
+                 'separators': "line paragraph ", 'control': "\x00\x1f"},
+        'non_str_keys': {1: "int", 2.5: "float", None: "none", True: "bool"},
+        'drf_types': {
+            'aware': datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=UTC),
+            'naive': datetime.datetime(2024, 1, 2, 3, 4, 5),
+            'date': datetime.date(2024, 1, 2),
+            'time': datetime.time(3, 4, 5, 123456),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'decimal': Decimal('1.10'),
+            'tuple': (1, 2),
+        },
+        'related': [
+            {'type': 'post', 'id': 7, 'title': "Nostr relays", 'score': 0.8165},
+            {'type': 'project', 'id': 3, 'title': "Tip jar", 'score': 0.1},
+            {'type': 'post', 'id': 9, 'title': "Tiny", 'score': 0.0001},
+        ],
+    }
+
+    def test_representative_payloads_parse_the_same(self):
+        for name, data in self.PAYLOADS.items():
+            with self.subTest(payload=name):
+                expected, actual = render_both(data)
+                self.assertEqual(json.loads(actual), json.loads(expected))
+                # None of these have floats under 1e-4, so the bytes match too.
+                self.assertEqual(actual, expected)
+
+    def test_small_floats_differ_in_format_only(self):
+        data = {'scores': [1e-05, 2.5e-05, 1e-07, 0.00012345]}
+        expected, actual = render_both(data)
+        self.assertEqual(expected, b'{"scores":[1e-05,2.5e-05,1e-07,0.00012345]}')
+        self.assertEqual(actual, b'{"scores":[0.00001,0.000025,1e-7,0.00012345]}')
+        self.assertEqual(json.loads(actual), json.loads(expected))
+
+    def test_non_finite_floats_are_rejected_like_the_stdlib_renderer(self):
+        for value in (float('nan'), float('inf'), float('-inf')):
+            data = {'nested': [{'score': value}], 'null': None}
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render(data)
+                with self.assertRaises(ValueError):
+                    FastJSONRenderer().render(data)
+
+    def test_non_finite_floats_without_strict_json(self):
+        stdlib, fast = JSONRenderer(), FastJSONRenderer()
+        stdlib.strict = fast.strict = False
+        data = {'values': [float('nan'), float('inf'), None, 1.5]}
+        self.assertEqual(fast.render(data), stdlib.render(data))
+        self.assertEqual(fast.render(data), b'{"values":[NaN,Infinity,null,1.5]}')
+
+    def test_indented_output_uses_the_stdlib_path(self):
+        data = {'a': [1, {'b': 1e-05}]}
+        media_type = 'application/json; indent=2'
+        self.assertEqual(FastJSONRenderer().render(data, media_type), JSONRenderer().render(data, media_type))
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class EndpointCompatibilityTests(TestCase):
+    """The API's own payloads, rendered by the live view, against DRF's renderer on the same data."""
+
+    def setUp(self):
+        cache.clear()
+        tag = Tag.objects.create(name="Django", slug="django")
+        project = self.project = Project.objects.create(title="Portfolio ✨", description="Line break")
+        project.tags.add(tag)
+        post = Post.objects.create(title="Hello", slug="hello", content="# Hi\n\nText.", is_published=True)
+        post.tags.add(tag)
+        Project.objects.filter(pk=project.pk).update(related=[
+            {'type': 'post', 'id': post.pk, 'title': "Hello", 'score': 0.8165},
+        ])
+        Post.objects.filter(pk=post.pk).update(related=[
+            {'type': 'project', 'id': project.pk, 'title': "Portfolio ✨", 'score': 0.8165},
+        ])
+
+    def test_endpoints(self):
+        for url in ('/api/projects/', f'/api/projects/{self.project.pk}/', '/api/posts/', '/api/posts/hello/',
+                    '/api/tags/?with_counts=1', '/api/tags/'):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, JSONRenderer().render(response.data))
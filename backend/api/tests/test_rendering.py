@@ -0,0 +1,100 @@
+# backend/api/tests/test_rendering.py
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from api.models import Post
+from api.rendering import make_excerpt, reading_time_minutes, render_markdown
+
+
+class SanitizationTests(SimpleTestCase):
+    def test_raw_html_is_escaped(self):
+        html = render_markdown("Hi <script>alert(1)</script>\n\n<img src=x onerror=alert(1)>").html
+        self.assertNotIn("<script", html)
+        self.assertNotIn("<img", html)
+        self.assertIn("&lt;script&gt;alert(1)&lt;/script&gt;", html)
+
+    def test_script_urls_are_not_linked(self):
+        for url in ("javascript:alert(1)", "JavaScript:alert(1)", "vbscript:msgbox(1)", "file:///etc/passwd"):
+            with self.subTest(url=url):
+                html = render_markdown(f"[click]({url}) ![img]({url})").html
+                self.assertNotIn("href=", html)
+                self.assertNotIn("src=", html)
+
+    def test_safe_links_are_kept(self):
+        html = render_markdown("[docs](https://docs.djangoproject.com/) and [top](#intro)").html
+        self.assertIn('<a href="https://docs.djangoproject.com/">docs</a>', html)
+        self.assertIn('<a href="#intro">top</a>', html)
+
+
+class TableOfContentsTests(SimpleTestCase):
+    def test_headings_get_ids_and_toc_entries(self):
+        rendered = render_markdown("# Intro\n\ntext\n\n## Setup `pip`\n\n### Notes\n\n## Setup pip\n\n## ???\n")
+        self.assertEqual(rendered.toc, [
+            {'level': 1, 'title': "Intro", 'id': "intro"},
+            {'level': 2, 'title': "Setup pip", 'id': "setup-pip"},
+            {'level': 3, 'title': "Notes", 'id': "notes"},
+            {'level': 2, 'title': "Setup pip", 'id': "setup-pip-2"},
+            {'level': 2, 'title': "???", 'id': "section"},
+        ])
+        self.assertIn('<h1 id="intro">Intro</h1>', rendered.html)
+        self.assertIn('<h2 id="setup-pip-2">Setup pip</h2>', rendered.html)
+
+    def test_no_headings(self):
+        self.assertEqual(render_markdown("Just a paragraph.").toc, [])
+
+
+class PlainTextTests(SimpleTestCase):
+    def test_plain_text_drops_syntax_and_code_blocks(self):
+        rendered = render_markdown("# Title\n\nSome **bold** and `code`.\n\n```python\nprint('skipped')\n```\n")
+        self.assertEqual(rendered.plain_text, "Title Some bold and code.")
+        self.assertEqual(rendered.word_count, 5)
+
+    def test_excerpt_cuts_at_a_word_boundary(self):
+        self.assertEqual(make_excerpt("short text"), "short text")
+        self.assertEqual(make_excerpt("one two three, four", length=15), "one two three…")
+
+    def test_reading_time(self):
+        self.assertEqual(reading_time_minutes(""), 1)
+        self.assertEqual(reading_time_minutes("word " * 201), 2)
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class PostRenderingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.post = Post.objects.create(
+            title="Hello", slug="hello", is_published=True,
+            content="# Hello\n\nFirst version with <script>x</script>.",
+        )
+
+    def test_save_renders_the_stored_columns(self):
+        self.assertEqual(self.post.toc, [{'level': 1, 'title': "Hello", 'id': "hello"}])
+        self.assertIn('<h1 id="hello">Hello</h1>', self.post.content_html)
+        self.assertNotIn("<script", self.post.content_html)
+        self.assertEqual(self.post.excerpt, "Hello First version with <script>x</script>.")
+        self.assertEqual(self.post.reading_time, 1)
+
+    def test_save_re_renders_edited_content(self):
+        self.post.content = "## Part one\n\n" + "word " * 450 + "\n\n## Part two\n"
+        self.post.save()
+        self.post.refresh_from_db()
+
+        self.assertEqual([entry['id'] for entry in self.post.toc], ["part-one", "part-two"])
+        self.assertNotIn("First version", self.post.content_html)
+        self.assertEqual(self.post.word_count, 454)
+        self.assertEqual(self.post.reading_time, 3)
+        self.assertTrue(self.post.excerpt.startswith("Part one word word"))
+        self.assertTrue(self.post.excerpt.endswith("…"))
+
+    def test_detail_serves_the_rendered_html_and_the_source(self):
+        response = self.client.get('/api/posts/hello/')
+        self.assertEqual(response.status_code, 200)
+        post = response.json()
+        self.assertEqual(post['content_html'], self.post.content_html)
+        self.assertEqual(post['toc'], self.post.toc)
+        self.assertEqual(post['content'], self.post.content)
+
+    def test_list_stays_slim(self):
+        post = self.client.get('/api/posts/').json()['results'][0]
+        self.assertEqual(post['excerpt'], self.post.excerpt)
+        self.assertFalse({'content', 'content_html', 'toc'} & set(post))
@@ -0,0 +1,90 @@
+# backend/api/tests/test_response_cache.py
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from api.models import Post, Project, Tag
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'], SECURE_SSL_REDIRECT=False)
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.django = Tag.objects.create(name="Django", slug="django")
+        self.nostr = Tag.objects.create(name="Nostr", slug="nostr")
+        self.projects = [Project.objects.create(title=f"Project {i}", description="x") for i in range(5)]
+        self.projects[0].tags.add(self.django)
+        self.projects[1].tags.add(self.nostr)
+
+    def get(self, url, expected_cache):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Cache'], expected_cache)
+        return response
+
+    def test_second_request_is_a_hit(self):
+        miss = self.get('/api/projects/', 'MISS')
+        # A hit skips the queries, the serializer and the renderer.
+        with self.assertNumQueries(0):
+            hit = self.get('/api/projects/', 'HIT')
+        self.assertEqual(hit.content, miss.content)
+        self.assertEqual(hit['Content-Type'], miss['Content-Type'])
+        self.assertEqual(hit['ETag'], miss['ETag'])
+
+    def test_detail_is_cached(self):
+        Post.objects.create(title="Hello", slug="hello", content="Hi", is_published=True)
+        self.get('/api/posts/hello/', 'MISS')
+        self.get('/api/posts/hello/', 'HIT')
+
+    def test_save_invalidates(self):
+        self.get('/api/projects/', 'MISS')
+        project = self.projects[-1]
+        project.title = "Renamed"
+        project.save()
+
+        response = self.get('/api/projects/', 'MISS')
+        self.assertEqual(response.json()['results'][0]['title'], "Renamed")
+        self.get('/api/projects/', 'HIT')
+
+    def test_m2m_change_invalidates(self):
+        self.get('/api/projects/', 'MISS')
+        self.projects[-1].tags.add(self.nostr)
+
+        response = self.get('/api/projects/', 'MISS')
+        self.assertEqual([tag['slug'] for tag in response.json()['results'][0]['tags']], ['nostr'])
+
+    def test_tag_rename_invalidates_nested_tags(self):
+        self.get('/api/projects/?tags=django', 'MISS')
+        self.django.name = "Django REST"
+        self.django.save()
+
+        response = self.get('/api/projects/?tags=django', 'MISS')
+        self.assertEqual(response.json()['results'][0]['tags'][0]['name'], "Django REST")
+
+    def test_unrelated_change_keeps_the_entry(self):
+        self.get('/api/projects/', 'MISS')
+        Post.objects.create(title="Hello", slug="hello", content="Hi", is_published=True)
+        self.get('/api/projects/', 'HIT')
+
+    def test_query_strings_do_not_share_an_entry(self):
+        django = self.get('/api/projects/?tags=django', 'MISS')
+        nostr = self.get('/api/projects/?tags=nostr', 'MISS')
+        self.assertEqual([p['title'] for p in django.json()['results']], ["Project 0"])
+        self.assertEqual([p['title'] for p in nostr.json()['results']], ["Project 1"])
+        self.get('/api/projects/?tags=django', 'HIT')
+        # The same parameters in another order are the same entry.
+        self.get('/api/projects/?page_size=2&tags=nostr', 'MISS')
+        self.get('/api/projects/?tags=nostr&page_size=2', 'HIT')
+
+    def test_cursor_pages_do_not_share_an_entry(self):
+        first = self.get('/api/projects/?page_size=2', 'MISS').json()
+        second = self.get(first['next'], 'MISS').json()
+        self.assertNotEqual([p['id'] for p in first['results']], [p['id'] for p in second['results']])
+        self.assertEqual(self.get(first['next'], 'HIT').json(), second)
+
+    def test_browsable_api_is_never_cached(self):
+        for _ in range(2):
+            response = self.client.get('/api/projects/', HTTP_ACCEPT='text/html')
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('X-Cache', response)
+        # ...and doesn't populate the JSON entry either.
+        self.get('/api/projects/', 'MISS')
@@ -0,0 +1,64 @@
+# backend/api/tests/test_snapshot.py
+import gzip
+import json
+import tempfile
+
+from django.test import TestCase, override_settings
+
+from api.models import Post, Project, Tag
+from api.snapshot import SNAPSHOT_URL, export_snapshot
+
+
+def body(response):
+    content = b"".join(response.streaming_content)
+    return gzip.decompress(content) if response.get('Content-Encoding') == 'gzip' else content
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+    ALLOWED_HOSTS=['testserver'],
+    SECURE_SSL_REDIRECT=False,
+)
+class SnapshotTests(TestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        settings = override_settings(API_SNAPSHOT_ROOT=root.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        tag = Tag.objects.create(name="Python", slug="python")
+        Project.objects.create(title="Portfolio", description="This site.").tags.add(tag)
+        Post.objects.create(title="Hello", slug="hello", content="Hi.", is_published=True).tags.add(tag)
+        export_snapshot()
+
+    def manifest(self, **headers):
+        return self.client.get(f"{SNAPSHOT_URL}manifest.json", **headers)
+
+    def test_files_match_the_live_api(self):
+        manifest = json.loads(body(self.manifest()))
+        self.assertIn('/api/posts/hello/', manifest)
+        for api_path, url in manifest.items():
+            with self.subTest(api_path=api_path):
+                response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response['Content-Encoding'], 'gzip')
+                self.assertIn('immutable', response['Cache-Control'])
+                self.assertEqual(json.loads(body(response)), self.client.get(api_path).json())
+
+    def test_manifest_is_revalidated_and_picks_up_a_re_export(self):
+        first = self.manifest()
+        self.assertEqual(first['Cache-Control'], 'public, no-cache')
+        self.assertEqual(self.manifest(HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        Project.objects.create(title="Another", description="New.")
+        export_snapshot()
+        second = self.manifest(HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second['ETag'], first['ETag'])
+        projects_url = json.loads(body(second))['/api/projects/']
+        self.assertEqual(len(json.loads(body(self.client.get(projects_url)))['results']), 2)
+
+    def test_only_snapshot_names_are_served(self):
+        for name in ('../db.sqlite3', 'projects.json', 'projects.0123456789ab.json.gz', 'projects.0123456789ab.json'):
+            with self.subTest(name=name):
+                self.assertEqual(self.client.get(f"{SNAPSHOT_URL}{name}").status_code, 404)
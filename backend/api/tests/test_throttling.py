@@ -0,0 +1,63 @@
+# backend/api/tests/test_throttling.py
+import threading
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from api.throttling import GCRAThrottle, gcra
+
+
+class BurstThrottle(GCRAThrottle):
+    scope = 'test'
+    rate = '5/min'
+
+class ThrottledView(APIView):
+    throttle_classes = [BurstThrottle]
+
+    def get(self, request):
+        return Response({'ok': True})
+
+
+class GCRATests(SimpleTestCase):
+    key = 'throttle:test:127.0.0.1'
+
+    def setUp(self):
+        cache.delete(self.key)
+
+    def tearDown(self):
+        cache.delete(self.key)
+
+    def test_concurrent_requests_never_exceed_the_burst(self):
+        # 50 threads race for 5 slots; the check-and-set must let exactly 5 through.
+        threads, barrier, results = 50, threading.Barrier(50), []
+
+        def hit():
+            barrier.wait()
+            results.append(gcra(self.key, limit=5, period=60)[0])
+
+        workers = [threading.Thread(target=hit) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(results.count(True), 5)
+
+    def test_rejection_reports_the_wait(self):
+        for _ in range(5):
+            self.assertTrue(gcra(self.key, limit=5, period=60)[0])
+        allowed, wait = gcra(self.key, limit=5, period=60)
+        self.assertFalse(allowed)
+        # One slot frees every period / limit = 12 s.
+        self.assertAlmostEqual(wait, 12, delta=1)
+
+    def test_view_answers_429_with_retry_after(self):
+        view = ThrottledView.as_view()
+        factory = APIRequestFactory()
+        statuses = [view(factory.get('/', REMOTE_ADDR='127.0.0.1')).status_code for _ in range(5)]
+        self.assertEqual(statuses, [200] * 5)
+        response = view(factory.get('/', REMOTE_ADDR='127.0.0.1'))
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
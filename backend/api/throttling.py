@@ -0,0 +1,124 @@
+# backend/api/throttling.py
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from rest_framework.throttling import SimpleRateThrottle
+
+logger = logging.getLogger('api')
+
+# GCRA (generic cell rate algorithm): each client key stores a single number,
+# its "theoretical arrival time" (TAT). A rate of N requests per period allows
+# a burst of N and then one request every period/N, i.e. a smooth sliding
+# window. Reading, checking and updating the TAT happen in one Lua script, so
+# parallel requests on different workers can't both see the last free slot.
+# The clock is Redis' own, so worker clock skew doesn't matter either.
+#
+#   KEYS[1]  client key
+#   ARGV[1]  emission interval (period / N), ms
+#   ARGV[2]  period, ms (the burst tolerance is period - interval)
+# Returns {allowed (1/0), ms until the next request would be allowed}.
+GCRA_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now_ms)
+if tat < now_ms then tat = now_ms end
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if allow_at > now_ms then
+    return {0, allow_at - now_ms}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now_ms)
+return {1, 0}
+"""
+KEY_PREFIX = "throttle"
+
+_script = None
+_script_lock = threading.Lock()
+# Serializes the in-process fallback (LocMem has no atomic compare-and-set).
+_local_lock = threading.Lock()
+
+def _redis_script():
+    """The registered GCRA script, or None when the cache isn't Redis (local development)."""
+    global _script
+    if _script is None:
+        with _script_lock:
+            if _script is None:
+                try:
+                    from django_redis import get_redis_connection
+                    _script = get_redis_connection('default').register_script(GCRA_SCRIPT)
+                except (ImportError, NotImplementedError):
+                    _script = False
+    return _script or None
+
+def gcra(key: str, limit: int, period: float) -> tuple[bool, float]:
+    """
+    Consumes one request from `key`'s allowance of `limit` per `period`
+    seconds. Returns (allowed, seconds until the next request is allowed).
+    """
+    interval_ms = max(1, round(period * 1000 / limit))
+    period_ms = round(period * 1000)
+    script = _redis_script()
+    if script is not None:
+        allowed, retry_ms = script(keys=[key], args=[interval_ms, period_ms])
+        return bool(allowed), int(retry_ms) / 1000
+
+    # Same algorithm against the per-process cache; only atomic within this process.
+    with _local_lock:
+        now_ms = time.time() * 1000
+        tat = max(cache.get(key, now_ms), now_ms)
+        allow_at = tat + interval_ms - period_ms
+        if allow_at > now_ms:
+            return False, (allow_at - now_ms) / 1000
+        cache.set(key, tat + interval_ms, timeout=(tat + interval_ms - now_ms) / 1000)
+        return True, 0.0
+
+# ==============================================================================
+# THROTTLES
+# ==============================================================================
+
+class GCRAThrottle(SimpleRateThrottle):
+    """
+    Per-IP limit for anonymous requests, enforced atomically in Redis with
+    O(1) state per client. The rate comes from
+    REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'][scope], like DRF's own throttles.
+    If Redis is unreachable the request is let through: a rate limiter outage
+    shouldn't take the endpoints down with it.
+    """
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None  # Only anonymous requests are throttled
+        return f"{KEY_PREFIX}:{self.scope}:{self.get_ident(request)}"
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+        try:
+            allowed, self._wait = gcra(key, self.num_requests, self.duration)
+        except Exception as e:
+            logger.warning("Rate limiter unavailable, allowing request: %s", e)
+            return True
+        return allowed
+
+    def wait(self):
+        return getattr(self, '_wait', None)
+
+
+class ContactFormThrottle(GCRAThrottle):
+    scope = 'contact'
+
+class NostrContactThrottle(GCRAThrottle):
+    scope = 'nostr_contact'
+
+class CareerChatThrottle(GCRAThrottle):
+    scope = 'chat'
+
+class SkillMatchThrottle(GCRAThrottle):
+    scope = 'skill_match'
@@ -9,15 +9,22 @@ from .views import (
     TagViewSet,
     github_stats,
     github_contributions,
+    github_contributions_svg,
     nostr_profile,
     latest_note,
     bitcoin_address,
     mempool_stats,
+    mempool_stats_stream,
     skill_match_view,
     career_chat,
     search_view,
     contact_form_submit,
     nostr_contact_submit,
+    bootstrap,
+    cache_stats_view,
+    metrics_view,
+    project_image,
+    api_snapshot_file,
 )
 
 router = DefaultRouter()
@@ -30,16 +37,23 @@ router.register(r'tags', TagViewSet)
 urlpatterns = [
     path('', include(router.urls)),
     path('search/', search_view, name='search'),
+    path('bootstrap/', bootstrap, name='bootstrap'),
     path('github-stats/', github_stats, name='github-stats'),
     path('github-contributions/', github_contributions, name='github-contributions'),
+    path('github-contributions.svg', github_contributions_svg, name='github-contributions-svg'),
     path('nostr-profile/', nostr_profile, name='nostr-profile'),
     path('latest-note/', latest_note, name='latest-note'),
     path('mempool-stats/', mempool_stats, name='mempool-stats'),
+    path('mempool-stats/stream/', mempool_stats_stream, name='mempool-stats-stream'),
     path('bitcoin-address/', bitcoin_address, name='bitcoin-address'),
     path('skill-match/', skill_match_view, name='skill-match'),
     path('chat/', career_chat, name='career-chat'),  
     path('contact/', contact_form_submit, name='contact-submit'),
     path('nostr-contact/', nostr_contact_submit, name='nostr-contact-submit'),
+    path('cache-stats/', cache_stats_view, name='cache-stats'),
+    path('metrics', metrics_view, name='metrics'),
+    path('project-images/<str:name>', project_image, name='project-image'),
+    path('snapshot/<path:name>', api_snapshot_file, name='api-snapshot'),
 
   
 ]
\ No newline at end of file
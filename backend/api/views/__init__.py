@@ -0,0 +1,24 @@
+# backend/api/views/__init__.py
+#
+# The views are split per integration so that a worker serving /api/projects/
+# never pays for the Bitcoin, Nostr or Groq stacks. Each module keeps its heavy
+# third-party imports (requests, pynostr, bitcoinlib, groq, postgres search)
+# inside the functions that need them, so they load on first use.
+from .content import (
+    TagViewSet,
+    WorkExperienceViewSet,
+    ProjectViewSet,
+    CertificationViewSet,
+    PostViewSet,
+    search_view,
+)
+from .github import github_stats, github_contributions, github_contributions_svg
+from .nostr import nostr_profile, latest_note
+from .bitcoin import bitcoin_address
+from .mempool import mempool_stats, mempool_stats_stream
+from .chat import skill_match_view, career_chat
+from .bootstrap import bootstrap
+from .ops import cache_stats_view, metrics_view
+from .images import project_image
+from .snapshot import api_snapshot_file
+from .contact import ContactFormThrottle, contact_form_submit, nostr_contact_submit
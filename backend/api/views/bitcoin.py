@@ -0,0 +1,31 @@
+# backend/api/views/bitcoin.py
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+
+from ..bitcoin import assign_address
+from ..metrics import record_cache_lookup
+
+@api_view(['GET'])
+def bitcoin_address(request):
+    """
+    Hands each visitor an address from the pre-derived pool (a fresh one
+    while the BIP44 gap limit allows, see api/bitcoin.py). The same visitor
+    keeps getting their address back until the cache entry expires.
+    """
+    visitor = hashlib.sha256(BaseThrottle().get_ident(request).encode()).hexdigest()[:32]
+    cache_key = f"bitcoin_address_{visitor}"
+    cached_data = cache.get(cache_key)
+    record_cache_lookup('bitcoin', bool(cached_data))
+    if cached_data: return Response(cached_data)
+    address = assign_address()
+    if address:
+        address_data = {'address': address}
+        cache.set(cache_key, address_data, timeout=settings.BITCOIN_VISITOR_ADDRESS_TIMEOUT)
+        return Response(address_data)
+    return Response({'error': 'Failed to generate Bitcoin address.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,169 @@
+# backend/api/views/bootstrap.py
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from ..content_version import get_content_versions
+from .content import CertificationViewSet, ProjectViewSet, TagViewSet, WorkExperienceViewSet
+from .github import get_github_contributions, get_github_stats
+from .mempool import get_mempool_stats
+from .nostr import get_latest_note, get_nostr_profile
+
+logger = logging.getLogger('api')
+
+BOOTSTRAP_CACHE_PREFIX = "bootstrap"
+# Integration data expires on its own schedule (mempool every 60 s), so a
+# snapshot is never reused for longer than the shortest of those. One with a
+# failed or timed-out section is rebuilt sooner, to pick the section up once
+# its upstream answers.
+BOOTSTRAP_SNAPSHOT_TIMEOUT = 60
+BOOTSTRAP_ERROR_SNAPSHOT_TIMEOUT = 10
+# How long a request waits for the integration sections, all together. A
+# section still running after that is reported as unavailable; it keeps
+# running and fills its own cache for the next snapshot.
+BOOTSTRAP_SECTION_TIMEOUT_SECONDS = 3.0
+
+# ==============================================================================
+# SECTIONS
+# ==============================================================================
+
+def _viewset_list(viewset_class):
+    """Serializes a content viewset's full queryset, exactly as its list endpoint would."""
+    return list(viewset_class.serializer_class(viewset_class.queryset.all(), many=True).data)
+
+class SectionNotConfigured(LookupError):
+    """An optional integration whose setting is unset: null in the snapshot, but not an error."""
+
+def _require_npub():
+    npub = os.getenv('NOSTR_NPUB')
+    if not npub:
+        raise SectionNotConfigured("NOSTR_NPUB is not set.")
+    return npub
+
+# section name -> (builder, content versions it depends on)
+# Content comes from the database and is built in the request thread.
+CONTENT_SECTIONS = {
+    'projects': (lambda: _viewset_list(ProjectViewSet), ProjectViewSet.content_versions),
+    'work_experience': (lambda: _viewset_list(WorkExperienceViewSet), WorkExperienceViewSet.content_versions),
+    'certifications': (lambda: _viewset_list(CertificationViewSet), CertificationViewSet.content_versions),
+    'tags': (lambda: _viewset_list(TagViewSet), TagViewSet.content_versions),
+}
+# Integrations may call out to their upstream (cache + HTTP/relays only, no
+# database), so they run concurrently in INTEGRATION_POOL.
+INTEGRATION_SECTIONS = {
+    'github_stats': (get_github_stats, ('github_stats',)),
+    'github_contributions': (get_github_contributions, ('github_contributions',)),
+    'nostr_profile': (lambda: get_nostr_profile(_require_npub()), ('nostr_profile',)),
+    'latest_note': (lambda: get_latest_note(_require_npub()), ('latest_note',)),
+    'mempool_stats': (get_mempool_stats, ('mempool_stats',)),
+}
+BOOTSTRAP_SECTIONS = {**CONTENT_SECTIONS, **INTEGRATION_SECTIONS}
+BOOTSTRAP_VERSIONS = sorted({name for _, names in BOOTSTRAP_SECTIONS.values() for name in names})
+
+# One thread per integration is enough: a section whose previous run is still
+# in flight (e.g. a slow relay after a timed-out request) is joined, not started twice.
+INTEGRATION_POOL = ThreadPoolExecutor(max_workers=len(INTEGRATION_SECTIONS), thread_name_prefix="bootstrap")
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+_reported_unconfigured = set()
+
+def _submit_integration(name):
+    with _in_flight_lock:
+        future = _in_flight.get(name)
+        if future is None or future.done():
+            future = INTEGRATION_POOL.submit(INTEGRATION_SECTIONS[name][0])
+            _in_flight[name] = future
+    return future
+
+def bootstrap_fingerprint():
+    versions = get_content_versions(*BOOTSTRAP_VERSIONS)
+    fingerprint = "|".join(f"{name}:{versions[name]['token']}" for name in BOOTSTRAP_VERSIONS)
+    return hashlib.sha256(fingerprint.encode()).hexdigest()[:32]
+
+def snapshot_etag(fingerprint, snapshot):
+    # The failed sections are part of the ETag: a snapshot missing a section
+    # never validates a client's complete copy, or the other way round.
+    errors = ",".join(sorted(snapshot['errors']))
+    return quote_etag(hashlib.sha256(f"{fingerprint}|errors:{errors}".encode()).hexdigest()[:32])
+
+def _record(snapshot, name, builder):
+    try:
+        snapshot[name] = builder()
+        if snapshot[name] is None:
+            snapshot['errors'][name] = "Unavailable."
+    except SectionNotConfigured as e:
+        # Left out of `errors`, so it neither shortens the snapshot's lifetime nor changes its ETag.
+        if name not in _reported_unconfigured:
+            _reported_unconfigured.add(name)
+            logger.info("Bootstrap section '%s' is not configured: %s", name, e)
+        snapshot[name] = None
+    except Exception:
+        logger.exception("Bootstrap section '%s' failed", name)
+        snapshot[name] = None
+        snapshot['errors'][name] = "Unavailable."
+
+def build_bootstrap_snapshot(timeout=BOOTSTRAP_SECTION_TIMEOUT_SECONDS):
+    """
+    Assembles every homepage section: the integrations concurrently, under
+    one shared `timeout`, while the content sections are serialized. A
+    failing, empty or timed-out section is reported in `errors` and left as
+    null instead of failing the whole snapshot; an unconfigured one is just
+    null.
+    """
+    futures = {name: _submit_integration(name) for name in INTEGRATION_SECTIONS}
+    snapshot = {'errors': {}}
+    for name, (builder, _) in CONTENT_SECTIONS.items():
+        _record(snapshot, name, builder)
+
+    wait(futures.values(), timeout=timeout)
+    for name, future in futures.items():
+        if future.done():
+            _record(snapshot, name, future.result)
+        else:
+            logger.warning("Bootstrap section '%s' timed out after %ss.", name, timeout)
+            snapshot[name] = None
+            snapshot['errors'][name] = "Timed out."
+    # Keep the sections in their declared order, whatever finished first.
+    return {'errors': snapshot['errors'], **{name: snapshot[name] for name in BOOTSTRAP_SECTIONS}}
+
+# ==============================================================================
+# API VIEW
+# ==============================================================================
+
+@api_view(['GET'])
+def bootstrap(request):
+    """
+    Everything above the fold on the homepage in one round trip. Snapshots
+    are cached per version fingerprint of all the content and integration
+    data in them, for at most BOOTSTRAP_SNAPSHOT_TIMEOUT. A conditional GET is
+    only answered with 304 against a cached, still fresh snapshot: once it
+    expires the next request rebuilds it, which is what refreshes the
+    integrations behind it.
+    """
+    fingerprint = bootstrap_fingerprint()
+    cached = cache.get(f"{BOOTSTRAP_CACHE_PREFIX}:{fingerprint}")
+    if cached is None:
+        snapshot = build_bootstrap_snapshot()
+        # Building may have refreshed integrations (bumping their versions), so re-derive the fingerprint.
+        fingerprint = bootstrap_fingerprint()
+        etag = snapshot_etag(fingerprint, snapshot)
+        timeout = BOOTSTRAP_ERROR_SNAPSHOT_TIMEOUT if snapshot['errors'] else BOOTSTRAP_SNAPSHOT_TIMEOUT
+        cache.set(f"{BOOTSTRAP_CACHE_PREFIX}:{fingerprint}", (etag, snapshot), timeout=timeout)
+    else:
+        etag, snapshot = cached
+
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        return not_modified
+    response = Response(snapshot)
+    response['ETag'] = etag
+    return response
@@ -0,0 +1,218 @@
+# backend/api/views/chat.py
+import hashlib
+import logging
+import os
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import api_view, throttle_classes
+from rest_framework.response import Response
+
+from ..content_version import get_content_versions
+from ..embeddings import EmbeddingError, get_embedding_backend
+from ..intents import get_intent_router
+from ..metrics import CHAT_ROUTES, UPSTREAM_ERRORS, LLMStreamTimer, record_cache_lookup
+from ..models import Project, Certification, Post, WorkExperience
+from ..throttling import CareerChatThrottle, SkillMatchThrottle
+
+logger = logging.getLogger('api')
+
+# ==============================================================================
+# AI SKILL MATCHER
+# ==============================================================================
+
+def project_documents():
+    """(id, text) per project, as embedded by the skill matcher."""
+    projects = Project.objects.prefetch_related('tags').order_by('id')
+    return [(p.id, f"{p.title}. {p.description}. Technologies: {', '.join(tag.name for tag in p.tags.all())}")
+            for p in projects]
+
+@api_view(['POST'])
+@throttle_classes([SkillMatchThrottle])
+def skill_match_view(request):
+    """
+    Ranks projects by semantic similarity to the query, with the configured
+    embedding backend (EMBEDDING_BACKEND: the Hugging Face Inference API or a
+    local CPU model). Falls back to keyword matching if it is unavailable.
+    """
+    query = request.data.get('query', '')
+    if not query.strip():
+        return Response([])
+
+    documents = project_documents()
+    if not documents:
+        return Response([])
+    project_ids = [pid for pid, _ in documents]
+
+    try:
+        scores = get_embedding_backend().similarities(query, [text for _, text in documents])
+        results = sorted(zip(project_ids, scores), key=lambda item: item[1], reverse=True)
+        ranked_projects = [{'id': pid, 'score': float(score)} for pid, score in results if score > 0.3]
+        return Response(ranked_projects)
+
+    except EmbeddingError as e:
+        logger.warning("Error computing embeddings: %s", e)
+        keywords = query.lower().split()
+        matched_ids = set()
+        for pid, text in documents:
+            project_text = text.lower()
+            if any(keyword in project_text for keyword in keywords):
+                matched_ids.add(pid)
+        
+        fallback_projects = [{'id': pid, 'score': 1.0} for pid in matched_ids]
+        return Response(fallback_projects)
+
+# ==============================================================================
+# AI CAREER CHAT - FINAL PRODUCTION VERSION
+# ==============================================================================
+
+def build_knowledge_base():
+    """Builds the complete, topic-aware knowledge base with STANDARDIZED types."""
+    # This function is already well-structured and remains the same.
+    projects = Project.objects.prefetch_related('tags').all(); certifications = Certification.objects.all(); work_experiences = WorkExperience.objects.all(); posts = Post.objects.filter(is_published=True).only('title', 'slug', 'excerpt')
+    knowledge_base_docs = []
+    
+    # Standardized type: "experience"
+    for exp in work_experiences:
+        responsibilities = [f'"{r.strip()}"' for r in exp.responsibilities.split('\n') if r.strip()]
+        knowledge_base_docs.append(f"Type: experience. Title: \"{exp.job_title}\", Company: \"{exp.company_name}\", Date: \"{exp.start_date.strftime('%b %Y')} - {exp.end_date.strftime('%b %Y') if exp.end_date else 'Present'}\", Responsibilities: [{', '.join(responsibilities)}]")
+    
+    # Standardized type: "project"
+    for p in projects:
+        # Get all tag names for the current project
+        techs = [f'"{tag.name}"' for tag in p.tags.all()]
+        knowledge_base_docs.append(f"Type: project. Title: \"{p.title}\", Description: \"{p.description.replace('\"', '')}\", URL: \"{p.live_url}\", Repo_URL: \"{p.repository_url}\", Technologies: [{', '.join(techs)}]")
+    
+    # Standardized type: "certification"
+    for c in certifications:
+        knowledge_base_docs.append(f"Type: certification. Name: \"{c.name}\", Issuer: \"{c.issuing_organization}\", URL: \"{c.credential_url}\"")
+    
+    # Standardized type: "blog"
+    frontend_url = os.getenv('FRONTEND_URL', 'https://maximotodev.vercel.app')
+    for post in posts:
+        knowledge_base_docs.append(f"Type: blog. Title: \"{post.title}\", URL: \"{frontend_url}/blog/{post.slug}\", Excerpt: \"{post.excerpt.replace('\"', '')}\"")
+    
+    # Standardized type: "tech_stack"
+    # The tech stack consolidation now also reads from the tags.
+    all_technologies = set()
+    for project in projects:
+        # Use the related manager again
+        all_technologies.update([tag.name for tag in project.tags.all()])
+    if all_technologies:
+        knowledge_base_docs.append(f"Type: tech_stack. Technologies: [{', '.join([f'\"{tech}\"' for tech in sorted(list(all_technologies), key=str.lower)])}]")
+    # Topic-Specific Context
+    knowledge_base_docs.append("Type: topic. Name: Bitcoin. Details: Maximoto is a passionate Bitcoin maximalist with deep knowledge of its principles. This is demonstrated by his professional experience at Tribe BTC, a Bitcoin-focused company, and the inclusion of an on-chain Bitcoin tipping feature in his own portfolio project.")
+    knowledge_base_docs.append("Type: topic. Name: Linux. Details: Maximoto holds a 'Linux and SQL' certification from Coursera, which validates his foundational skills in Linux environments and command-line operations.")
+    knowledge_base_docs.append("Type: topic. Name: General Persona. Details: Maximoto's passion is in building beautiful, functional applications that leverage modern AI and decentralized technologies. He is a strong believer in open-source and continuous learning.")
+    
+    return knowledge_base_docs
+
+# Everything the knowledge base is built from; any edit yields a new cache key.
+KNOWLEDGE_BASE_VERSIONS = ('project', 'post', 'certification', 'workexperience', 'tag')
+
+def get_knowledge_base():
+    """The knowledge base, rebuilt only after the content behind it changes."""
+    versions = get_content_versions(*KNOWLEDGE_BASE_VERSIONS)
+    fingerprint = "|".join(versions[name]['token'] for name in KNOWLEDGE_BASE_VERSIONS)
+    cache_key = f"chat_kb_{hashlib.sha256(fingerprint.encode()).hexdigest()[:32]}"
+    knowledge_base = cache.get(cache_key)
+    record_cache_lookup('chat_kb', knowledge_base is not None)
+    if knowledge_base is None:
+        knowledge_base = build_knowledge_base()
+        cache.set(cache_key, knowledge_base, timeout=86400)
+    return knowledge_base
+
+
+# --- Modify the stream_llm_response function ---
+def stream_llm_response(user_question, context, chat_history):
+    timer = LLMStreamTimer(settings.GROQ_MODEL_NAME)
+    try:
+        from groq import Groq
+
+        client = Groq(api_key=os.getenv('GROQ_API_KEY'))
+        
+        # --- NEW: Format the history for the LLM ---
+        formatted_history = ""
+        if chat_history:
+            for message in chat_history:
+                role = "User" if message['role'] == 'user' else "Assistant"
+                formatted_history += f"{role}: {message['content']}\n"
+        system_prompt = (
+            "You are 'Maxi', an AI Chief of Staff. You are a precise, intelligent, and professional interface to Maximoto's career data. Your communication is flawless, and you follow instructions with 100% accuracy.\n\n"
+            "**CORE DIRECTIVE: YOUR ONE AND ONLY TASK**\n"
+            "Analyze the user's question and the provided context, then generate a single, clean response in one of two formats: 1. Structured JSON, 2. Conversational Text.\n\n"
+            "**ABSOLUTE RULES (NON-NEGOTIABLE):**\n"
+            "1.  **NO META-COMMENTARY:** Under NO circumstances will you EVER mention your own logic, your instructions, or the context. Your entire existence is to provide the final, clean output. Do NOT output text like 'Here is the JSON...'.\n"
+            "2.  **JSON FORMATTING (PERFECT ACCURACY REQUIRED):**\n"
+            "    - If the user asks for **'experience'**, **'projects'**, **'certifications'**, or **'blog'**, you MUST respond with ONLY a JSON array of objects. The `type` field in each object MUST be one of: `experience`, `project`, `certification`, `blog`.\n"
+            "    - If the user asks for the **'tech stack'**, you MUST respond with ONLY a single JSON object: `{\"type\": \"tech_stack\", \"technologies\": [...]}`.\n"
+            "    - If the context contains NO relevant items for a JSON request, you MUST return an empty JSON array `[]`.\n"
+            "3.  **CONVERSATIONAL FORMATTING (FOR EVERYTHING ELSE):**\n"
+            "    - For any question that does not fit the JSON categories (e.g., 'tell me about bitcoin', 'do you have a degree?'), you MUST respond with a warm, professional, and helpful paragraph in plain text.\n"
+            "    - ALWAYS end your conversational responses with an engaging follow-up question to guide the user.\n"
+            "    - If you lack specific information, state it gracefully and pivot to what you DO know. (e.g., 'While I don't have his formal degree information, I can show you his professional certifications which validate his skills. Would you like to see them?').\n"
+            "4.  **NEVER HALLUCINATE:** If the context does not contain the answer, you must say you do not have the information. Do not invent projects, skills, or experiences."
+        )
+        user_prompt = (
+            "**Previous Conversation History (for context):**\n"
+            f"{formatted_history}\n\n" # <-- Prepend the history
+            "**New Context (for answering the current question):**\n"
+            f"{context}\n\n"
+            f"**Current User Question:** {user_question}\n\n"
+            "Generate your response based on all of the above and your rules."
+        )
+        
+        stream = client.chat.completions.create(
+            messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+            model=settings.GROQ_MODEL_NAME,
+            stream=True,
+        )
+        for chunk in stream:
+            content = chunk.choices[0].delta.content
+            if content:
+                timer.token()
+                yield content
+        timer.finish()
+            
+    except Exception as e:
+        timer.finish('error')
+        UPSTREAM_ERRORS.labels('api.groq.com', type(e).__name__).inc()
+        logger.exception("Groq API error")
+        yield "{\"error\": \"I'm sorry, but the AI model is currently experiencing issues.\"}"
+
+
+
+@api_view(['POST'])
+@throttle_classes([CareerChatThrottle])
+def career_chat(request):
+    user_question = request.data.get('question', '').lower()
+    chat_history = request.data.get('history', [])
+    if not user_question: return Response({'error': 'Question is required.'}, status=400)
+    context = ""
+    knowledge_base = get_knowledge_base()
+
+    # Token-level keywords, then (local embedding backend only) intent prototypes; None means retrieval.
+    backend = get_embedding_backend()
+    route = get_intent_router().route(user_question, backend)
+    CHAT_ROUTES.labels(route.intent or 'none', route.method).inc()
+    detected_intent_type = route.intent
+
+    if detected_intent_type:
+        context = "\n---\n".join([doc for doc in knowledge_base if doc.lower().startswith(f"type: {detected_intent_type}")])
+    else:
+        # RAG 2.0: Keyword Filter + Semantic Search Fallback
+        query_keywords = set(user_question.split())
+        filtered_kb = [doc for doc in knowledge_base if any(kw in doc.lower() for kw in query_keywords)]
+        search_kb = filtered_kb if filtered_kb else knowledge_base
+        if not backend.configured: context = "Error: Semantic search is not configured."
+        else:
+            try:
+                scores = backend.similarities(user_question, search_kb)
+                scored_docs = sorted(zip(search_kb, scores), key=lambda item: item[1], reverse=True)
+                top_k_docs = [doc for doc, score in scored_docs[:3] if score > 0.3] # Use top 3 for more focused context
+                if top_k_docs: context = "\n---\n".join(top_k_docs)
+                else: context = "I searched my knowledge base but couldn't find specific details on that topic."
+            except Exception as e: context = f"Error during context retrieval: {e}"
+
+    return StreamingHttpResponse(stream_llm_response(user_question, context, chat_history), content_type="text/event-stream")
@@ -0,0 +1,17 @@
+# backend/api/views/constants.py
+import os
+
+# --- Configuration Constants ---
+GITHUB_USERNAME = "maximotodev"
+NOSTR_RELAYS = ["wss://relay.damus.io", "wss://relay.primal.net", "wss://nos.lol", "wss://relay.nostr.band"]
+CACHE_TIMEOUT_SECONDS = 3600  # 1 hour
+HUGGINGFACE_EMBEDDING_MODEL_URL = "https://api-inference.huggingface.co/models/sentence-transformers/all-MiniLM-L6-v2"
+GITHUB_API_URL = "https://api.github.com"
+MEMPOOL_API_URL = "https://mempool.space/api"
+
+# --- Upstream overrides (benchmarks/load_test.py points these at local stubs) ---
+if os.getenv('NOSTR_RELAYS'):
+    NOSTR_RELAYS = [relay.strip() for relay in os.environ['NOSTR_RELAYS'].split(',') if relay.strip()]
+HUGGINGFACE_EMBEDDING_MODEL_URL = os.getenv('HUGGINGFACE_EMBEDDING_MODEL_URL', HUGGINGFACE_EMBEDDING_MODEL_URL)
+GITHUB_API_URL = os.getenv('GITHUB_API_URL', GITHUB_API_URL).rstrip('/')
+MEMPOOL_API_URL = os.getenv('MEMPOOL_API_URL', MEMPOOL_API_URL).rstrip('/')
@@ -0,0 +1,111 @@
+# backend/api/views/contact.py
+import logging
+import os
+
+from rest_framework import status
+from rest_framework.decorators import api_view, throttle_classes
+from rest_framework.response import Response
+
+from ..serializers import ContactSubmissionSerializer
+# Per-IP limits for anonymous users; rates in REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'].
+from ..throttling import ContactFormThrottle, NostrContactThrottle
+
+logger = logging.getLogger('api')
+
+@api_view(['POST'])
+@throttle_classes([ContactFormThrottle])
+def contact_form_submit(request):
+    """
+    Handles the submission of the contact form, validates data,
+    and saves it to the database.
+    """
+    serializer = ContactSubmissionSerializer(data=request.data)
+    if serializer.is_valid():
+        serializer.save()
+        return Response({"success": "Message received. Thank you!"}, status=status.HTTP_201_CREATED)
+    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+@api_view(['POST'])
+@throttle_classes([NostrContactThrottle])
+def nostr_contact_submit(request):
+    """
+    Handles form submission and sends an encrypted Nostr DM with a robust,
+    feedback-oriented publishing strategy using run_sync().
+    """
+    from pynostr.relay_manager import RelayManager
+    from pynostr.event import Event, EventKind
+    from pynostr.key import PrivateKey, PublicKey
+
+    bot_nsec = os.getenv('NOSTR_BOT_NSEC')
+    my_npub = os.getenv('NOSTR_NPUB')
+
+    if not bot_nsec or not my_npub:
+        return Response({"error": "Nostr backend is not configured."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    serializer = ContactSubmissionSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    data = serializer.validated_data
+    cleartext_content = (
+        f"New message from portfolio contact form:\n\n"
+        f"From: {data['name']} ({data['email']})\n"
+        f"Subject: {data['subject']}\n\n"
+        f"Message:\n{data['message']}"
+    )
+
+    try:
+        bot_private_key = PrivateKey.from_nsec(bot_nsec)
+        my_public_key = PublicKey.from_npub(my_npub)
+
+        encrypted_content = bot_private_key.encrypt_message(
+            cleartext_content,
+            my_public_key.hex()
+        )
+
+        dm_event = Event(
+            pubkey=bot_private_key.public_key.hex(),
+            kind=EventKind.ENCRYPTED_DIRECT_MESSAGE,
+            content=encrypted_content,
+            tags=[['p', my_public_key.hex()]]
+        )
+        
+        dm_event.sign(bot_private_key.hex())
+
+        # --- THIS IS THE DEFINITIVE FIX ---
+
+        # 1. Use a more generous timeout for the entire operation.
+        relay_manager = RelayManager(timeout=8)
+        relay_manager.add_relay("wss://relay.damus.io")
+        relay_manager.add_relay("wss://relay.primal.net")
+        relay_manager.add_relay("wss://nos.lol")
+        relay_manager.add_relay("wss://relay.nostr.band")
+        
+        # 2. Publish the event. This queues it to be sent.
+        relay_manager.publish_event(dm_event)
+        logger.info("NOSTR DM: Event published to relays. Now waiting for OK notices...")
+
+        # 3. CRITICAL FIX: Use run_sync() to open connections, send the queued
+        # event, and actively LISTEN for responses for a few seconds.
+        relay_manager.run_sync()
+
+        # 4. Now that we have waited and listened, check the message pool.
+        events_accepted = 0
+        while relay_manager.message_pool.has_ok_notices():
+            ok_msg = relay_manager.message_pool.get_ok_notice()
+            if ok_msg.ok:
+                events_accepted += 1
+                # The log message is now more accurate
+                logger.info("NOSTR DM PUBLISH: OK notice received from %s", ok_msg.url)
+
+        relay_manager.close_all_relay_connections()
+
+        if events_accepted > 0:
+            logger.info("NOSTR DM SUCCESS: Message accepted by %d relay(s).", events_accepted)
+            return Response({"success": "Encrypted message sent via Nostr!"}, status=status.HTTP_200_OK)
+        else:
+            logger.warning("NOSTR DM FAILURE: Message was published, but no confirmation was received from any relays.")
+            return Response({"error": "Message was sent but not confirmed by any Nostr relays."}, status=status.HTTP_502_BAD_GATEWAY)
+
+    except Exception:
+        logger.exception("NOSTR DM CRITICAL ERROR")
+        return Response({"error": "A critical error occurred while sending the Nostr message."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,264 @@
+# backend/api/views/content.py
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import viewsets
+from rest_framework.decorators import api_view
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+
+from ..content_version import get_content_versions
+from ..facets import parse_tag_slugs, prefetch_tags, tag_facets, tagged_with_all
+from ..models import Project, Certification, Post, WorkExperience, Tag
+from ..pagination import PostCursorPagination, ProjectCursorPagination
+from ..renderers import FastJSONRenderer
+from ..serializers import ProjectSerializer, ProjectDetailSerializer, CertificationSerializer, PostSerializer, PostListSerializer, WorkExperienceSerializer, TagSerializer, ValuesRepresentation
+
+# ==============================================================================
+# CONDITIONAL GET & RESPONSE CACHE
+# ==============================================================================
+class ConditionalGetMixin:
+    """
+    Adds strong ETag / Last-Modified headers to list and detail responses and
+    answers a matching If-None-Match (or If-Modified-Since) with 304 before any
+    query or serializer runs. The validators come from the content versions of
+    `content_versions` (model names), which signals bump on every change.
+    """
+    content_versions = ()
+
+    def get_content_version_names(self, request):
+        return self.content_versions
+
+    def get_validators(self, request):
+        versions = get_content_versions(*self.get_content_version_names(request))
+        # Normalise the query string so ?a=1&b=2 and ?b=2&a=1 share one validator.
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        # The host is included because paginated responses embed absolute next/previous links.
+        parts = [request.get_host(), request.path, query, request.accepted_renderer.format]
+        parts += [f"{name}:{versions[name]['token']}" for name in sorted(versions)]
+        etag = quote_etag(hashlib.sha256("|".join(parts).encode()).hexdigest()[:32])
+        last_modified = max(version['last_modified'] for version in versions.values())
+        return etag, last_modified
+
+    def conditional_response(self, request, handler, *args, **kwargs):
+        etag, last_modified = self.get_validators(request)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = self.get_cached_response(request, etag)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def get_cached_response(self, request, etag):
+        return None
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
+
+class ResponseCacheMixin(ConditionalGetMixin):
+    """
+    Stores the rendered bytes of successful JSON list/detail responses under
+    their ETag. The ETag already covers the path, the normalised query string
+    and the content versions the view depends on, so a signal bumping any of
+    those versions makes the old entry unreachable; a hit skips the queries,
+    the serializer and the renderer entirely.
+    """
+    response_cache_prefix = "response"
+
+    def response_cache_key(self, etag):
+        return f"{self.response_cache_prefix}:" + etag.strip('"')
+
+    def get_cached_response(self, request, etag):
+        self._response_cache_key = None
+        if request.accepted_renderer.format != 'json':
+            # The browsable API embeds the logged-in user; never share it.
+            return None
+        self._response_cache_key = self.response_cache_key(etag)
+        cached = cache.get(self._response_cache_key)
+        if cached is None:
+            return None
+        response = HttpResponse(cached['content'], content_type=cached['content_type'])
+        response['X-Cache'] = 'HIT'
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        cache_key = getattr(self, '_response_cache_key', None)
+        if cache_key and isinstance(response, Response) and response.status_code == 200:
+            response.render()
+            cache.set(cache_key, {'content': response.content, 'content_type': response['Content-Type']},
+                      timeout=settings.RESPONSE_CACHE_TIMEOUT)
+            response['X-Cache'] = 'MISS'
+        return response
+
+_values_representations = {}
+
+class ValuesListMixin:
+    """
+    Builds JSON list responses from `.values()` rows (see ValuesRepresentation)
+    instead of model instances and ModelSerializer, and encodes every JSON
+    response with orjson. The output is byte-identical to the serializer path,
+    which the browsable API (and any view with `fast_list = False`) still uses.
+    """
+    fast_list = True
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def get_values_representation(self):
+        serializer_class = self.get_serializer_class()
+        if serializer_class not in _values_representations:
+            _values_representations[serializer_class] = ValuesRepresentation(serializer_class)
+        return _values_representations[serializer_class]
+
+    def list(self, request, *args, **kwargs):
+        if not self.fast_list or request.accepted_renderer.format != 'json':
+            return super().list(request, *args, **kwargs)
+        representation = self.get_values_representation()
+        # Tags come from ValuesRepresentation's own through-table query, so drop the prefetch.
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        queryset = queryset.values(*representation.value_fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(representation.represent(page))
+        return Response(representation.represent(queryset))
+
+# ==============================================================================
+# API VIEWS
+# ==============================================================================
+class TagViewSet(ResponseCacheMixin, ValuesListMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    A viewset for listing all available tags.
+
+    `?with_counts=1` adds each tag's project and published-post counts (a tag
+    cloud / filter facet); with `&tags=a,b` the counts are intersections with
+    the items already tagged a and b.
+    """
+    queryset = Tag.objects.all()
+    serializer_class = TagSerializer
+    content_versions = ('tag',)
+
+    def wants_counts(self, request):
+        return request.query_params.get('with_counts') in ('1', 'true')
+
+    def get_content_version_names(self, request):
+        # Counts change with the projects/posts (and their tag M2M rows), not just the tags.
+        if self.action == 'list' and self.wants_counts(request):
+            return ('tag', 'project', 'post')
+        return self.content_versions
+
+    def list(self, request, *args, **kwargs):
+        if not self.wants_counts(request):
+            return super().list(request, *args, **kwargs)
+        return self.conditional_response(request, self.facet_list)
+
+    def facet_list(self, request):
+        return Response(tag_facets(parse_tag_slugs(request.query_params)))
+
+
+class WorkExperienceViewSet(ResponseCacheMixin, ValuesListMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = WorkExperience.objects.all()
+    serializer_class = WorkExperienceSerializer
+    content_versions = ('workexperience',)
+
+class ProjectViewSet(ResponseCacheMixin, ValuesListMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = ProjectSerializer
+    content_versions = ('project',)
+    # Tags are nested in the representation; prefetch them in one query instead of one per project.
+    queryset = Project.objects.prefetch_related(prefetch_tags()).order_by('-id')
+    pagination_class = ProjectCursorPagination
+
+    # --- 2. ADD FILTERING LOGIC ---
+    def get_queryset(self):
+        """
+        Optionally filter the projects by a 'tag' query parameter, or by
+        several with `?tags=a,b` (projects carrying all of them).
+        """
+        queryset = super().get_queryset()
+        return tagged_with_all(queryset, parse_tag_slugs(self.request.query_params))
+
+    def get_serializer_class(self):
+        # Related items are only part of the detail page.
+        if self.action == 'retrieve':
+            return ProjectDetailSerializer
+        return ProjectSerializer
+
+class CertificationViewSet(ResponseCacheMixin, ValuesListMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Certification.objects.all().order_by('-date_issued')
+    serializer_class = CertificationSerializer
+    content_versions = ('certification',)
+
+class PostViewSet(ResponseCacheMixin, ValuesListMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = PostSerializer
+    queryset = Post.objects.filter(is_published=True).prefetch_related(prefetch_tags())
+    lookup_field = 'slug'
+    pagination_class = PostCursorPagination
+    # Last-Modified follows Post.updated_date (see signals.py)
+    content_versions = ('post',)
+
+    # --- 3. ADD FILTERING LOGIC HERE TOO ---
+    def get_queryset(self):
+        """
+        Optionally filter the posts by a 'tag' query parameter, or by several
+        with `?tags=a,b` (posts carrying all of them).
+        """
+        queryset = super().get_queryset()
+        return tagged_with_all(queryset, parse_tag_slugs(self.request.query_params))
+
+    def get_serializer_class(self):
+        # The index only needs the precomputed excerpt; the full Markdown stays on the detail page.
+        if self.action == 'list':
+            return PostListSerializer
+        return PostSerializer
+    
+# --- NEW: NATIVE Full-Text Search API View ---
+@api_view(['GET'])
+def search_view(request):
+    """
+    Performs a full-text search across projects and posts using
+    Django's native PostgreSQL integration.
+    """
+    from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
+
+    query_param = request.GET.get('q', '')
+    if not query_param:
+        return Response({"error": "A 'q' query parameter is required."}, status=400)
+
+    # Use SearchQuery to parse the user's input safely
+    search_query = SearchQuery(query_param)
+
+    # --- Search Projects ---
+    # Create a SearchVector on the fly, combining the fields we want to search
+    project_vector = SearchVector('title', 'description', 'tags__name', weight='A')
+    
+    # Annotate each project with a 'rank' based on how well it matches the query
+    project_results = Project.objects.annotate(
+        rank=SearchRank(project_vector, search_query)
+    ).filter(rank__gte=0.1).order_by('pk', '-rank').distinct('pk').prefetch_related(prefetch_tags())
+
+    # --- Search Posts ---
+    post_vector = SearchVector('title', 'content', 'tags__name', weight='B') # Give posts a slightly lower weight
+
+    post_results = Post.objects.annotate(
+        rank=SearchRank(post_vector, search_query)
+    ).filter(is_published=True, rank__gte=0.1).order_by('pk', '-rank').distinct('pk').prefetch_related(prefetch_tags())
+
+
+    # Serialize the ranked results
+    project_serializer = ProjectSerializer(project_results, many=True)
+    post_serializer = PostListSerializer(post_results, many=True)
+
+    # Combine and return the final data
+    return Response({
+        'projects': project_serializer.data,
+        'posts': post_serializer.data
+    })
@@ -0,0 +1,160 @@
+# backend/api/views/github.py
+import os
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.views.decorators.http import require_safe
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from ..compression import encoded_etag, preferred_encoding
+from ..content_version import bump_content_version, get_content_versions
+from ..heatmap import DEFAULT_THEME, THEMES, precompress, render_contributions_svg
+from ..metrics import record_cache_lookup, upstream_request
+from .constants import CACHE_TIMEOUT_SECONDS, GITHUB_API_URL, GITHUB_USERNAME
+
+# ==============================================================================
+# HELPER & SERVICE FUNCTIONS
+# ==============================================================================
+
+def fetch_github_stats_data():
+    """Fetches user stats from the GitHub REST API."""
+    import requests
+
+    token = os.getenv('GITHUB_API_TOKEN')
+    headers = {'Authorization': f'token {token}'} if token else {}
+    try:
+        user_url = f'{GITHUB_API_URL}/users/{GITHUB_USERNAME}'
+        user_response = upstream_request('GET', user_url, headers=headers, timeout=10)
+        user_response.raise_for_status()
+        user_data = user_response.json()
+        repos_url = user_data['repos_url']
+        repos_response = upstream_request('GET', repos_url, headers=headers, timeout=10)
+        repos_response.raise_for_status()
+        repos_data = repos_response.json()
+        total_stars = sum(repo['stargazers_count'] for repo in repos_data)
+        return { 'followers': user_data.get('followers'), 'public_repos': user_data.get('public_repos'), 'total_stars': total_stars }
+    except requests.RequestException: return None
+
+def fetch_github_contributions_data():
+    """Fetches contribution calendar data from the GitHub GraphQL API."""
+    import requests
+
+    token = os.getenv('GITHUB_API_TOKEN')
+    if not token: return None
+    headers = {"Authorization": f"bearer {token}"}
+    graphql_endpoint = f"{GITHUB_API_URL}/graphql"
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=365)
+    query = """
+    query($userName: String!, $from: DateTime!, $to: DateTime!) {
+      user(login: $userName) {
+        contributionsCollection(from: $from, to: $to) {
+          contributionCalendar { totalContributions weeks { contributionDays { contributionCount date weekday color } } }
+        }
+      }
+    }
+    """
+    variables = { "userName": GITHUB_USERNAME, "from": start_date.isoformat() + "Z", "to": end_date.isoformat() + "Z" }
+    try:
+        response = upstream_request('POST', graphql_endpoint, json={'query': query, 'variables': variables}, headers=headers, timeout=15)
+        response.raise_for_status()
+        data = response.json()
+        if "errors" in data: return None
+        return data['data']['user']['contributionsCollection']['contributionCalendar']
+    except requests.RequestException: return None
+
+def get_github_stats():
+    """Returns the cached GitHub stats, refetching them once the cache entry expires."""
+    cache_key = f"github_stats_{GITHUB_USERNAME}"
+    cached_data = cache.get(cache_key)
+    record_cache_lookup('github', bool(cached_data))
+    if cached_data: return cached_data
+    stats_data = fetch_github_stats_data()
+    if stats_data:
+        cache.set(cache_key, stats_data, timeout=CACHE_TIMEOUT_SECONDS)
+        bump_content_version('github_stats')
+    return stats_data
+
+def get_github_contributions():
+    """Returns the cached contribution calendar, refetching it every 6 hours."""
+    cache_key = f"github_contributions_{GITHUB_USERNAME}"
+    contribution_cache_timeout = 21600 # 6 hours
+    cached_data = cache.get(cache_key)
+    record_cache_lookup('github', bool(cached_data))
+    if cached_data: return cached_data
+    contribution_data = fetch_github_contributions_data()
+    if contribution_data:
+        cache.set(cache_key, contribution_data, timeout=contribution_cache_timeout)
+        bump_content_version('github_contributions')
+    return contribution_data
+
+@api_view(['GET'])
+def github_stats(request):
+    stats_data = get_github_stats()
+    if stats_data: return Response(stats_data)
+    return Response({'error': 'Failed to fetch from GitHub.'}, status=status.HTTP_502_BAD_GATEWAY)
+
+@api_view(['GET'])
+def github_contributions(request):
+    contribution_data = get_github_contributions()
+    if contribution_data: return Response(contribution_data)
+    return Response({'error': 'Failed to fetch contribution data.'}, status=status.HTTP_502_BAD_GATEWAY)
+# ==============================================================================
+# PRE-RENDERED HEATMAP
+# ==============================================================================
+# Browsers revalidate after this; the ETag makes that a 304 until the data refreshes.
+CONTRIBUTIONS_SVG_MAX_AGE = 3600
+
+def get_contributions_svg(theme: str):
+    """
+    The heatmap SVG for `theme`, pre-compressed (see heatmap.precompress).
+    Rendered once per calendar refresh: the cached copy is tagged with the
+    'github_contributions' content version it was rendered from.
+    """
+    cache_key = f"github_contributions_svg_{GITHUB_USERNAME}_{theme}"
+    token = get_content_versions('github_contributions')['github_contributions']['token']
+    entry = cache.get(cache_key)
+    record_cache_lookup('github_svg', bool(entry) and entry['token'] == token)
+    if entry and entry['token'] == token:
+        return entry
+    calendar = get_github_contributions()
+    if not calendar:
+        return None
+    # A refetch inside get_github_contributions() bumps the version; tag the render with the current one.
+    token = get_content_versions('github_contributions')['github_contributions']['token']
+    entry = {'token': token, **precompress(render_contributions_svg(calendar, theme))}
+    cache.set(cache_key, entry, timeout=None)
+    return entry
+
+@require_safe
+def github_contributions_svg(request):
+    """
+    The contribution calendar as a ready-made SVG image (`?theme=dark` for
+    the dark palette), so the browser neither downloads the day-by-day JSON
+    nor lays out the grid. Served brotli/gzip-compressed as stored, with an
+    ETag per encoding that stays the same until the calendar data refreshes.
+    """
+    theme = request.GET.get('theme', DEFAULT_THEME)
+    if theme not in THEMES:
+        theme = DEFAULT_THEME
+    entry = get_contributions_svg(theme)
+    if entry is None:
+        return HttpResponse("Failed to fetch contribution data.", status=502, content_type='text/plain')
+
+    encoding = preferred_encoding(request, has_br=entry['br'] is not None)
+    etag = encoded_etag(entry['etag'], encoding)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(entry[encoding or 'identity'], content_type='image/svg+xml')
+        if encoding:
+            response['Content-Encoding'] = encoding
+        # Opened directly, the SVG is a document: it needs no scripts or outside resources.
+        response['Content-Security-Policy'] = "default-src 'none'; style-src 'unsafe-inline'"
+    response['ETag'] = etag
+    response['Cache-Control'] = f"public, max-age={CONTRIBUTIONS_SVG_MAX_AGE}"
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
@@ -0,0 +1,37 @@
+# backend/api/views/images.py
+import os
+
+from django.http import FileResponse, Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_safe
+
+from ..images import FORMATS, NAME_PATTERN, image_dir
+
+# Names are content hashes: a given URL never changes, so browsers and the CDN keep it for a year.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# ==============================================================================
+# PROJECT IMAGES
+# ==============================================================================
+
+@require_safe
+def project_image(request, name):
+    """
+    Serves a stored project thumbnail variant (see api/images.py). Only
+    names of the generated form are looked up, so the path can't leave the
+    image directory.
+    """
+    match = NAME_PATTERN.match(name)
+    if not match:
+        raise Http404
+    etag = quote_etag(name)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        try:
+            response = FileResponse(open(os.path.join(image_dir(), name), 'rb'), content_type=FORMATS[match.group(1)][1])
+        except FileNotFoundError:
+            raise Http404
+    response['ETag'] = etag
+    response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
@@ -0,0 +1,96 @@
+# backend/api/views/mempool.py
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from ..content_version import bump_content_version
+from ..metrics import record_cache_lookup, upstream_request
+from ..mempool_feed import MEMPOOL_STATS_CACHE_KEY, ensure_feed_running, mempool_event_stream
+from .constants import MEMPOOL_API_URL
+
+logger = logging.getLogger('api')
+
+# ==============================================================================
+# HELPER & SERVICE FUNCTIONS
+# ==============================================================================
+
+def fetch_mempool_data():
+    """
+    Fetches recommended fee rates, block height, hashrate, and BTC price.
+    """
+    import requests
+
+    mempool_base_url = MEMPOOL_API_URL
+    
+    try:
+        # Fetch all data points in parallel
+        fees_response = upstream_request('GET', f"{mempool_base_url}/v1/fees/recommended", timeout=10)
+        height_response = upstream_request('GET', f"{mempool_base_url}/blocks/tip/height", timeout=10)
+        # Using the /v1/mining/hashrate endpoint is a good alternative
+        hashrate_response = upstream_request('GET', f"{mempool_base_url}/v1/mining/hashrate/1d", timeout=10)
+        # The correct price endpoint from mempool.space
+        price_response = upstream_request('GET', f"{mempool_base_url}/v1/prices", timeout=10)
+
+        # Check all responses for errors
+        fees_response.raise_for_status()
+        height_response.raise_for_status()
+        hashrate_response.raise_for_status()
+        price_response.raise_for_status()
+        
+        # Combine all the data into a single object
+        return {
+            "recommended_fees": fees_response.json(),
+            "block_height": height_response.json(),
+            "hashrate": hashrate_response.json().get('currentHashrate'),
+            "price": price_response.json().get('USD'),
+        }
+    except requests.RequestException as e:
+        logger.warning("Error fetching mempool/price data: %s", e)
+        return None
+
+def get_mempool_stats():
+    """
+    Returns the latest mempool stats. While the live feed is connected this is
+    its state; otherwise they are refetched every 60 seconds.
+    """
+    cache_key = MEMPOOL_STATS_CACHE_KEY
+    mempool_cache_timeout = 60
+    cached_data = cache.get(cache_key)
+    record_cache_lookup('mempool', bool(cached_data))
+    if cached_data: return cached_data
+    data = fetch_mempool_data()
+    if data:
+        cache.set(cache_key, data, timeout=mempool_cache_timeout)
+        bump_content_version('mempool_stats')
+    return data
+
+@api_view(['GET'])
+def mempool_stats(request):
+    """Provides a snapshot of the Bitcoin mempool stats."""
+    data = get_mempool_stats()
+    if data:
+        return Response(data)
+    return Response({'error': 'Failed to fetch data from mempool.space API.'}, status=status.HTTP_502_BAD_GATEWAY)
+
+@api_view(['GET'])
+def mempool_stats_stream(request):
+    """
+    Server-Sent Events stream of the mempool stats. One upstream WebSocket to
+    mempool.space (held by whichever worker wins the feed lock) feeds the cache;
+    every connected browser is fanned out from there.
+
+    Off unless MEMPOOL_STREAM_ENABLED: the answer is then 204, which tells an
+    EventSource not to reconnect, and the client keeps polling mempool_stats.
+    """
+    if not settings.MEMPOOL_STREAM_ENABLED:
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+    ensure_feed_running()
+    response = StreamingHttpResponse(mempool_event_stream(), content_type="text/event-stream")
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
\ No newline at end of file
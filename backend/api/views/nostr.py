@@ -0,0 +1,134 @@
+# backend/api/views/nostr.py
+import os
+import json
+
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from ..content_version import bump_content_version
+from ..metrics import observe_upstream, record_cache_lookup
+from .constants import CACHE_TIMEOUT_SECONDS, NOSTR_RELAYS
+
+# ==============================================================================
+# HELPER & SERVICE FUNCTIONS
+# ==============================================================================
+
+def decode_npub(npub: str) -> str | None:
+    """Decodes an 'npub' to hex using pynostr's PublicKey class."""
+    from pynostr.key import PublicKey
+    try:
+        public_key = PublicKey.from_npub(npub)
+        return public_key.hex()
+    except Exception:
+        return None
+
+def fetch_nostr_profile_data():
+    """Fetches the latest profile (kind 0) from Nostr relays."""
+    npub = os.getenv('NOSTR_NPUB')
+    if not npub: return None
+    hex_pubkey = decode_npub(npub)
+    if not hex_pubkey: return None
+
+    from pynostr.relay_manager import RelayManager
+    from pynostr.filters import FiltersList, Filters
+    from pynostr.event import EventKind
+
+    relay_manager = RelayManager(timeout=6)
+    for relay in NOSTR_RELAYS:
+        relay_manager.add_relay(relay)
+    
+    filters = FiltersList([Filters(authors=[hex_pubkey], kinds=[EventKind.SET_METADATA], limit=1)])
+    subscription_id = "profile_sub"
+    relay_manager.add_subscription_on_all_relays(subscription_id, filters)
+    
+    profile_data = None
+    try:
+        with observe_upstream('nostr-relays'):
+            relay_manager.run_sync()
+        latest_event = None
+        while relay_manager.message_pool.has_events():
+            event_msg = relay_manager.message_pool.get_event()
+            if latest_event is None or event_msg.event.created_at > latest_event.created_at:
+                latest_event = event_msg.event
+        if latest_event:
+            profile_data = json.loads(latest_event.content)
+    finally:
+        relay_manager.close_all_relay_connections()
+    return profile_data
+
+def fetch_latest_nostr_note():
+    """Fetches the latest text note (kind 1) from Nostr relays."""
+    npub = os.getenv('NOSTR_NPUB')
+    if not npub: return None
+    hex_pubkey = decode_npub(npub)
+    if not hex_pubkey: return None
+
+    from pynostr.relay_manager import RelayManager
+    from pynostr.filters import FiltersList, Filters
+    from pynostr.event import EventKind
+
+    relay_manager = RelayManager(timeout=4)
+    for relay in NOSTR_RELAYS:
+        relay_manager.add_relay(relay)
+
+    filters = FiltersList([Filters(authors=[hex_pubkey], kinds=[EventKind.TEXT_NOTE], limit=1)])
+    subscription_id = "latest_note_sub"
+    relay_manager.add_subscription_on_all_relays(subscription_id, filters)
+
+    latest_note = None
+    try:
+        with observe_upstream('nostr-relays'):
+            relay_manager.run_sync()
+        if relay_manager.message_pool.has_events():
+            event_msg = relay_manager.message_pool.get_event()
+            latest_note = {
+                "id": event_msg.event.id,
+                "content": event_msg.event.content,
+                "created_at": event_msg.event.created_at,
+            }
+    finally:
+        relay_manager.close_all_relay_connections()
+    return latest_note
+
+def get_nostr_profile(npub):
+    """Returns the cached Nostr profile for `npub`, refetching it from relays hourly."""
+    cache_key = f"nostr_profile_{npub}"
+    cached_data = cache.get(cache_key)
+    record_cache_lookup('nostr', bool(cached_data))
+    if cached_data: return cached_data
+    profile_data = fetch_nostr_profile_data()
+    if profile_data:
+        profile_data['npub'] = npub
+        cache.set(cache_key, profile_data, timeout=CACHE_TIMEOUT_SECONDS)
+        bump_content_version('nostr_profile')
+    return profile_data
+
+def get_latest_note(npub):
+    """Returns the cached latest note for `npub`, refetching it every 15 minutes."""
+    cache_key = f"latest_note_{npub}"
+    cached_data = cache.get(cache_key)
+    record_cache_lookup('nostr', bool(cached_data))
+    if cached_data: return cached_data
+    note_data = fetch_latest_nostr_note()
+    if note_data:
+        cache.set(cache_key, note_data, timeout=900) # 15 minutes
+        bump_content_version('latest_note')
+    return note_data
+
+@api_view(['GET'])
+def nostr_profile(request):
+    npub = os.getenv('NOSTR_NPUB')
+    if not npub: return Response({'error': 'Nostr npub not configured.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    profile_data = get_nostr_profile(npub)
+    if profile_data: return Response(profile_data)
+    return Response({'error': 'Nostr profile not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+@api_view(['GET'])
+def latest_note(request):
+    npub = os.getenv('NOSTR_NPUB')
+    if not npub: return Response({'error': 'Nostr npub not configured.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    note_data = get_latest_note(npub)
+    if note_data: return Response(note_data)
+    return Response({'error': 'No recent note found.'}, status=status.HTTP_404_NOT_FOUND)
\ No newline at end of file
@@ -0,0 +1,41 @@
+# backend/api/views/ops.py
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from ..cache import cache_stats
+from ..metrics import render_metrics
+
+# ==============================================================================
+# OPERATIONS (STAFF ONLY)
+# ==============================================================================
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def cache_stats_view(request):
+    """
+    L1 (in-process) and L2 (Redis) hit ratios of the two-tier cache. The counts
+    are per worker process: each request reports the worker that served it.
+    """
+    return Response({'tiers': cache_stats()})
+
+def _is_metrics_scraper(request) -> bool:
+    token = settings.METRICS_TOKEN
+    header = request.headers.get('Authorization', '')
+    return bool(token) and hmac.compare_digest(header.encode(), f"Bearer {token}".encode())
+
+def metrics_view(request):
+    """
+    Prometheus text exposition, aggregated across all gunicorn workers. Open
+    to a scraper presenting `Authorization: Bearer <METRICS_TOKEN>` and to
+    logged-in staff; everyone else gets a 404.
+    """
+    user = getattr(request, 'user', None)
+    if not (_is_metrics_scraper(request) or (user is not None and user.is_staff)):
+        return HttpResponse(status=404)
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)
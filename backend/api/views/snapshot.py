@@ -0,0 +1,60 @@
+# backend/api/views/snapshot.py
+import hashlib
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, Http404
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_safe
+
+from ..compression import encoded_etag, preferred_encoding
+from ..snapshot import ENCODING_EXTENSIONS, HASH_LENGTH, MANIFEST_NAME
+from .images import IMMUTABLE_CACHE_CONTROL
+
+# posts/my-post.0123456789ab.json; no dots before the hash, so no way out of API_SNAPSHOT_ROOT.
+NAME_PATTERN = re.compile(rf'^(?:[\w-]+/)*[\w-]+\.[0-9a-f]{{{HASH_LENGTH}}}\.json$')
+# The manifest changes with every export: caches may keep it but must revalidate.
+MANIFEST_CACHE_CONTROL = "public, no-cache"
+
+# ==============================================================================
+# API SNAPSHOT
+# ==============================================================================
+
+@require_safe
+def api_snapshot_file(request, name):
+    """
+    Serves a file of the exported API snapshot (see api/snapshot.py) as
+    stored, in the smallest encoding the client accepts. Hashed files never
+    change and are cached for a year; the manifest is revalidated against
+    an ETag of its content, so a re-export shows up on the next request.
+    """
+    path = os.path.join(settings.API_SNAPSHOT_ROOT, name)
+    if name == MANIFEST_NAME:
+        try:
+            with open(path, 'rb') as f:
+                etag = quote_etag(hashlib.sha256(f.read()).hexdigest()[:32])
+        except FileNotFoundError:
+            raise Http404
+        cache_control = MANIFEST_CACHE_CONTROL
+    elif NAME_PATTERN.match(name):
+        etag, cache_control = quote_etag(name), IMMUTABLE_CACHE_CONTROL
+    else:
+        raise Http404
+
+    encoding = preferred_encoding(request, has_br=os.path.exists(path + ENCODING_EXTENSIONS['br']))
+    etag = encoded_etag(etag, encoding)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        try:
+            stored = open(path + ENCODING_EXTENSIONS.get(encoding, ''), 'rb')
+        except FileNotFoundError:
+            raise Http404
+        response = FileResponse(stored, content_type='application/json', filename=os.path.basename(name))
+        if encoding:
+            response['Content-Encoding'] = encoding
+    response['ETag'] = etag
+    response['Cache-Control'] = cache_control
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
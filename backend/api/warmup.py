@@ -0,0 +1,116 @@
+# backend/api/warmup.py
+import gc
+import importlib
+import logging
+import os
+import time
+
+from django.db import connections
+
+logger = logging.getLogger('api')
+
+# The integration stacks the views import lazily (see benchmarks/bench_import_time.py),
+# so a worker without preloading only pays for them on its first request.
+# With gunicorn's preload_app the master imports them once and every forked
+# worker shares those pages copy-on-write.
+PRELOAD_MODULES = (
+    'requests',
+    'pynostr.relay_manager',
+    'pynostr.filters',
+    'pynostr.event',
+    'bitcoinlib.keys',
+    'groq',
+)
+# Resolved once so the URL resolver's caches are built before the fork.
+PRELOAD_PATHS = ('/api/', '/api/projects/', '/api/posts/x/', '/api/chat/', '/api/bootstrap/')
+
+# ==============================================================================
+# MASTER (BEFORE FORK)
+# ==============================================================================
+
+def preload():
+    """
+    Imports everything the workers will need and freezes the result, so the
+    forked workers share it instead of each importing (and dirtying) their own
+    copy. Nothing here may open a socket: connections must not cross a fork.
+    """
+    from django.urls import get_resolver
+
+    start = time.perf_counter()
+    resolver = get_resolver()
+    for path in PRELOAD_PATHS:
+        try:
+            resolver.resolve(path)
+        except Exception:
+            pass
+    for module in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning("Could not preload %s: %s", module, e)
+    if connections['default'].vendor == 'postgresql':
+        importlib.import_module('django.contrib.postgres.search')
+
+    # In case an import touched the database, don't hand its socket to every worker.
+    connections.close_all()
+    # Move everything imported so far out of the GC's reach: collections in the
+    # workers would otherwise write to (and un-share) every one of these pages.
+    gc.collect()
+    gc.freeze()
+    logger.info("Preloaded app in %.0f ms (%d objects frozen).", (time.perf_counter() - start) * 1000, gc.get_freeze_count())
+
+# ==============================================================================
+# WORKER (AFTER FORK)
+# ==============================================================================
+
+def _warm_database():
+    connections['default'].ensure_connection()
+
+def _warm_cache():
+    from django.core.cache import cache
+
+    # Opens the Redis connection pool (and starts the L1 invalidation listener).
+    cache.get('warmup')
+
+def _warm_http():
+    from .metrics import http_session
+
+    http_session()
+
+def _warm_knowledge_base():
+    from .views.chat import get_knowledge_base
+
+    get_knowledge_base()
+
+def _warm_embeddings():
+    from .embeddings import get_embedding_backend
+    from .intents import get_intent_router
+    from .views.chat import get_knowledge_base, project_documents
+
+    # Local model: load the weights and embed every document the first query would.
+    backend = get_embedding_backend()
+    if backend.name == 'local' and backend.configured:
+        backend.warm(get_knowledge_base() + [text for _, text in project_documents()])
+        get_intent_router().warm(backend)
+
+# (name, function) run in order by every worker before it accepts requests.
+WORKER_WARMUPS = [
+    ('database', _warm_database),
+    ('cache', _warm_cache),
+    ('http pool', _warm_http),
+    ('knowledge base', _warm_knowledge_base),
+    ('embeddings', _warm_embeddings),
+]
+
+def warm_worker():
+    """Opens this worker's connections and fills its caches; a failing step is logged and skipped."""
+    timings = []
+    for name, warmup in WORKER_WARMUPS:
+        start = time.perf_counter()
+        try:
+            warmup()
+        except Exception as e:
+            logger.warning("Worker warmup step '%s' failed: %s", name, e)
+            continue
+        timings.append(f"{name} {(time.perf_counter() - start) * 1000:.0f} ms")
+    logger.info("Worker %d warmed up (%s).", os.getpid(), ', '.join(timings))
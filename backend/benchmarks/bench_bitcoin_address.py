@@ -0,0 +1,83 @@
+# backend/benchmarks/bench_bitcoin_address.py
+"""
+Compares the cold-start cost of the old tip-jar path (`Wallet.create` into a
+fresh SQLite wallet DB, as happens after every Render deploy) against deriving
+the receive-address pool in memory from the account key.
+
+Usage (from backend/):
+    python benchmarks/bench_bitcoin_address.py --runs 5 --pool-size 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+
+import django  # noqa: E402
+
+django.setup()
+
+from bitcoinlib.wallets import Wallet  # noqa: E402
+
+from api.bitcoin import account_key_from_mnemonic, account_key_from_xpub, derive_receive_addresses  # noqa: E402
+
+# Public BIP39 test vector; never send funds to it.
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+
+
+def wallet_create_path(mnemonic, run):
+    """The previous implementation: build a wallet DB from the mnemonic, then read the first key."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_uri = f"sqlite:///{tmp}/wallet.db"
+        w = Wallet.create(f"bench_wallet_{run}", keys=mnemonic, witness_type='segwit', db_uri=db_uri)
+        return w.get_key().address
+
+
+def mnemonic_pool_path(mnemonic, pool_size):
+    account_key = account_key_from_mnemonic(mnemonic)
+    return derive_receive_addresses(account_key, 0, pool_size)[0][1]
+
+
+def xpub_pool_path(xpub, pool_size):
+    account_key = account_key_from_xpub(xpub)
+    return derive_receive_addresses(account_key, 0, pool_size)[0][1]
+
+
+def timed(fn, runs):
+    samples, result = [], None
+    for run in range(runs):
+        start = time.perf_counter()
+        result = fn(run)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--pool-size', type=int, default=50)
+    args = parser.parse_args()
+
+    mnemonic = os.getenv('BITCOIN_WALLET_MNEMONIC', TEST_MNEMONIC)
+    xpub = account_key_from_mnemonic(mnemonic).wif_public()
+
+    cases = [
+        ("Wallet.create (1 address)", lambda run: wallet_create_path(mnemonic, run)),
+        (f"mnemonic -> pool ({args.pool_size} addresses)", lambda run: mnemonic_pool_path(mnemonic, args.pool_size)),
+        (f"xpub -> pool ({args.pool_size} addresses)", lambda run: xpub_pool_path(xpub, args.pool_size)),
+    ]
+
+    print(f"{'path':<36} {'median ms':>10} {'min ms':>10} {'max ms':>10}  first address")
+    for label, fn in cases:
+        samples, first_address = timed(fn, args.runs)
+        print(f"{label:<36} {statistics.median(samples):>10.1f} {min(samples):>10.1f} {max(samples):>10.1f}  {first_address}")
+
+
+if __name__ == '__main__':
+    main()
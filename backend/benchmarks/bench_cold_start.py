@@ -0,0 +1,167 @@
+# backend/benchmarks/bench_cold_start.py
+"""
+Cold start to first byte, per gunicorn boot profile.
+
+For each mode, starts gunicorn from scratch (production settings, the stub
+upstreams and a seeded SQLite database, as in load_test.py) and measures:
+
+    boot->first byte   from spawning gunicorn to the first 200 from /api/projects/
+    first request      latency of the first request each fresh worker serves,
+                       per route (--workers concurrent requests right after boot)
+    worker PSS         proportional set size of all workers: memory shared
+                       copy-on-write with the master is split between them
+
+Modes:
+    cold             GUNICORN_PRELOAD=False GUNICORN_WARMUP=False (every worker imports lazily)
+    preload          GUNICORN_PRELOAD=True  GUNICORN_WARMUP=False
+    preload+warmup   GUNICORN_PRELOAD=True  GUNICORN_WARMUP=True  (the default)
+
+Usage (from backend/):
+    python benchmarks/bench_cold_start.py --workers 3 --runs 3
+"""
+import argparse
+import http.client
+import json
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_test import BACKEND_DIR, build_env, python, seed_database, wait_for, worker_pids  # noqa: E402
+
+MODES = {
+    'cold': {'GUNICORN_PRELOAD': 'False', 'GUNICORN_WARMUP': 'False'},
+    'preload': {'GUNICORN_PRELOAD': 'True', 'GUNICORN_WARMUP': 'False'},
+    'preload+warmup': {'GUNICORN_PRELOAD': 'True', 'GUNICORN_WARMUP': 'True'},
+}
+# name -> (method, path, JSON body)
+FIRST_REQUESTS = {
+    'projects': ('GET', '/api/projects/', None),
+    'chat': ('POST', '/api/chat/', {'question': "tell me about bitcoin", 'history': []}),
+    'nostr-profile': ('GET', '/api/nostr-profile/', None),
+    'bitcoin-address': ('GET', '/api/bitcoin-address/', None),
+}
+HEADERS = {'Host': '127.0.0.1', 'X-Forwarded-Proto': 'https'}
+
+
+def request_ms(port, method, path, body=None):
+    """Milliseconds until the whole response has arrived (a new connection each time)."""
+    start = time.perf_counter()
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    headers = dict(HEADERS)
+    payload = None
+    if body is not None:
+        payload = json.dumps(body)
+        headers['Content-Type'] = 'application/json'
+    conn.request(method, path, body=payload, headers=headers)
+    response = conn.getresponse()
+    response.read()
+    conn.close()
+    return (time.perf_counter() - start) * 1000, response.status
+
+def time_to_first_byte(port, started, timeout=60):
+    deadline = started + timeout
+    while time.perf_counter() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            conn.request('GET', '/api/projects/', headers=HEADERS)
+            response = conn.getresponse()
+            if response.status == 200:
+                elapsed = (time.perf_counter() - started) * 1000
+                response.read()
+                return elapsed
+        except OSError:
+            time.sleep(0.01)
+    raise RuntimeError("gunicorn never answered")
+
+def first_requests(port, workers):
+    """Sends `workers` concurrent requests per route, so each fresh worker serves one."""
+    results = {}
+    for name, (method, path, body) in FIRST_REQUESTS.items():
+        latencies = []
+        threads = [threading.Thread(target=lambda: latencies.append(request_ms(port, method, path, body)[0]))
+                   for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results[name] = max(latencies)
+    return results
+
+def total_pss_mb(pids):
+    total_kb = 0
+    for pid in pids:
+        try:
+            for line in Path(f'/proc/{pid}/smaps_rollup').read_text().splitlines():
+                if line.startswith('Pss:'):
+                    total_kb += int(line.split()[1])
+        except OSError:
+            pass
+    return total_kb / 1024
+
+def run_mode(env, mode_env, args, workdir):
+    env = dict(env, **mode_env)
+    started = time.perf_counter()
+    gunicorn = subprocess.Popen(
+        [python(), '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--workers', str(args.workers),
+         '--bind', f"127.0.0.1:{args.port}", '--timeout', '120', 'portfolio_project.wsgi'],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=open(workdir / 'gunicorn.log', 'a'),
+    )
+    try:
+        first_byte = time_to_first_byte(args.port, started)
+        result = {'first_byte_ms': first_byte, 'first_request_ms': first_requests(args.port, args.workers)}
+        result['pss_mb'] = total_pss_mb(worker_pids(gunicorn.pid))
+        return result
+    finally:
+        gunicorn.send_signal(signal.SIGTERM)
+        try:
+            gunicorn.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            gunicorn.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=3)
+    parser.add_argument('--runs', type=int, default=3, help="Boots per mode; the median is reported.")
+    parser.add_argument('--rows', type=int, default=100)
+    parser.add_argument('--port', type=int, default=8810)
+    parser.add_argument('--stub-port', type=int, default=8767)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+    # build_env() reads these load-test options.
+    args.database_url, args.redis_url, args.stream_seconds = None, None, 2
+
+    workdir = Path(tempfile.mkdtemp(prefix='portfolio-coldstart-'))
+    (workdir / 'prometheus').mkdir()
+    env = build_env(args, workdir, f"http://127.0.0.1:{args.stub_port}")
+    stubs = subprocess.Popen(
+        [python(), 'benchmarks/stubs/upstreams.py', '--port', str(args.stub_port), '--latency-ms', '20'],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL,
+    )
+    try:
+        seed_database(env, args.rows)
+        wait_for(args.stub_port, '/github/users/stub')
+        print(f"{args.workers} workers, median of {args.runs} boot(s) per mode\n")
+        header = f"{'mode':<16} {'boot->first byte':>16} " + " ".join(f"{name:>16}" for name in FIRST_REQUESTS)
+        print(header + f" {'worker PSS':>11}")
+        for mode in args.modes:
+            runs = [run_mode(env, MODES[mode], args, workdir) for _ in range(args.runs)]
+            first_byte = statistics.median(run['first_byte_ms'] for run in runs)
+            per_route = {name: statistics.median(run['first_request_ms'][name] for run in runs) for name in FIRST_REQUESTS}
+            pss = statistics.median(run['pss_mb'] for run in runs)
+            print(f"{mode:<16} {first_byte:>13.0f} ms " + " ".join(f"{ms:>13.0f} ms" for ms in per_route.values())
+                  + f" {pss:>8.0f} MB")
+    finally:
+        stubs.send_signal(signal.SIGTERM)
+        stubs.wait(timeout=15)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+# backend/benchmarks/bench_embeddings.py
+"""
+Per-query latency of the embedding backends (api/embeddings.py), plus a
+self-check of the local one.
+
+    local cold    similarities() with nothing cached: the query and every
+                  document go through the encoder (a worker's first query
+                  without the warmup)
+    local warm    the documents' vectors are cached: one encoder pass over
+                  the query (every later query)
+    remote        the Hugging Face Inference API, one POST per query. With
+                  --stub-port the local stub (benchmarks/stubs/upstreams.py)
+                  answers after --stub-latency-ms instead.
+
+Without --model a randomly initialised model is generated first: --shape
+minilm has all-MiniLM-L6-v2's dimensions (6 layers, 384 hidden, 12 heads,
+30522-token vocabulary), so its timings match the real model's; the
+scores are meaningless, which doesn't matter for latency. `--check` runs
+the self-check on a tiny generated model (2 layers, 32 hidden) and exits
+non-zero on failure: unit-length vectors, batched == one-at-a-time
+(padding doesn't leak into the result), cached == fresh, identical text
+scores 1.
+
+Usage (from backend/):
+    python benchmarks/bench_embeddings.py --check
+    python benchmarks/bench_embeddings.py --shape minilm --documents 40 --queries 50 --stub-port 8768
+    python benchmarks/bench_embeddings.py --model models/all-MiniLM-L6-v2
+"""
+import argparse
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
+
+SHAPES = {
+    'tiny': {'hidden_size': 32, 'num_hidden_layers': 2, 'num_attention_heads': 2, 'intermediate_size': 64,
+             'max_position_embeddings': 128, 'vocab_size': None},
+    'minilm': {'hidden_size': 384, 'num_hidden_layers': 6, 'num_attention_heads': 12, 'intermediate_size': 1536,
+               'max_position_embeddings': 512, 'vocab_size': 30522},
+}
+WORDS = (
+    "python django react bitcoin nostr lightning rust postgres redis docker linux sql api backend frontend "
+    "portfolio project experience certification blog developer engineer build deploy machine learning model "
+    "embedding search semantic wallet node relay protocol open source javascript typescript tailwind cloud"
+).split()
+
+# ==============================================================================
+# GENERATED MODELS
+# ==============================================================================
+
+def make_model(directory: Path, shape: str, seed: int = 0):
+    """Writes config.json, tokenizer.json and model.safetensors of a random BERT encoder."""
+    import numpy as np
+    from safetensors.numpy import save_file
+    from tokenizers import Tokenizer, models, normalizers, pre_tokenizers, processors
+
+    config = dict(SHAPES[shape], hidden_act='gelu', layer_norm_eps=1e-12, model_type='bert', type_vocab_size=2)
+    tokens = ['[PAD]', '[UNK]', '[CLS]', '[SEP]', '[MASK]']
+    characters = [chr(c) for c in range(33, 127) if not chr(c).isupper()]
+    tokens += characters + [f"##{c}" for c in characters] + [word for word in WORDS if word not in characters]
+    if config['vocab_size']:
+        tokens += [f"[unused{i}]" for i in range(config['vocab_size'] - len(tokens))]
+    config['vocab_size'] = len(tokens)
+    vocab = {token: i for i, token in enumerate(tokens)}
+
+    tokenizer = Tokenizer(models.WordPiece(vocab=vocab, unk_token='[UNK]'))
+    tokenizer.normalizer = normalizers.BertNormalizer(lowercase=True)
+    tokenizer.pre_tokenizer = pre_tokenizers.BertPreTokenizer()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="[CLS] $A [SEP]", pair="[CLS] $A [SEP] $B:1 [SEP]:1",
+        special_tokens=[('[CLS]', vocab['[CLS]']), ('[SEP]', vocab['[SEP]'])],
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    tokenizer.save(str(directory / 'tokenizer.json'))
+    (directory / 'config.json').write_text(json.dumps(config))
+
+    rng = np.random.default_rng(seed)
+    hidden, intermediate = config['hidden_size'], config['intermediate_size']
+
+    def normal(*shape):
+        return (rng.standard_normal(shape) * 0.02).astype(np.float32)
+
+    tensors = {
+        'embeddings.word_embeddings.weight': normal(config['vocab_size'], hidden),
+        'embeddings.position_embeddings.weight': normal(config['max_position_embeddings'], hidden),
+        'embeddings.token_type_embeddings.weight': normal(2, hidden),
+        'embeddings.LayerNorm.weight': np.ones(hidden, np.float32),
+        'embeddings.LayerNorm.bias': np.zeros(hidden, np.float32),
+    }
+    for i in range(config['num_hidden_layers']):
+        layer = f'encoder.layer.{i}.'
+        for part in ('query', 'key', 'value'):
+            tensors[f'{layer}attention.self.{part}.weight'] = normal(hidden, hidden)
+            tensors[f'{layer}attention.self.{part}.bias'] = normal(hidden)
+        tensors[f'{layer}attention.output.dense.weight'] = normal(hidden, hidden)
+        tensors[f'{layer}attention.output.dense.bias'] = normal(hidden)
+        tensors[f'{layer}intermediate.dense.weight'] = normal(intermediate, hidden)
+        tensors[f'{layer}intermediate.dense.bias'] = normal(intermediate)
+        tensors[f'{layer}output.dense.weight'] = normal(hidden, intermediate)
+        tensors[f'{layer}output.dense.bias'] = normal(hidden)
+        for norm in ('attention.output.LayerNorm', 'output.LayerNorm'):
+            tensors[f'{layer}{norm}.weight'] = np.ones(hidden, np.float32)
+            tensors[f'{layer}{norm}.bias'] = np.zeros(hidden, np.float32)
+    save_file(tensors, str(directory / 'model.safetensors'))
+    return directory
+
+def sample_texts(count: int, seed: int, min_words=8, max_words=60):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))) + "." for _ in range(count)]
+
+# ==============================================================================
+# SELF-CHECK
+# ==============================================================================
+
+def check(workdir: Path) -> bool:
+    import numpy as np
+
+    from api.embeddings import LocalEmbeddingBackend
+
+    backend = LocalEmbeddingBackend(make_model(workdir / 'tiny', 'tiny'), batch_size=4)
+    texts = sample_texts(11, seed=1, min_words=1, max_words=40) + ["Django", "Bitcoin, Nostr & Lightning!"]
+    batched = backend.embed(texts)
+    one_by_one = np.stack([backend.embed([text])[0] for text in texts])
+    cached_first = backend.embed_documents(texts)
+    cached_again = backend.embed_documents(list(reversed(texts)))[::-1]
+    scores = backend.similarities(texts[0], texts)
+    checks = {
+        'unit length': np.allclose(np.linalg.norm(batched, axis=1), 1, atol=1e-5),
+        'batched == one at a time': np.allclose(batched, one_by_one, atol=1e-5),
+        'cached == fresh': np.allclose(cached_first, batched, atol=1e-6) and np.allclose(cached_again, batched, atol=1e-6),
+        'identical text scores 1': abs(scores[0] - 1) < 1e-5 and all(score <= 1 + 1e-5 for score in scores),
+        'empty input': backend.similarities("x", []) == [],
+    }
+    for name, passed in checks.items():
+        print(f"{'ok' if passed else 'FAIL':<5} {name}")
+    return all(checks.values())
+
+# ==============================================================================
+# LATENCY
+# ==============================================================================
+
+def time_ms(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+def describe(samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"p50 {statistics.median(samples):>8.1f} ms   p95 {p95:>8.1f} ms"
+
+def start_stub(port, latency_ms):
+    stub = subprocess.Popen(
+        [sys.executable, 'benchmarks/stubs/upstreams.py', '--port', str(port), '--latency-ms', str(latency_ms),
+         '--jitter-ms', str(latency_ms / 5)],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    time.sleep(1.5)
+    return stub
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--check', action='store_true', help="Run the self-check on a tiny generated model and exit.")
+    parser.add_argument('--model', help="A sentence-transformers model directory (default: generate one).")
+    parser.add_argument('--shape', choices=SHAPES, default='minilm', help="Shape of the generated model.")
+    parser.add_argument('--documents', type=int, default=40, help="Documents scored per query (the chat knowledge base is ~30-50).")
+    parser.add_argument('--queries', type=int, default=30)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 4, 8, 16, 32])
+    parser.add_argument('--stub-port', type=int, help="Measure the remote backend against the local stub on this port.")
+    parser.add_argument('--stub-latency-ms', type=float, default=300.0)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix='portfolio-embeddings-'))
+    if args.stub_port:
+        os.environ['HUGGINGFACE_EMBEDDING_MODEL_URL'] = f"http://127.0.0.1:{args.stub_port}/hf/models/stub"
+        os.environ.setdefault('HUGGINGFACE_API_TOKEN', 'stub')
+    import django
+    django.setup()
+
+    if args.check:
+        sys.exit(0 if check(workdir) else 1)
+
+    from api.embeddings import LocalEmbeddingBackend, RemoteEmbeddingBackend
+
+    model_dir = Path(args.model) if args.model else make_model(workdir / args.shape, args.shape)
+    documents = sample_texts(args.documents, seed=2)
+    queries = sample_texts(args.queries, seed=3, min_words=3, max_words=12)
+
+    load_start = time.perf_counter()
+    backend = LocalEmbeddingBackend(model_dir)
+    backend.load()
+    print(f"model {model_dir} loaded in {(time.perf_counter() - load_start) * 1000:.0f} ms\n")
+    print(f"{args.documents} documents per query, {args.queries} queries\n")
+
+    cold = []
+    for query in queries[:5]:
+        backend._documents.clear()
+        cold.append(time_ms(backend.similarities, query, documents))
+    print(f"{'local cold':<14} {describe(cold)}")
+    backend.warm(documents)
+    print(f"{'local warm':<14} {describe([time_ms(backend.similarities, query, documents) for query in queries])}")
+
+    remote = RemoteEmbeddingBackend()
+    if remote.configured:
+        stub = start_stub(args.stub_port, args.stub_latency_ms) if args.stub_port else None
+        try:
+            samples = [time_ms(remote.similarities, query, documents) for query in queries]
+            label = f"stub, {args.stub_latency_ms:.0f} ms" if stub else "Hugging Face"
+            print(f"{'remote':<14} {describe(samples)}   ({label})")
+        finally:
+            if stub:
+                stub.send_signal(signal.SIGTERM)
+                stub.wait(timeout=10)
+    else:
+        print(f"{'remote':<14} skipped (no HUGGINGFACE_API_TOKEN and no --stub-port)")
+
+    print("\nencoder throughput by batch size")
+    for batch_size in args.batch_sizes:
+        backend.batch_size = batch_size
+        elapsed = time_ms(backend.embed, documents)
+        print(f"  batch {batch_size:>3}: {elapsed:>8.1f} ms for {len(documents)} texts ({elapsed / len(documents):.1f} ms/text)")
+
+
+if __name__ == '__main__':
+    main()
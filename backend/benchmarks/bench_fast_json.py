@@ -0,0 +1,109 @@
+# backend/benchmarks/bench_fast_json.py
+"""
+Requests per second of one worker for the read-only content endpoints, with
+the regular ModelSerializer + stdlib JSONRenderer path ("before") against the
+`.values()` + orjson path ("after"). Every request also checks that both paths
+return the same bytes; every other project and post gets its tags linked in
+descending id order, so a path that orders tags by link order instead of tag
+id shows up as a difference. Rows are seeded inside a transaction that is rolled
+back, and the response cache is disabled so each request does its full work.
+
+Usage (from backend/):
+    python benchmarks/bench_fast_json.py --rows 1000 --seconds 2
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import transaction  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.test.utils import override_settings  # noqa: E402
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer  # noqa: E402
+
+from api.seed import seed  # noqa: E402
+from api.models import Post, Project, Tag  # noqa: E402
+from api.views import (  # noqa: E402
+    CertificationViewSet, PostViewSet, ProjectViewSet, TagViewSet, WorkExperienceViewSet,
+)
+
+ENDPOINTS = [
+    ('/api/projects/?page_size=100', ProjectViewSet, 'list', {}),
+    ('/api/posts/?page_size=100', PostViewSet, 'list', {}),
+    ('/api/posts/budget-post-0/', PostViewSet, 'retrieve', {'slug': 'budget-post-0'}),
+    ('/api/certifications/', CertificationViewSet, 'list', {}),
+    ('/api/work-experience/', WorkExperienceViewSet, 'list', {}),
+    ('/api/tags/', TagViewSet, 'list', {}),
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+def relink_tags_out_of_order():
+    """Re-links the tags of every other project and post newest tag first (through pk order != tag id order)."""
+    tags = list(Tag.objects.order_by('-id')[:3])
+    for model in (Project, Post):
+        through = model.tags.through
+        owner = model._meta.get_field('tags').m2m_field_name()
+        ids = list(model.objects.order_by('id').values_list('id', flat=True)[::2])
+        through.objects.filter(**{f"{owner}_id__in": ids}).delete()
+        through.objects.bulk_create([through(**{f"{owner}_id": pk, 'tag_id': tag.id}) for pk in ids for tag in tags])
+
+
+def render(view, request, kwargs):
+    response = view(request, **kwargs)
+    response.render()
+    return response.content
+
+
+def requests_per_second(view, request, kwargs, seconds):
+    count, start = 0, time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        render(view, request, kwargs)
+        count += 1
+    return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    factory = RequestFactory(HTTP_HOST='localhost')
+    print(f"{'endpoint':<32} {'before req/s':>13} {'after req/s':>12} {'speedup':>8}  bytes")
+    with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}):
+        try:
+            with transaction.atomic():
+                seed(args.rows)
+                relink_tags_out_of_order()
+                for url, viewset, action, kwargs in ENDPOINTS:
+                    request = factory.get(url, HTTP_ACCEPT='application/json')
+                    before = viewset.as_view({'get': action}, fast_list=False,
+                                             renderer_classes=[JSONRenderer, BrowsableAPIRenderer])
+                    after = viewset.as_view({'get': action})
+                    expected, actual = render(before, request, kwargs), render(after, request, kwargs)
+                    if expected != actual:
+                        sys.exit(f"Output differs for {url}:\n  before: {expected[:200]!r}\n  after:  {actual[:200]!r}")
+                    before_rps = requests_per_second(before, request, kwargs, args.seconds)
+                    after_rps = requests_per_second(after, request, kwargs, args.seconds)
+                    print(f"{url:<32} {before_rps:>13.1f} {after_rps:>12.1f} {after_rps / before_rps:>7.2f}x  "
+                          f"{len(actual)} (identical)")
+                raise Rollback
+        except Rollback:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# backend/benchmarks/bench_import_time.py
+"""
+Import-time and RSS report for a cold worker.
+
+Boots Django and imports the URLconf in a fresh interpreter under
+`python -X importtime`, the same work a gunicorn worker does before it can
+serve /api/projects/. Reports wall time, peak RSS, the slowest top-level
+packages, and which heavy integration stacks were pulled in at boot. Each
+integration stack is then imported on top of the booted app to show the cost
+that is now deferred to its first request.
+
+Usage (from backend/):
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --max-boot-ms 900 --max-rss-mb 120   # non-zero exit on regression
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Modules that must NOT be imported just to serve the content endpoints.
+HEAVY_MODULES = {
+    'requests': 'requests',
+    'nostr': 'pynostr.relay_manager',
+    'bitcoin': 'bitcoinlib.keys',
+    'groq': 'groq',
+    'postgres search': 'django.contrib.postgres.search',
+}
+
+BOOT_SCRIPT = """
+import json, os, resource, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+import {target}
+boot_ms = (time.perf_counter() - start) * 1000
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+extra_ms = None
+if {extra!r}:
+    t = time.perf_counter()
+    __import__({extra!r})
+    extra_ms = (time.perf_counter() - t) * 1000
+print(json.dumps({{
+    'boot_ms': boot_ms,
+    'rss_kb': rss_kb,
+    'extra_ms': extra_ms,
+    'extra_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_kb,
+    'heavy_loaded': sorted(name for name, mod in {heavy!r}.items() if mod in sys.modules),
+}}))
+"""
+
+
+def run_child(target, extra=None, importtime=False):
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
+    env.setdefault('SECRET_KEY', 'benchmark')
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ['-X', 'importtime']
+    cmd += ['-c', BOOT_SCRIPT.format(target=target, extra=extra, heavy=HEAVY_MODULES)]
+    proc = subprocess.run(cmd, cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        sys.exit(f"Child interpreter failed:\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return result, proc.stderr
+
+
+def parse_importtime(stderr):
+    """Sums `-X importtime` self-times (microseconds) per top-level package."""
+    per_package = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        try:
+            self_us, _cumulative, name = line[len('import time:'):].split('|')
+            per_package[name.strip().split('.')[0]] += int(self_us)
+        except ValueError:
+            continue
+    return per_package
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--target', default='api.urls', help="Module a worker imports at boot.")
+    parser.add_argument('--top', type=int, default=15, help="How many packages to list by import time.")
+    parser.add_argument('--max-boot-ms', type=float, help="Fail if boot import time exceeds this.")
+    parser.add_argument('--max-rss-mb', type=float, help="Fail if peak RSS after boot exceeds this.")
+    args = parser.parse_args()
+
+    boot, stderr = run_child(args.target, importtime=True)
+    per_package = parse_importtime(stderr)
+
+    print(f"Boot ({args.target}): {boot['boot_ms']:.1f} ms, peak RSS {boot['rss_kb'] / 1024:.1f} MB")
+    print(f"Heavy stacks loaded at boot: {', '.join(boot['heavy_loaded']) or 'none'}")
+    print(f"\nTop {args.top} packages by self import time:")
+    for name, self_us in sorted(per_package.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {name:<32} {self_us / 1000:>8.1f} ms")
+
+    print("\nDeferred cost, paid on first use of each integration:")
+    for label, module in HEAVY_MODULES.items():
+        if label in boot['heavy_loaded']:
+            print(f"  {label:<16} (already loaded at boot)")
+            continue
+        result, _ = run_child(args.target, extra=module)
+        print(f"  {label:<16} +{result['extra_ms']:>8.1f} ms  +{result['extra_rss_kb'] / 1024:>6.1f} MB RSS")
+
+    failures = []
+    if args.max_boot_ms is not None and boot['boot_ms'] > args.max_boot_ms:
+        failures.append(f"boot time {boot['boot_ms']:.1f} ms > {args.max_boot_ms} ms")
+    if args.max_rss_mb is not None and boot['rss_kb'] / 1024 > args.max_rss_mb:
+        failures.append(f"peak RSS {boot['rss_kb'] / 1024:.1f} MB > {args.max_rss_mb} MB")
+    if failures:
+        sys.exit("REGRESSION: " + "; ".join(failures))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+# backend/benchmarks/bench_intents.py
+"""
+Routing accuracy of the career chat intent router (api/intents.py) on
+labelled questions, against the substring matcher it replaced. LABELLED is
+the set the keyword weights were tuned on, so its accuracy is optimistic;
+HELD_OUT was never used for tuning and is the number to quote.
+
+A question routed to an intent gets that intent's knowledge base entries
+as context directly; an unrouted one (expected intent None below) goes to
+retrieval: the keyword filter plus a semantic search, which with the
+remote embedding backend is a Hugging Face call. For each router:
+
+    accuracy    share of questions routed to their labelled intent (or
+                correctly left to retrieval)
+    retrieval   share of questions sent to retrieval, i.e. the share that
+                needs an embedding call
+    latency     mean time per routing decision
+
+--model adds the local prototype fallback with that sentence-transformers
+model (the prototypes are only meaningful with real weights). --verbose
+lists every misrouted question. Exits non-zero if the router is less
+accurate than the substring matcher on the held-out set.
+
+Usage (from backend/):
+    python benchmarks/bench_intents.py
+    python benchmarks/bench_intents.py --verbose --model models/all-MiniLM-L6-v2
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
+
+# (question, expected intent); None means the question should go to retrieval.
+LABELLED = [
+    ("Show me your projects", 'project'),
+    ("What projects have you built?", 'project'),
+    ("Can I see your portfolio?", 'project'),
+    ("What have you built with Django?", 'project'),
+    ("Any side projects?", 'project'),
+    ("Show me some of your work", 'project'),
+    ("Do you have any apps I can try?", 'project'),
+    ("Link me to your GitHub repos", 'project'),
+    ("Which project are you proudest of?", 'project'),
+    ("Do you have a live demo?", 'project'),
+    ("What's your work experience?", 'experience'),
+    ("Summarize experience", 'experience'),
+    ("Can I see your resume?", 'experience'),
+    ("Send me your CV", 'experience'),
+    ("Where have you worked before?", 'experience'),
+    ("What companies have you worked for?", 'experience'),
+    ("Tell me about your work history", 'experience'),
+    ("What was your role at Tribe BTC?", 'experience'),
+    ("What is your current job?", 'experience'),
+    ("What were your responsibilities at your last employer?", 'experience'),
+    ("What certifications do you have?", 'certification'),
+    ("Are you certified in anything?", 'certification'),
+    ("Show me your credentials", 'certification'),
+    ("What's your education?", 'certification'),
+    ("Do you have a degree?", 'certification'),
+    ("Which Coursera courses did you complete?", 'certification'),
+    ("Did you go to college?", 'certification'),
+    ("What qualifications do you hold?", 'certification'),
+    ("Show me your blog", 'blog'),
+    ("What have you written recently?", 'blog'),
+    ("Any blog posts about Nostr?", 'blog'),
+    ("Show me your latest articles", 'blog'),
+    ("What do you write about?", 'blog'),
+    ("Have you published anything?", 'blog'),
+    ("Can I read your writing?", 'blog'),
+    ("What's your tech stack?", 'tech_stack'),
+    ("What technologies do you use?", 'tech_stack'),
+    ("What are your skills?", 'tech_stack'),
+    ("Which programming languages do you know?", 'tech_stack'),
+    ("What frameworks are you familiar with?", 'tech_stack'),
+    ("Which tools do you use day to day?", 'tech_stack'),
+    ("Are you proficient in TypeScript?", 'tech_stack'),
+    ("What's your skillset?", 'tech_stack'),
+    ("Which libraries do you like?", 'tech_stack'),
+    ("Tell me about Bitcoin", None),
+    ("Why are you a Bitcoin maximalist?", None),
+    ("Do you know Linux?", None),
+    ("What do you think about the Lightning Network?", None),
+    ("Are you active on Stackoverflow?", None),
+    ("Do you network at conferences?", None),
+    ("Who are you?", None),
+    ("What are your hobbies?", None),
+    ("How can I contact you?", None),
+    ("What do you think about open source?", None),
+    ("Are you available for hire?", None),
+    ("What is Nostr?", None),
+    ("What's the history of Bitcoin?", None),
+    ("Does your homework involve Python?", None),
+    ("What's your favourite networking protocol?", None),
+    ("Tell me about yourself", None),
+]
+
+# Written after the keyword weights were fixed and never used to tune them
+# (don't: add a question to LABELLED instead). The accuracy that counts.
+HELD_OUT = [
+    ("Could you walk me through something you shipped recently?", 'project'),
+    ("Is there a GitHub repository for this site?", 'project'),
+    ("What's the most complex application you have developed?", 'project'),
+    ("Have you made any open source tools?", 'project'),
+    ("I'd like to see examples of your work", 'project'),
+    ("What did you create for the Bitcoin community?", 'project'),
+    ("Got any demos online?", 'project'),
+    ("Which apps have you built for clients?", 'project'),
+    ("How many years of experience do you have?", 'experience'),
+    ("Who is your current employer?", 'experience'),
+    ("What positions have you held?", 'experience'),
+    ("Can you describe your career path?", 'experience'),
+    ("Give me a summary of your professional background", 'experience'),
+    ("What did you do in your previous job?", 'experience'),
+    ("Where do you work now?", 'experience'),
+    ("Is your resume up to date?", 'experience'),
+    ("Do you hold any professional certificates?", 'certification'),
+    ("What did you study at university?", 'certification'),
+    ("Which online courses have you taken?", 'certification'),
+    ("Are you a certified developer?", 'certification'),
+    ("What's your educational background?", 'certification'),
+    ("Do you have a diploma in computer science?", 'certification'),
+    ("Where can I read your articles?", 'blog'),
+    ("What was your latest blog post about?", 'blog'),
+    ("Have you written about Lightning?", 'blog'),
+    ("Do you publish essays?", 'blog'),
+    ("Any posts on Django performance?", 'blog'),
+    ("How often do you write?", 'blog'),
+    ("Which languages do you program in?", 'tech_stack'),
+    ("Do you use React or Vue?", 'tech_stack'),
+    ("What's in your toolbox?", 'tech_stack'),
+    ("Are you familiar with PostgreSQL?", 'tech_stack'),
+    ("What technology do you prefer for backends?", 'tech_stack'),
+    ("What are your strongest technical skills?", 'tech_stack'),
+    ("Which libraries do you reach for in Python?", 'tech_stack'),
+    ("What is a UTXO?", None),
+    ("Where are you based?", None),
+    ("Do you do freelance work?", None),
+    ("What's your opinion on proof of stake?", None),
+    ("Can we schedule a call?", None),
+    ("What motivates you?", None),
+    ("Do you speak Spanish?", None),
+    ("What's your email address?", None),
+    ("How do I run a Bitcoin node?", None),
+    ("Why did you build your site with Django?", None),
+]
+
+# ==============================================================================
+# ROUTERS
+# ==============================================================================
+
+# The substring matcher career_chat used before api/intents.py, kept here as the baseline.
+LEGACY_INTENTS = {
+    'project': ['project', 'projects', 'portfolio', 'work'],
+    'experience': ['experience', 'resume', 'cv', 'history', 'summarize experience'],
+    'certification': ['certification', 'certifications', 'credential', 'education', 'degree'],
+    'blog': ['post', 'posts', 'blog', 'writing', 'article'],
+    'tech_stack': ['tech', 'stack', 'technologies', 'skill', 'skills', 'language', 'framework'],
+}
+
+def legacy_route(question):
+    question = question.lower()
+    for intent_type, keywords in LEGACY_INTENTS.items():
+        if any(keyword in question for keyword in keywords):
+            return intent_type
+    return None
+
+# ==============================================================================
+# EVALUATION
+# ==============================================================================
+
+def evaluate(name, route, questions, verbose):
+    correct = retrieval = 0
+    misses = []
+    start = time.perf_counter()
+    for question, expected in questions:
+        intent = route(question)
+        retrieval += intent is None
+        if intent == expected:
+            correct += 1
+        else:
+            misses.append((question, expected, intent))
+    elapsed_us = (time.perf_counter() - start) * 1e6 / len(questions)
+    total = len(questions)
+    print(f"{name:<22} accuracy {correct / total:>6.1%}   retrieval {retrieval / total:>6.1%}   {elapsed_us:>8.1f} µs/question")
+    if verbose:
+        for question, expected, intent in misses:
+            print(f"    {question!r}: expected {expected}, got {intent}")
+    return correct / total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', help="Also evaluate the prototype fallback with this local model directory.")
+    parser.add_argument('--verbose', action='store_true', help="List misrouted questions.")
+    args = parser.parse_args()
+
+    import django
+    django.setup()
+
+    from api.intents import IntentRouter
+
+    router = IntentRouter()
+    routers = [
+        ("substring (legacy)", legacy_route),
+        ("keywords", lambda question: router.route_keywords(question).intent),
+    ]
+    if args.model:
+        from api.embeddings import LocalEmbeddingBackend
+
+        backend = LocalEmbeddingBackend(Path(args.model))
+        router.warm(backend)
+        routers.append(("keywords + prototypes", lambda question: router.route(question, backend).intent))
+
+    accuracy = {}
+    for title, questions in (("Tuning set", LABELLED), ("Held-out set", HELD_OUT)):
+        expected_retrieval = sum(expected is None for _, expected in questions) / len(questions)
+        print(f"{title}: {len(questions)} questions, {expected_retrieval:.1%} of them for retrieval")
+        for name, route in routers:
+            accuracy[title, name] = evaluate(name, route, questions, args.verbose)
+        print()
+    sys.exit(0 if accuracy["Held-out set", "keywords"] >= accuracy["Held-out set", "substring (legacy)"] else 1)
+
+
+if __name__ == '__main__':
+    main()
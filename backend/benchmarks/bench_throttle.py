@@ -0,0 +1,111 @@
+# backend/benchmarks/bench_throttle.py
+"""
+Does the rate limit hold under parallel bursts?
+
+Fires --processes x --threads clients at one client IP at the same instant,
+each sending --requests requests, and counts how many got through. Run
+against Redis (REDIS_URL) this is what several gunicorn workers with
+threads do to the contact form during a burst.
+
+    gcra     api.throttling.GCRAThrottle: one atomic Lua script per request
+    legacy   DRF's AnonRateThrottle (the previous ContactFormThrottle):
+             read the timestamp list, append, write it back
+
+The limit holds when `allowed` equals --limit. The period is long enough
+that nothing refills during the run. Exits non-zero if GCRA lets too many
+through.
+
+Usage (from backend/):
+    REDIS_URL=redis://localhost:6379/0 python benchmarks/bench_throttle.py --processes 4 --threads 16
+Without REDIS_URL the in-process fallback is measured (threads only).
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
+
+
+def make_throttle(mode, limit):
+    from rest_framework.throttling import AnonRateThrottle
+
+    from api.throttling import GCRAThrottle
+
+    base = GCRAThrottle if mode == 'gcra' else AnonRateThrottle
+    return type('BenchThrottle', (base,), {'scope': 'bench', 'rate': f"{limit}/day"})()
+
+def client(mode, limit, ip, requests, start_at, results):
+    from django.contrib.auth.models import AnonymousUser
+
+    throttle = make_throttle(mode, limit)
+    request = SimpleNamespace(user=AnonymousUser(), META={'REMOTE_ADDR': ip})
+    time.sleep(max(0.0, start_at - time.time()))
+    allowed = sum(bool(throttle.allow_request(request, None)) for _ in range(requests))
+    results.append(allowed)
+
+def process_main(mode, limit, ip, threads, requests, start_at, queue):
+    import django
+    django.setup()
+
+    results = []
+    workers = [threading.Thread(target=client, args=(mode, limit, ip, requests, start_at, results))
+               for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    queue.put(sum(results))
+
+def run(mode, args):
+    """Total allowed across all processes for one fresh client IP."""
+    ip = f"10.{uuid.uuid4().int % 250}.{uuid.uuid4().int % 250}.{uuid.uuid4().int % 250}"
+    start_at = time.time() + 1.0  # Let every process boot first, then release them together
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=process_main, args=(mode, args.limit, ip, args.threads, args.requests, start_at, queue))
+        for _ in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    allowed = sum(queue.get() for _ in processes)
+    for process in processes:
+        process.join()
+    return allowed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--limit', type=int, default=5)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=5, help="Requests per client.")
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+    if not os.getenv('REDIS_URL') and args.processes > 1:
+        print("No REDIS_URL: each process has its own cache, measuring threads in one process.\n")
+        args.processes = 1
+
+    sent = args.processes * args.threads * args.requests
+    print(f"{args.processes} process(es) x {args.threads} threads x {args.requests} requests = {sent} per round, "
+          f"limit {args.limit}\n")
+    print(f"{'mode':<8} {'round':>5} {'allowed':>8} {'limit':>6}")
+    overshoot = False
+    for mode in ('gcra', 'legacy'):
+        for round_number in range(1, args.rounds + 1):
+            allowed = run(mode, args)
+            print(f"{mode:<8} {round_number:>5} {allowed:>8} {args.limit:>6}"
+                  f"{'' if allowed == args.limit else '   <- limit not held'}")
+            overshoot |= mode == 'gcra' and allowed > args.limit
+    sys.exit(1 if overshoot else 0)
+
+
+if __name__ == '__main__':
+    main()
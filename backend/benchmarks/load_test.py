@@ -0,0 +1,376 @@
+# backend/benchmarks/load_test.py
+"""
+Reproducible load test of every route in api/urls.py, with no real upstreams.
+
+Starts the stub upstreams (benchmarks/stubs/upstreams.py: GitHub, mempool.space
+REST + WebSocket, Hugging Face, a Groq/OpenAI-compatible streaming server and a
+Nostr relay), a throwaway SQLite database seeded with --rows of content, and
+gunicorn with production settings pointed at the stubs. Each route is then
+driven at every --concurrency level for --duration seconds, reporting
+throughput, p50/p95/p99 latency, errors and worker CPU saturation.
+
+Results can be saved with --output and compared with a previous run with
+--compare, so the other performance work can be measured run over run.
+
+Usage (from backend/):
+    python benchmarks/load_test.py --concurrency 1 8 32 --duration 5 --workers 3
+    python benchmarks/load_test.py --routes project-list post-detail --output after.json --compare before.json
+"""
+import argparse
+import http.client
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+
+CONTACT_BODY = {'name': "Load Test", 'email': "load@test.invalid", 'subject': "Load test", 'message': "Hello."}
+
+# url name -> (method, path, JSON body, statuses that count as success)
+# {project_id} and {post_slug} are filled in from the seeded data.
+ROUTES = {
+    'api-root': ('GET', '/api/', None, {200}),
+    'project-list': ('GET', '/api/projects/', None, {200}),
+    'project-detail': ('GET', '/api/projects/{project_id}/', None, {200}),
+    'certification-list': ('GET', '/api/certifications/', None, {200}),
+    'certification-detail': ('GET', '/api/certifications/{certification_id}/', None, {200}),
+    'post-list': ('GET', '/api/posts/', None, {200}),
+    'post-detail': ('GET', '/api/posts/{post_slug}/', None, {200}),
+    'workexperience-list': ('GET', '/api/work-experience/', None, {200}),
+    'workexperience-detail': ('GET', '/api/work-experience/{workexperience_id}/', None, {200}),
+    'tag-list': ('GET', '/api/tags/', None, {200}),
+    'tag-detail': ('GET', '/api/tags/{tag_id}/', None, {200}),
+    'search': ('GET', '/api/search/?q=budget', None, {200}),
+    'bootstrap': ('GET', '/api/bootstrap/', None, {200}),
+    'github-stats': ('GET', '/api/github-stats/', None, {200}),
+    'github-contributions': ('GET', '/api/github-contributions/', None, {200}),
+    'nostr-profile': ('GET', '/api/nostr-profile/', None, {200}),
+    'latest-note': ('GET', '/api/latest-note/', None, {200}),
+    'mempool-stats': ('GET', '/api/mempool-stats/', None, {200}),
+    'mempool-stats-stream': ('GET', '/api/mempool-stats/stream/', None, {200}),
+    'bitcoin-address': ('GET', '/api/bitcoin-address/', None, {200}),
+    'skill-match': ('POST', '/api/skill-match/', {'query': "python django"}, {200}),
+    'career-chat': ('POST', '/api/chat/', {'question': "tell me about bitcoin", 'history': []}, {200}),
+    # 5/day per IP: after the first few requests this measures the throttle path.
+    'contact-submit': ('POST', '/api/contact/', CONTACT_BODY, {201, 429}),
+    'nostr-contact-submit': ('POST', '/api/nostr-contact/', CONTACT_BODY, {200, 201, 429, 500}),
+    'cache-stats': ('GET', '/api/cache-stats/', None, {403}),
+    'metrics': ('GET', '/api/metrics', None, {200}),
+}
+POSTGRES_ONLY = {'search'}
+
+# ==============================================================================
+# ENVIRONMENT
+# ==============================================================================
+
+def python():
+    return sys.executable
+
+def build_env(args, workdir, stub_url):
+    from pynostr.key import PrivateKey
+
+    ws_url = stub_url.replace('http://', 'ws://')
+    # The stub relay signs the profile's events with this key, so they verify.
+    profile_key = PrivateKey()
+    env = dict(os.environ)
+    env.update({
+        'DATABASE_URL': args.database_url or f"sqlite:///{workdir}/loadtest.sqlite3",
+        'SECRET_KEY': 'load-test',
+        # Production settings, reachable over plain HTTP on localhost.
+        'IS_RENDER': 'True',
+        'RENDER_EXTERNAL_HOSTNAME': '127.0.0.1',
+        'PROMETHEUS_MULTIPROC_DIR': str(workdir / 'prometheus'),
+        'METRICS_TOKEN': 'load-test',
+        'GITHUB_API_URL': f"{stub_url}/github",
+        'GITHUB_API_TOKEN': 'stub',
+        'MEMPOOL_API_URL': f"{stub_url}/mempool/api",
+        'MEMPOOL_WS_URL': f"{ws_url}/mempool/api/v1/ws",
+        'MEMPOOL_STREAM_ENABLED': 'True',
+        'MEMPOOL_STREAM_MAX_SECONDS': str(args.stream_seconds),
+        'HUGGINGFACE_EMBEDDING_MODEL_URL': f"{stub_url}/hf/models/stub",
+        'HUGGINGFACE_API_TOKEN': 'stub',
+        'GROQ_BASE_URL': f"{stub_url}/groq",
+        'GROQ_API_KEY': 'stub',
+        'NOSTR_RELAYS': f"{ws_url}/nostr",
+        'NOSTR_NPUB': profile_key.public_key.bech32(),
+        'NOSTR_STUB_NSEC': profile_key.bech32(),
+        'NOSTR_BOT_NSEC': PrivateKey().bech32(),
+        'BITCOIN_WALLET_MNEMONIC': TEST_MNEMONIC,
+        # Measure the views, not the per-IP limits (the contact forms keep theirs, see ROUTES).
+        'THROTTLE_RATE_CHAT': '1000000/min',
+        'THROTTLE_RATE_SKILL_MATCH': '1000000/min',
+    })
+    if args.redis_url:
+        env['REDIS_URL'] = args.redis_url
+    else:
+        env.pop('REDIS_URL', None)
+    return env
+
+def manage(env, *command):
+    subprocess.run([python(), 'manage.py', *command], cwd=BACKEND_DIR, env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+
+def seed_database(env, rows):
+    manage(env, 'migrate', '--no-input')
+    manage(env, 'shell', '-c', (
+        "from api.seed import seed; "
+        f"from api.models import Project; Project.objects.exists() or seed({rows})"
+    ))
+    manage(env, 'render_posts', '--missing-only')
+    manage(env, 'fill_address_pool')
+
+def wait_for(port, path, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            conn.request('GET', path, headers={'Host': '127.0.0.1', 'X-Forwarded-Proto': 'https'})
+            conn.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Nothing answered on port {port} after {timeout} s")
+
+def worker_pids(master_pid):
+    """Gunicorn worker processes: the children of the master."""
+    pids = []
+    for entry in Path('/proc').iterdir():
+        if entry.name.isdigit():
+            try:
+                fields = (entry / 'stat').read_text().rsplit(')', 1)[1].split()
+            except OSError:
+                continue
+            if int(fields[1]) == master_pid:
+                pids.append(int(entry.name))
+    return pids
+
+def cpu_seconds(pids):
+    total = 0
+    for pid in pids:
+        try:
+            fields = Path(f'/proc/{pid}/stat').read_text().rsplit(')', 1)[1].split()
+            total += int(fields[11]) + int(fields[12])  # utime + stime
+        except OSError:
+            pass
+    return total / CLOCK_TICKS
+
+def resolve_paths(port):
+    """Fills in the ids/slugs the detail routes need from the list endpoints."""
+    def first(path, key):
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        conn.request('GET', path, headers={'Host': '127.0.0.1', 'X-Forwarded-Proto': 'https'})
+        data = json.loads(conn.getresponse().read())
+        items = data['results'] if isinstance(data, dict) else data
+        return items[0][key] if items else 0
+
+    return {
+        'project_id': first('/api/projects/', 'id'),
+        'certification_id': first('/api/certifications/', 'id'),
+        'post_slug': first('/api/posts/', 'slug'),
+        'workexperience_id': first('/api/work-experience/', 'id'),
+        'tag_id': 1,
+    }
+
+def check_route_coverage(env):
+    """Fails if api/urls.py has a route this suite doesn't drive."""
+    code = (
+        "import json; from django.urls import get_resolver; "
+        "names = set(); "
+        "walk = lambda patterns: [walk(p.url_patterns) if hasattr(p, 'url_patterns') "
+        "else names.add(p.name) for p in patterns]; "
+        "import api.urls; walk(api.urls.urlpatterns); "
+        "print(json.dumps(sorted(n for n in names if n)))"
+    )
+    output = subprocess.run([python(), 'manage.py', 'shell', '-c', code], cwd=BACKEND_DIR, env=env,
+                            check=True, capture_output=True, text=True).stdout
+    names = set(json.loads(output.strip().splitlines()[-1]))
+    missing = sorted(names - ROUTES.keys())
+    if missing:
+        sys.exit(f"Routes in api/urls.py without a load-test entry: {', '.join(missing)}")
+
+# ==============================================================================
+# LOAD GENERATION
+# ==============================================================================
+
+def run_step(port, method, path, body, ok_statuses, concurrency, duration):
+    """Drives one route with `concurrency` keep-alive clients for `duration` seconds."""
+    results, lock = [], threading.Lock()
+    payload = json.dumps(body).encode() if body is not None else None
+    headers = {'Host': '127.0.0.1', 'X-Forwarded-Proto': 'https', 'Accept': 'application/json'}
+    if payload is not None:
+        headers['Content-Type'] = 'application/json'
+    if path == '/api/metrics':
+        headers['Authorization'] = 'Bearer load-test'
+    deadline = time.monotonic() + duration
+
+    def client():
+        conn, samples = None, []
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                if conn is None:
+                    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+                if response.getheader('Connection', '').lower() == 'close':
+                    conn.close()
+                    conn = None
+            except (OSError, http.client.HTTPException):
+                status = 0
+                if conn is not None:
+                    conn.close()
+                conn = None
+            samples.append((time.perf_counter() - start, status))
+        with lock:
+            results.extend(samples)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _ in results)
+    statuses = {}
+    for _, status in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    errors = sum(count for status, count in statuses.items() if int(status) not in ok_statuses)
+
+    def percentile(p):
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(round(p / 100 * (len(latencies) - 1))))] * 1000
+
+    return {
+        'requests': len(results), 'rps': len(results) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(50), 'p95_ms': percentile(95), 'p99_ms': percentile(99),
+        'mean_ms': statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        'errors': errors, 'statuses': statuses, 'elapsed': elapsed,
+    }
+
+# ==============================================================================
+# REPORTING
+# ==============================================================================
+
+def print_header():
+    print(f"{'route':<24} {'conc':>4} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'errors':>7} {'cpu':>6}  statuses")
+
+def print_row(name, concurrency, result, baseline=None):
+    delta = ""
+    if baseline:
+        delta = (f"  (p95 {result['p95_ms'] - baseline['p95_ms']:+.1f} ms, "
+                 f"req/s {result['rps'] - baseline['rps']:+.1f})")
+    statuses = ",".join(f"{status}x{count}" for status, count in sorted(result['statuses'].items()))
+    print(f"{name:<24} {concurrency:>4} {result['rps']:>8.1f} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+          f"{result['p99_ms']:>8.1f} {result['errors']:>7} {result['worker_cpu']:>5.0%}  {statuses}{delta}")
+
+def load_baseline(path):
+    if not path:
+        return {}
+    with open(path) as f:
+        previous = json.load(f)
+    return {(row['route'], row['concurrency']): row for row in previous['results']}
+
+# ==============================================================================
+# MAIN
+# ==============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--duration', type=float, default=5.0, help="Seconds per route and concurrency level.")
+    parser.add_argument('--workers', type=int, default=3, help="Gunicorn workers.")
+    parser.add_argument('--rows', type=int, default=100, help="Seeded projects/posts/certifications/jobs.")
+    parser.add_argument('--routes', nargs='+', help="Only these url names (default: all).")
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--stub-port', type=int, default=8766)
+    parser.add_argument('--stub-latency-ms', type=float, default=50.0)
+    parser.add_argument('--stub-jitter-ms', type=float, default=20.0)
+    parser.add_argument('--stub-error-rate', type=float, default=0.0)
+    parser.add_argument('--stream-seconds', type=int, default=2, help="Lifetime of each mempool SSE stream.")
+    parser.add_argument('--database-url', help="Use this database instead of a throwaway SQLite file.")
+    parser.add_argument('--redis-url', help="Run with the Redis-backed cache instead of per-worker LocMem.")
+    parser.add_argument('--output', help="Write the results as JSON here.")
+    parser.add_argument('--compare', help="A previous --output file to show deltas against.")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix='portfolio-loadtest-'))
+    (workdir / 'prometheus').mkdir()
+    stub_url = f"http://127.0.0.1:{args.stub_port}"
+    env = build_env(args, workdir, stub_url)
+    baseline = load_baseline(args.compare)
+    processes = []
+
+    try:
+        processes.append(subprocess.Popen(
+            [python(), 'benchmarks/stubs/upstreams.py', '--port', str(args.stub_port),
+             '--latency-ms', str(args.stub_latency_ms), '--jitter-ms', str(args.stub_jitter_ms),
+             '--error-rate', str(args.stub_error_rate)],
+            cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL,
+        ))
+        seed_database(env, args.rows)
+        check_route_coverage(env)
+        gunicorn = subprocess.Popen(
+            [python(), '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--workers', str(args.workers),
+             '--bind', f"127.0.0.1:{args.port}", '--timeout', '120', 'portfolio_project.wsgi'],
+            cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=open(workdir / 'gunicorn.log', 'w'),
+        )
+        processes.append(gunicorn)
+        wait_for(args.stub_port, '/github/users/stub')
+        wait_for(args.port, '/api/tags/')
+
+        path_values = resolve_paths(args.port)
+        is_postgres = (args.database_url or '').startswith('postgres')
+        routes = [name for name in ROUTES if not args.routes or name in args.routes]
+        rows = []
+
+        print(f"{args.workers} gunicorn workers, {args.rows} seeded rows, stub latency "
+              f"{args.stub_latency_ms} ms, stub error rate {args.stub_error_rate:.0%}, "
+              f"{args.duration} s per step\n")
+        print_header()
+        for name in routes:
+            if name in POSTGRES_ONLY and not is_postgres:
+                print(f"{name:<24} skipped (needs PostgreSQL)")
+                continue
+            method, path, body, ok_statuses = ROUTES[name]
+            path = path.format(**path_values)
+            for concurrency in args.concurrency:
+                pids = worker_pids(gunicorn.pid)
+                cpu_before = cpu_seconds(pids)
+                result = run_step(args.port, method, path, body, ok_statuses, concurrency, args.duration)
+                # Share of the workers' combined capacity spent on CPU: 100% means every worker was busy.
+                result['worker_cpu'] = (cpu_seconds(pids) - cpu_before) / (result['elapsed'] * len(pids)) if pids else 0.0
+                result.update(route=name, concurrency=concurrency)
+                rows.append(result)
+                print_row(name, concurrency, result, baseline.get((name, concurrency)))
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump({'args': vars(args), 'created': time.time(), 'results': rows}, f, indent=2)
+            print(f"\nResults written to {args.output}")
+    finally:
+        for process in reversed(processes):
+            process.send_signal(signal.SIGTERM)
+        for process in processes:
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# backend/benchmarks/stubs/mempool_ws.py
+"""
+Local stand-in for mempool.space's WebSocket feed (wss://mempool.space/api/v1/ws).
+
+Answers `init` with blocks, fees and conversions, then pushes a new block with
+new fees every --interval seconds. Point the backend at it with
+MEMPOOL_WS_URL=ws://127.0.0.1:8765/api/v1/ws.
+
+Usage (from backend/):
+    python benchmarks/stubs/mempool_ws.py --port 8765 --interval 5
+"""
+import argparse
+import json
+import random
+
+import tornado.ioloop
+import tornado.web
+import tornado.websocket
+
+
+class FakeChain:
+    def __init__(self, height=850000, price=65000):
+        self.height = height
+        self.price = price
+
+    def fees(self):
+        fastest = random.randint(5, 60)
+        return {
+            "fastestFee": fastest,
+            "halfHourFee": max(1, fastest - 4),
+            "hourFee": max(1, fastest - 8),
+            "economyFee": 2,
+            "minimumFee": 1,
+        }
+
+    def advance(self):
+        self.height += 1
+        self.price = round(self.price * random.uniform(0.99, 1.01))
+        return {
+            "block": {"height": self.height, "id": f"{self.height:064x}", "timestamp": 0},
+            "fees": self.fees(),
+            "conversions": {"USD": self.price},
+        }
+
+    def init_message(self):
+        return {
+            "blocks": [{"height": self.height - i, "id": f"{self.height - i:064x}"} for i in range(8)],
+            "fees": self.fees(),
+            "conversions": {"USD": self.price},
+        }
+
+
+class FeedHandler(tornado.websocket.WebSocketHandler):
+    clients = set()
+
+    def check_origin(self, origin):
+        return True
+
+    def open(self):
+        self.clients.add(self)
+
+    def on_close(self):
+        self.clients.discard(self)
+
+    def on_message(self, message):
+        action = json.loads(message).get('action')
+        if action == 'init':
+            self.write_message(json.dumps(self.application.chain.init_message()))
+        elif action == 'ping':
+            self.write_message(json.dumps({"pong": True}))
+
+    @classmethod
+    def broadcast(cls, payload):
+        for client in list(cls.clients):
+            client.write_message(json.dumps(payload))
+
+
+def make_app(chain):
+    app = tornado.web.Application([(r"/api/v1/ws", FeedHandler)])
+    app.chain = chain
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--interval', type=float, default=5.0, help="Seconds between fake blocks.")
+    args = parser.parse_args()
+
+    chain = FakeChain()
+    make_app(chain).listen(args.port, address='127.0.0.1')
+    tornado.ioloop.PeriodicCallback(lambda: FeedHandler.broadcast(chain.advance()), args.interval * 1000).start()
+    print(f"Stub mempool WebSocket on ws://127.0.0.1:{args.port}/api/v1/ws")
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == '__main__':
+    main()
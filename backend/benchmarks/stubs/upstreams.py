@@ -0,0 +1,252 @@
+# backend/benchmarks/stubs/upstreams.py
+"""
+Local stand-ins for every upstream the backend talks to, on one port:
+
+    GitHub REST + GraphQL   GITHUB_API_URL=http://127.0.0.1:<port>/github
+    mempool.space REST      MEMPOOL_API_URL=http://127.0.0.1:<port>/mempool/api
+    mempool.space WebSocket MEMPOOL_WS_URL=ws://127.0.0.1:<port>/mempool/api/v1/ws
+    Hugging Face inference  HUGGINGFACE_EMBEDDING_MODEL_URL=http://127.0.0.1:<port>/hf/models/stub
+    Groq (OpenAI-style SSE) GROQ_BASE_URL=http://127.0.0.1:<port>/groq
+    Nostr relay             NOSTR_RELAYS=ws://127.0.0.1:<port>/nostr
+                            (events are signed with NOSTR_STUB_NSEC; set
+                            NOSTR_NPUB to its public key)
+
+Every response is delayed by --latency-ms (+/- --jitter-ms) and fails with a
+503 (or, for WebSockets, a dropped connection) with probability --error-rate.
+The LLM stub streams --llm-tokens chunks, --llm-token-ms apart.
+
+Usage (from backend/):
+    python benchmarks/stubs/upstreams.py --port 8766 --latency-ms 80 --error-rate 0.02
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+import tornado.ioloop
+import tornado.web
+import tornado.websocket
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mempool_ws import FakeChain, FeedHandler  # noqa: E402
+
+
+class StubConfig:
+    def __init__(self, latency_ms=50.0, jitter_ms=20.0, error_rate=0.0, llm_tokens=40, llm_token_ms=15.0):
+        self.latency_ms, self.jitter_ms, self.error_rate = latency_ms, jitter_ms, error_rate
+        self.llm_tokens, self.llm_token_ms = llm_tokens, llm_token_ms
+
+    async def delay(self):
+        latency = max(0.0, random.gauss(self.latency_ms, self.jitter_ms / 2)) if self.jitter_ms else self.latency_ms
+        await asyncio.sleep(latency / 1000)
+
+    def should_fail(self):
+        return random.random() < self.error_rate
+
+
+class StubHandler(tornado.web.RequestHandler):
+    """Applies the configured latency and error rate before `respond()`."""
+
+    @property
+    def config(self) -> StubConfig:
+        return self.application.config
+
+    async def prepare(self):
+        await self.config.delay()
+        if self.config.should_fail():
+            self.send_error(503)
+
+    def write_json(self, data):
+        self.set_header('Content-Type', 'application/json')
+        self.write(json.dumps(data))
+
+# ==============================================================================
+# GITHUB
+# ==============================================================================
+
+class GitHubUserHandler(StubHandler):
+    def get(self, username):
+        base = f"{self.request.protocol}://{self.request.host}/github"
+        self.write_json({
+            'login': username, 'followers': 42, 'public_repos': 12,
+            'repos_url': f"{base}/users/{username}/repos",
+        })
+
+
+class GitHubReposHandler(StubHandler):
+    def get(self, username):
+        self.write_json([{'name': f"repo-{i}", 'stargazers_count': i} for i in range(12)])
+
+
+class GitHubGraphQLHandler(StubHandler):
+    def post(self):
+        weeks = [
+            {'contributionDays': [
+                {'contributionCount': (week * 7 + day) % 9, 'date': f"2025-01-{day + 1:02d}", 'weekday': day,
+                 'color': '#40c463'}
+                for day in range(7)
+            ]}
+            for week in range(53)
+        ]
+        self.write_json({'data': {'user': {'contributionsCollection': {'contributionCalendar': {
+            'totalContributions': 1234, 'weeks': weeks,
+        }}}}})
+
+# ==============================================================================
+# MEMPOOL.SPACE
+# ==============================================================================
+
+class MempoolRestHandler(StubHandler):
+    def get(self, path):
+        chain = self.application.chain
+        if path == 'v1/fees/recommended':
+            self.write_json(chain.fees())
+        elif path == 'blocks/tip/height':
+            self.write_json(chain.height)
+        elif path == 'v1/mining/hashrate/1d':
+            self.write_json({'currentHashrate': 6.5e20, 'currentDifficulty': 8.8e13})
+        elif path == 'v1/prices':
+            self.write_json({'USD': chain.price, 'EUR': round(chain.price * 0.92)})
+        elif path.startswith('address/'):
+            # Tip jar addresses never get paid here.
+            empty = {'funded_txo_count': 0, 'spent_txo_count': 0, 'tx_count': 0}
+            self.write_json({'address': path.removeprefix('address/'), 'chain_stats': empty, 'mempool_stats': empty})
+        else:
+            self.send_error(404)
+
+
+class StubFeedHandler(FeedHandler):
+    async def open(self):
+        await self.application.config.delay()
+        if self.application.config.should_fail():
+            self.close()
+            return
+        super().open()
+
+# ==============================================================================
+# HUGGING FACE & GROQ
+# ==============================================================================
+
+class HuggingFaceHandler(StubHandler):
+    def post(self, model):
+        inputs = json.loads(self.request.body or b'{}').get('inputs', {})
+        sentences = inputs.get('sentences', [])
+        self.write_json([round(random.uniform(0.0, 0.9), 4) for _ in sentences])
+
+
+class ChatCompletionsHandler(StubHandler):
+    """OpenAI-compatible /chat/completions, as used by the Groq SDK with stream=True."""
+
+    async def post(self):
+        request = json.loads(self.request.body or b'{}')
+        completion_id = f"chatcmpl-stub-{time.time_ns()}"
+        if not request.get('stream'):
+            self.write_json({
+                'id': completion_id, 'object': 'chat.completion', 'created': int(time.time()),
+                'model': request.get('model'),
+                'choices': [{'index': 0, 'finish_reason': 'stop',
+                             'message': {'role': 'assistant', 'content': "Stub answer."}}],
+            })
+            return
+
+        self.set_header('Content-Type', 'text/event-stream')
+        for i in range(self.config.llm_tokens):
+            finish = 'stop' if i == self.config.llm_tokens - 1 else None
+            chunk = {
+                'id': completion_id, 'object': 'chat.completion.chunk', 'created': int(time.time()),
+                'model': request.get('model'),
+                'choices': [{'index': 0, 'delta': {'content': f"token{i} "}, 'finish_reason': finish}],
+            }
+            self.write(f"data: {json.dumps(chunk)}\n\n")
+            await self.flush()
+            await asyncio.sleep(self.config.llm_token_ms / 1000)
+        self.write("data: [DONE]\n\n")
+
+# ==============================================================================
+# NOSTR RELAY
+# ==============================================================================
+
+class NostrRelayHandler(tornado.websocket.WebSocketHandler):
+    """
+    Answers REQ with one event per requested kind, then EOSE. Events are
+    signed with NOSTR_STUB_NSEC (a throwaway key when unset); clients drop
+    events that don't verify, so only that key's profile gets answers.
+    """
+
+    def check_origin(self, origin):
+        return True
+
+    async def on_message(self, message):
+        data = json.loads(message)
+        if data[0] != 'REQ':
+            return
+        config = self.application.config
+        await config.delay()
+        if config.should_fail():
+            self.close()
+            return
+        from pynostr.event import Event
+
+        key = self.application.nostr_key
+        subscription_id, filters = data[1], data[2:]
+        for query in filters:
+            for kind in query.get('kinds', [1]):
+                content = (json.dumps({'name': "stub", 'about': "Stub profile", 'picture': ""})
+                           if kind == 0 else "Stub note from the local relay.")
+                event = Event(content=content, pubkey=key.public_key.hex(), kind=kind)
+                event.sign(key.hex())
+                self.write_message(json.dumps(['EVENT', subscription_id, event.to_dict()]))
+        self.write_message(json.dumps(['EOSE', subscription_id]))
+
+# ==============================================================================
+# APP
+# ==============================================================================
+
+def make_app(config: StubConfig):
+    app = tornado.web.Application([
+        (r"/github/users/([^/]+)", GitHubUserHandler),
+        (r"/github/users/([^/]+)/repos", GitHubReposHandler),
+        (r"/github/graphql", GitHubGraphQLHandler),
+        (r"/mempool/api/v1/ws", StubFeedHandler),
+        (r"/mempool/api/(.+)", MempoolRestHandler),
+        (r"/hf/models/(.+)", HuggingFaceHandler),
+        (r"/groq/openai/v1/chat/completions", ChatCompletionsHandler),
+        (r"/nostr", NostrRelayHandler),
+    ])
+    from pynostr.key import PrivateKey
+
+    app.config = config
+    app.chain = FakeChain()
+    nsec = os.getenv('NOSTR_STUB_NSEC')
+    app.nostr_key = PrivateKey.from_nsec(nsec) if nsec else PrivateKey()
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--latency-ms', type=float, default=50.0)
+    parser.add_argument('--jitter-ms', type=float, default=20.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--llm-tokens', type=int, default=40)
+    parser.add_argument('--llm-token-ms', type=float, default=15.0)
+    parser.add_argument('--block-interval', type=float, default=10.0, help="Seconds between fake blocks.")
+    args = parser.parse_args()
+
+    config = StubConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.llm_tokens, args.llm_token_ms)
+    app = make_app(config)
+    app.listen(args.port, address='127.0.0.1')
+    tornado.ioloop.PeriodicCallback(lambda: FeedHandler.broadcast(app.chain.advance()),
+                                    args.block_interval * 1000).start()
+    print(f"Stub upstreams on http://127.0.0.1:{args.port} (latency {args.latency_ms} ms, "
+          f"error rate {args.error_rate:.0%})", flush=True)
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == '__main__':
+    main()
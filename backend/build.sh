@@ -13,3 +13,26 @@ python manage.py collectstatic --no-input
 
 # Apply any outstanding database migrations
 python manage.py migrate
+
+# Create the admin account from DJANGO_SUPERUSER_USERNAME / DJANGO_SUPERUSER_PASSWORD (once, not per worker)
+python manage.py ensure_superuser
+
+# Fetch the embedding model when it runs in-process (EMBEDDING_BACKEND=local) rather than on Hugging Face
+if [ "${EMBEDDING_BACKEND:-remote}" = "local" ]; then
+    python manage.py download_embedding_model
+fi
+
+# Pre-render any blog posts that don't have stored HTML yet
+python manage.py render_posts --missing-only
+
+# Recompute the related-content lists in full (edits only update the neighbourhood they touch)
+python manage.py rebuild_related
+
+# Fetch new or changed project images and store their resized WebP/AVIF variants under MEDIA_ROOT
+python manage.py build_project_images --prune
+
+# Pre-derive the Bitcoin tip address pool so the first visitors don't pay for it
+python manage.py fill_address_pool
+
+# Export the read-only API as pre-compressed JSON files for /api/snapshot/ and the CDN
+python manage.py export_api_snapshot
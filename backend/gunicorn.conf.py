@@ -1,7 +1,59 @@
 # gunicorn.conf.py
+import os
+import shutil
+import tempfile
 
-# This file can now be empty, or you can add other Gunicorn settings if you need them.
-# For now, a clean, empty file is perfect.
-# For example, you might have lines like:
-# bind = "0.0.0.0:8000"
-# workers = 3
\ No newline at end of file
+# bind = "0.0.0.0:8000"      (gunicorn reads $PORT)
+# workers = 3                (gunicorn reads $WEB_CONCURRENCY)
+
+# Sync workers serve one request at a time, so a long-lived response (the
+# mempool SSE stream) takes a whole worker. Streaming is off by default for
+# that reason; turn it on (MEMPOOL_STREAM_ENABLED=True) together with
+# GUNICORN_WORKER_CLASS=gevent (pip install gevent), where each stream is a
+# cheap greenlet.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'sync')
+
+# ==============================================================================
+# PROMETHEUS (MULTI-PROCESS METRICS)
+# ==============================================================================
+# Each worker writes its metrics to files in this directory and /api/metrics
+# merges them, so the numbers cover every worker. It must be set before the
+# workers import prometheus_client, i.e. here in the master.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'portfolio-prometheus'))
+
+# Imported up front: importing inside child_exit (a signal handler) can deadlock on the import lock.
+from prometheus_client import multiprocess  # noqa: E402
+
+def on_starting(server):
+    # Samples from a previous run would be merged into the new one's totals.
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+def child_exit(server, worker):
+    multiprocess.mark_process_dead(worker.pid)
+
+# ==============================================================================
+# BOOT PROFILE (PRELOAD + WARMUP)
+# ==============================================================================
+# The master imports the app, the integration stacks and the URL resolver
+# once and freezes them (api.warmup.preload), then forks: workers share those
+# pages copy-on-write instead of each importing its own. After the fork every
+# worker opens its own DB/Redis/HTTP connections and builds its caches
+# (api.warmup.warm_worker) before accepting requests, so no visitor pays for a
+# cold worker. Set GUNICORN_PRELOAD=False for per-worker imports (e.g. to
+# deploy code without restarting the master) and GUNICORN_WARMUP=False to skip
+# the warmup.
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True') == 'True'
+WARMUP = os.getenv('GUNICORN_WARMUP', 'True') == 'True'
+
+def when_ready(server):
+    # Runs in the master after the preload, before any worker is forked.
+    if preload_app:
+        from api.warmup import preload
+        preload()
+
+def post_worker_init(worker):
+    if WARMUP:
+        from api.warmup import warm_worker
+        warm_worker()
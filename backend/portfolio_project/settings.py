@@ -13,6 +13,33 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 # --- NEW: Define the default Groq model ---
 GROQ_MODEL_NAME = os.getenv('GROQ_MODEL_NAME', 'llama-3.1-8b-instant')
+
+# --- Embeddings for the skill matcher and the chat's retrieval (api/embeddings.py) ---
+# 'remote' calls the Hugging Face Inference API; 'local' runs the sentence-transformers
+# model in EMBEDDING_MODEL_PATH (config.json, tokenizer.json, model.safetensors or model.onnx) on the CPU.
+EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'remote')
+EMBEDDING_MODEL_PATH = os.getenv('EMBEDDING_MODEL_PATH', str(BASE_DIR / 'models' / 'all-MiniLM-L6-v2'))
+EMBEDDING_MODEL_REPO = os.getenv('EMBEDDING_MODEL_REPO', 'sentence-transformers/all-MiniLM-L6-v2')  # manage.py download_embedding_model
+EMBEDDING_BATCH_SIZE = int(os.getenv('EMBEDDING_BATCH_SIZE', '8'))
+EMBEDDING_THREADS = int(os.getenv('EMBEDDING_THREADS', '1'))  # onnxruntime threads per worker
+
+# --- Bitcoin tip jar: addresses are derived in memory from the account xpub ---
+# Falls back to deriving the account key from BITCOIN_WALLET_MNEMONIC if no xpub is set.
+BITCOIN_ACCOUNT_XPUB = os.getenv('BITCOIN_ACCOUNT_XPUB')
+# No more than api.bitcoin.GAP_LIMIT - 1 unpaid addresses are ever handed out, so a larger pool only pre-derives ahead.
+BITCOIN_ADDRESS_POOL_SIZE = int(os.getenv('BITCOIN_ADDRESS_POOL_SIZE', '20'))
+BITCOIN_ADDRESS_POOL_LOW_WATER = int(os.getenv('BITCOIN_ADDRESS_POOL_LOW_WATER', '5'))
+BITCOIN_VISITOR_ADDRESS_TIMEOUT = 86400  # A visitor keeps the same address for a day
+
+# --- Mempool live feed: one upstream WebSocket, fanned out to browsers over SSE ---
+MEMPOOL_WS_URL = os.getenv('MEMPOOL_WS_URL', 'wss://mempool.space/api/v1/ws')
+MEMPOOL_FEED_ENABLED = os.getenv('MEMPOOL_FEED_ENABLED', 'True') == 'True'
+# Each open SSE stream holds a whole worker, which the default sync workers
+# can't afford: clients poll /api/mempool-stats/ unless this is turned on, and
+# it should only be with GUNICORN_WORKER_CLASS=gevent (see gunicorn.conf.py).
+MEMPOOL_STREAM_ENABLED = os.getenv('MEMPOOL_STREAM_ENABLED', 'False') == 'True'
+MEMPOOL_STREAM_MAX_SECONDS = int(os.getenv('MEMPOOL_STREAM_MAX_SECONDS', '300'))  # Clients reconnect after this
+MEMPOOL_STREAM_POLL_SECONDS = 1
 # ==============================================================================
 # CORE SETTINGS
 # ==============================================================================
@@ -74,14 +101,24 @@ if IS_PRODUCTION:
 # CACHING CONFIGURATION (WITH REDIS FOR PRODUCTION)
 # ==============================================================================
 
-# Use Redis for caching if the REDIS_URL is available (in production on Render)
+# Use Redis for caching if the REDIS_URL is available (in production on Render,
+# or locally so all workers share one cache). By default each worker also keeps
+# a small in-process L1 in front of Redis (api.cache.TieredRedisCache), kept
+# consistent across workers through Redis pub/sub; set CACHE_L1_ENABLED=False
+# to talk to Redis directly.
 if 'REDIS_URL' in os.environ:
+    CACHE_L1_ENABLED = os.getenv('CACHE_L1_ENABLED', 'True') == 'True'
     CACHES = {
         "default": {
-            "BACKEND": "django_redis.cache.RedisCache",
+            "BACKEND": "api.cache.TieredRedisCache" if CACHE_L1_ENABLED else "django_redis.cache.RedisCache",
             "LOCATION": os.environ.get('REDIS_URL'),
             "OPTIONS": {
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "L1_MAX_ENTRIES": int(os.getenv('CACHE_L1_MAX_ENTRIES', '1000')),
+                "L1_MAX_BYTES": int(os.getenv('CACHE_L1_MAX_BYTES', str(32 * 1024 * 1024))),
+                "L1_TIMEOUT": int(os.getenv('CACHE_L1_TIMEOUT', '300')),
+            } if CACHE_L1_ENABLED else {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
             }
         }
     }
@@ -93,6 +130,11 @@ else:
             'LOCATION': 'unique-snowflake',
         }
     }
+
+# Rendered content responses are keyed by their ETag, so entries never go stale;
+# the timeout only lets superseded versions age out of the cache.
+RESPONSE_CACHE_TIMEOUT = 86400  # 1 day
+
 # ==============================================================================
 # DJANGO APPLICATIONS AND MIDDLEWARE
 # ==============================================================================
@@ -111,6 +153,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.MetricsMiddleware',  # First, so its latency covers the whole stack
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -120,8 +163,31 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.QueryStatsMiddleware',
+    'api.middleware.ProfilingMiddleware',  # After auth (staff only); last, so it profiles just the view
 ]
 
+# Per-IP limits for anonymous users (api/throttling.py: atomic GCRA in Redis)
+REST_FRAMEWORK = {
+    'DEFAULT_THROTTLE_RATES': {
+        'contact': os.getenv('THROTTLE_RATE_CONTACT', '5/day'),
+        'nostr_contact': os.getenv('THROTTLE_RATE_NOSTR_CONTACT', '5/day'),
+        'chat': os.getenv('THROTTLE_RATE_CHAT', '30/hour'),
+        'skill_match': os.getenv('THROTTLE_RATE_SKILL_MATCH', '60/hour'),
+    },
+}
+
+# Bearer token the Prometheus scraper sends to /api/metrics (staff can always read it)
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
+# Staff can profile a single request with `X-Profile: 1` or `?_profile=1`;
+# the newest PROFILE_ARTIFACT_LIMIT profiles are kept (see the admin)
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'True') == 'True'
+PROFILE_ARTIFACT_LIMIT = int(os.getenv('PROFILE_ARTIFACT_LIMIT', '50'))
+
+# Expose per-request query count and SQL time in an X-DB-Queries header
+QUERY_STATS_HEADER = DEBUG or os.getenv('QUERY_STATS_HEADER', 'False') == 'True'
+
 ROOT_URLCONF = 'portfolio_project.urls'
 WSGI_APPLICATION = 'portfolio_project.wsgi.application'
 
@@ -146,9 +212,24 @@ STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_STORAGE = "whitenoise.storage.CompressedRootStaticFilesStorage"
 
+# `manage.py export_api_snapshot` writes content-hashed JSON copies of the
+# read-only API under API_SNAPSHOT_ROOT, served by /api/snapshot/ (hashed
+# files with far-future cache headers, the manifest revalidated on every use).
+# Set API_SNAPSHOT_AUTO_EXPORT to re-export after every content change (admin saves).
+API_SNAPSHOT_ROOT = os.getenv('API_SNAPSHOT_ROOT', os.path.join(BASE_DIR, 'api-snapshot'))
+API_SNAPSHOT_AUTO_EXPORT = os.getenv('API_SNAPSHOT_AUTO_EXPORT', 'False') == 'True'
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Project thumbnails (api/images.py) are stored under MEDIA_ROOT and served by
+# /api/project-images/<name>; the frontend is on another origin, so the
+# serializer emits absolute URLs starting with IMAGE_BASE_URL.
+IMAGE_BASE_URL = os.getenv(
+    'IMAGE_BASE_URL',
+    f"https://{os.getenv('RENDER_EXTERNAL_HOSTNAME')}" if os.getenv('RENDER_EXTERNAL_HOSTNAME') else 'http://127.0.0.1:8000',
+)
+
 
 # ==============================================================================
 # TEMPLATES, PASSWORDS, AND INTERNATIONALIZATION
@@ -171,6 +252,20 @@ USE_I18N = True
 USE_TZ = True
 
 
+# ==============================================================================
+# LOGGING
+# ==============================================================================
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {'console': {'class': 'logging.StreamHandler'}},
+    'loggers': {
+        'api': {'handlers': ['console'], 'level': os.getenv('API_LOG_LEVEL', 'INFO')},
+    },
+}
+
+
 # ==============================================================================
 # DJANGO DEFAULTS
 # ==============================================================================
@@ -7,6 +7,10 @@ const API = axios.create({
   baseURL: `${API_URL}/api/`,
 });
 
+// Everything above the fold on the homepage in one request (see backend/api/views/bootstrap.py).
+// A section the server couldn't fetch is null; its component then loads it on its own.
+export const fetchBootstrap = () => API.get("bootstrap/");
+
 export const performSearch = (query) => API.get(`search/?q=${query}`);
 
 // --- MODIFIED: fetchProjects now accepts an optional tag slug ---
@@ -20,15 +24,23 @@ export const fetchProjects = (tagSlug = null) => {
 
 export const fetchTags = () => API.get("tags/");
 
+// Projects and posts are cursor-paginated: follow the `next` URL from a previous page.
+export const fetchNextPage = (nextUrl) => API.get(nextUrl);
+
 export const fetchCertifications = () => API.get("certifications/");
 export const fetchGithubStats = () => API.get("github-stats/");
 export const fetchGithubContributions = () => API.get("github-contributions/");
+// Pre-rendered heatmap image; used directly as an <img> src, not fetched as JSON.
+export const githubContributionsSvgUrl = (theme) =>
+  `${API_URL}/api/github-contributions.svg?theme=${theme}`;
 export const fetchNostrProfile = () => API.get("nostr-profile/");
 export const fetchLatestNote = () => API.get("latest-note/");
 export const fetchBitcoinAddress = () => API.get("bitcoin-address/");
 export const fetchPosts = () => API.get("posts/");
 export const fetchPostBySlug = (slug) => API.get(`posts/${slug}/`);
 export const fetchMempoolStats = () => API.get("mempool-stats/");
+// Server-Sent Events stream of the same stats, pushed as blocks and fees change.
+export const mempoolStatsStreamUrl = `${API_URL}/api/mempool-stats/stream/`;
 export const postChatMessage = (question, history) =>
   API.post("chat/", { question, history });
 export const matchSkills = (query) => API.post("skill-match/", { query });
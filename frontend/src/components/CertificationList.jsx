@@ -2,11 +2,12 @@ import React, { useState, useEffect } from "react";
 import { fetchCertifications } from "../api";
 import FadeIn from "./FadeIn"; // Ensure FadeIn is imported
 
-const CertificationList = () => {
-  const [certs, setCerts] = useState([]);
-  const [isLoading, setIsLoading] = useState(true);
+const CertificationList = ({ initialCertifications }) => {
+  const [certs, setCerts] = useState(initialCertifications ?? []);
+  const [isLoading, setIsLoading] = useState(!initialCertifications);
 
   useEffect(() => {
+    if (initialCertifications) return; // Already in the homepage snapshot
     const getCerts = async () => {
       try {
         const { data } = await fetchCertifications();
@@ -18,7 +19,7 @@ const CertificationList = () => {
       }
     };
     getCerts();
-  }, []);
+  }, [initialCertifications]);
 
   // --- 1. SKELETON LOADER (INLINE VERSION) ---
   if (isLoading) {
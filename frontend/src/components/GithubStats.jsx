@@ -3,10 +3,11 @@ import React, { useState, useEffect } from "react";
 import { fetchGithubStats } from "../api";
 import LoadingSpinner from "./LoadingSpinner";
 
-const GithubStats = () => {
-  const [stats, setStats] = useState(null);
+const GithubStats = ({ initialStats }) => {
+  const [stats, setStats] = useState(initialStats ?? null);
 
   useEffect(() => {
+    if (initialStats) return; // Already in the homepage snapshot
     const getStats = async () => {
       try {
         const { data } = await fetchGithubStats();
@@ -16,7 +17,7 @@ const GithubStats = () => {
       }
     };
     getStats();
-  }, []);
+  }, [initialStats]);
 
   if (!stats) return <LoadingSpinner />;
 
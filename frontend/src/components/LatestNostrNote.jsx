@@ -29,16 +29,17 @@ const LatestNostrNoteSkeleton = () => (
   </div>
 );
 
-const LatestNostrNote = () => {
-  const [note, setNote] = useState(null);
-  const [isLoading, setIsLoading] = useState(true);
+const LatestNostrNote = ({ initialNote }) => {
+  const [note, setNote] = useState(initialNote ?? null);
+  const [isLoading, setIsLoading] = useState(!initialNote);
 
   useEffect(() => {
+    if (initialNote) return; // Already in the homepage snapshot
     fetchLatestNote()
       .then((response) => setNote(response.data))
       .catch((error) => console.error("Could not fetch latest note:", error))
       .finally(() => setIsLoading(false));
-  }, []);
+  }, [initialNote]);
 
   if (isLoading) {
     return <LatestNostrNoteSkeleton />;
@@ -1,10 +1,12 @@
 // frontend/src/components/MempoolStats.jsx
 import React, { useState, useEffect } from "react";
-import { fetchMempoolStats } from "../api";
+import { fetchMempoolStats, mempoolStatsStreamUrl } from "../api";
 import FadeIn from "./FadeIn";
 // Using FaBolt and FaMugHot for better visual distinction
 import { FaCube, FaBolt, FaDollarSign, FaMugHot } from "react-icons/fa6";
 
+const STREAM_ENABLED = import.meta.env.VITE_MEMPOOL_STREAM === "true";
+
 // A reusable sub-component for our stat cards with dark variants
 const StatCard = ({
   icon,
@@ -23,9 +25,9 @@ const StatCard = ({
   </div>
 );
 
-const MempoolStats = () => {
-  const [stats, setStats] = useState(null);
-  const [isLoading, setIsLoading] = useState(true);
+const MempoolStats = ({ initialStats }) => {
+  const [stats, setStats] = useState(initialStats ?? null);
+  const [isLoading, setIsLoading] = useState(!initialStats);
 
   const formatHashrate = (hashesPerSecond) => {
     if (!hashesPerSecond || typeof hashesPerSecond !== "number") return "N/A";
@@ -41,16 +43,35 @@ const MempoolStats = () => {
       } catch (error) {
         console.error("Failed to fetch network stats:", error);
       } finally {
-        if (isLoading) setIsLoading(false);
+        setIsLoading(false);
       }
     };
-    fetchData();
-    // --- NEW: Auto-refresh every 60 seconds ---
-    const intervalId = setInterval(fetchData, 60000); // 60000 ms = 1 minute
+    if (!initialStats) fetchData();
+
+    // Poll every 60 seconds. Builds with VITE_MEMPOOL_STREAM=true (for a backend
+    // serving the SSE stream, see MEMPOOL_STREAM_ENABLED) get live updates
+    // pushed instead, and fall back to polling if the stream closes.
+    let intervalId = null;
+    const startPolling = () => {
+      if (!intervalId) intervalId = setInterval(fetchData, 60000);
+    };
+    let source = null;
+    if (STREAM_ENABLED && typeof EventSource !== "undefined") {
+      source = new EventSource(mempoolStatsStreamUrl);
+      source.onmessage = (event) => setStats(JSON.parse(event.data));
+      source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED) startPolling();
+      };
+    } else {
+      startPolling();
+    }
 
-    // Cleanup function to stop the interval when the component unmounts
-    return () => clearInterval(intervalId);
-  }, [isLoading]); // Keep isLoading in the dependency array
+    // Cleanup function to close the stream and stop polling when the component unmounts
+    return () => {
+      if (source) source.close();
+      if (intervalId) clearInterval(intervalId);
+    };
+  }, [initialStats]);
 
   if (isLoading) {
     return (
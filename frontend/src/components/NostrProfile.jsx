@@ -2,11 +2,12 @@
 import React, { useState, useEffect } from "react";
 import { fetchNostrProfile } from "../api";
 
-const NostrProfile = () => {
-  const [user, setUser] = useState(null);
+const NostrProfile = ({ initialProfile }) => {
+  const [user, setUser] = useState(initialProfile ?? null);
   const [error, setError] = useState(null);
 
   useEffect(() => {
+    if (initialProfile) return; // Already in the homepage snapshot
     const getProfile = async () => {
       try {
         const { data } = await fetchNostrProfile();
@@ -17,7 +18,7 @@ const NostrProfile = () => {
       }
     };
     getProfile();
-  }, []);
+  }, [initialProfile]);
 
   if (!user && !error) {
     return (
@@ -1,19 +1,42 @@
 // frontend/src/components/ProjectList.jsx
 import React, { useState, useEffect } from "react";
-import { fetchProjects } from "../api";
+import { fetchProjects, fetchNextPage } from "../api";
 import FadeIn from "./FadeIn";
 import ProjectListSkeleton from "./ProjectListSkeleton";
 
-const ProjectList = ({ selectedTag, onTagSelect, onClearFilter }) => {
-  const [projects, setProjects] = useState([]);
-  const [isLoading, setIsLoading] = useState(true);
+// Cards are full width on mobile and two per row from md (768px) up.
+const CARD_IMAGE_SIZES = "(min-width: 768px) 50vw, 100vw";
+
+const toSrcSet = (variants) =>
+  variants.map(({ url, width }) => `${url} ${width}w`).join(", ");
+
+const ProjectList = ({
+  selectedTag,
+  onTagSelect,
+  onClearFilter,
+  initialProjects,
+}) => {
+  const [projects, setProjects] = useState(initialProjects ?? []);
+  const [isLoading, setIsLoading] = useState(!initialProjects);
 
   useEffect(() => {
+    // The unfiltered list is already in the homepage snapshot.
+    if (!selectedTag && initialProjects) {
+      setProjects(initialProjects);
+      setIsLoading(false);
+      return;
+    }
     const getProjects = async () => {
       setIsLoading(true);
       try {
-        const { data } = await fetchProjects(selectedTag?.slug);
-        setProjects(data);
+        // Walk the cursor pages; the portfolio is small enough to show in full.
+        let { data } = await fetchProjects(selectedTag?.slug);
+        let allProjects = data.results;
+        while (data.next) {
+          ({ data } = await fetchNextPage(data.next));
+          allProjects = allProjects.concat(data.results);
+        }
+        setProjects(allProjects);
       } catch (error) {
         console.error("Failed to fetch projects:", error);
       } finally {
@@ -21,7 +44,7 @@ const ProjectList = ({ selectedTag, onTagSelect, onClearFilter }) => {
       }
     };
     getProjects();
-  }, [selectedTag]);
+  }, [selectedTag, initialProjects]);
 
   if (isLoading) {
     return <ProjectListSkeleton />;
@@ -48,12 +71,26 @@ const ProjectList = ({ selectedTag, onTagSelect, onClearFilter }) => {
         {projects.map((project, index) => (
           <FadeIn key={project.id} delay={index * 100}>
             <div className="group bg-white dark:bg-gray-800 rounded-lg shadow-lg overflow-hidden ring-1 ring-black/5 dark:ring-white/10 transition-all duration-300 ease-in-out transform hover:-translate-y-1.5 hover:shadow-2xl hover:ring-purple-500">
-              <img
-                src={project.image}
-                alt={project.title}
-                className="w-full h-48 object-cover"
-                loading="lazy"
-              />
+              {/* Resized AVIF/WebP copies served by the backend; the original URL is the fallback */}
+              <picture>
+                {["avif", "webp"].map(
+                  (format) =>
+                    project.image_variants?.[format]?.length > 0 && (
+                      <source
+                        key={format}
+                        type={`image/${format}`}
+                        srcSet={toSrcSet(project.image_variants[format])}
+                        sizes={CARD_IMAGE_SIZES}
+                      />
+                    )
+                )}
+                <img
+                  src={project.image}
+                  alt={project.title}
+                  className="w-full h-48 object-cover"
+                  loading="lazy"
+                />
+              </picture>
               <div className="p-6">
                 <h3 className="text-xl font-bold text-gray-800 dark:text-gray-200 group-hover:text-purple-600 dark:group-hover:text-purple-400 transition-colors">
                   {project.title}
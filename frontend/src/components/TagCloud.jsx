@@ -1,10 +1,11 @@
 import React, { useState, useEffect } from "react";
 import { fetchTags } from "../api";
 
-const TagCloud = ({ selectedTag, onTagSelect }) => {
-  const [tags, setTags] = useState([]);
+const TagCloud = ({ selectedTag, onTagSelect, initialTags }) => {
+  const [tags, setTags] = useState(initialTags ?? []);
 
   useEffect(() => {
+    if (initialTags) return; // Already in the homepage snapshot
     const getTags = async () => {
       try {
         const { data } = await fetchTags();
@@ -14,7 +15,7 @@ const TagCloud = ({ selectedTag, onTagSelect }) => {
       }
     };
     getTags();
-  }, []);
+  }, [initialTags]);
 
   if (tags.length === 0) {
     return null; // Don't render anything if there are no tags
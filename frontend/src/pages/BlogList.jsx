@@ -1,11 +1,12 @@
 // frontend/src/pages/BlogList.jsx
 import React, { useState, useEffect } from "react";
 import { Link } from "react-router-dom";
-import { fetchPosts } from "../api";
+import { fetchPosts, fetchNextPage } from "../api";
 import FadeIn from "../components/FadeIn";
 
 const BlogList = () => {
   const [posts, setPosts] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
@@ -13,7 +14,8 @@ const BlogList = () => {
       try {
         // Use the imported function directly
         const { data } = await fetchPosts();
-        setPosts(data);
+        setPosts(data.results);
+        setNextPage(data.next);
       } catch (error) {
         console.error("Failed to fetch posts:", error);
       } finally {
@@ -23,6 +25,16 @@ const BlogList = () => {
     getPosts();
   }, []);
 
+  const loadMore = async () => {
+    try {
+      const { data } = await fetchNextPage(nextPage);
+      setPosts((current) => [...current, ...data.results]);
+      setNextPage(data.next);
+    } catch (error) {
+      console.error("Failed to fetch more posts:", error);
+    }
+  };
+
   if (isLoading) return <p>Loading articles...</p>;
 
   return (
@@ -43,11 +55,27 @@ const BlogList = () => {
               </h2>
               <p className="text-gray-500 dark:text-gray-400 mt-2">
                 Published on{" "}
-                {new Date(post.published_date).toLocaleDateString()}
+                {new Date(post.published_date).toLocaleDateString()} ·{" "}
+                {post.reading_time} min read
               </p>
+              {post.excerpt && (
+                <p className="text-gray-700 dark:text-gray-300 mt-3">
+                  {post.excerpt}
+                </p>
+              )}
             </Link>
           ))}
         </div>
+        {nextPage && (
+          <div className="text-center mt-8">
+            <button
+              onClick={loadMore}
+              className="px-4 py-2 font-semibold text-purple-600 dark:text-purple-300 hover:underline"
+            >
+              Load more articles
+            </button>
+          </div>
+        )}
       </div>
     </FadeIn>
   );
@@ -1,7 +1,6 @@
 // frontend/src/pages/BlogPost.jsx
 import React, { useState, useEffect } from "react";
 import { useParams, Link } from "react-router-dom";
-import ReactMarkdown from "react-markdown";
 import { fetchPostBySlug } from "../api";
 import FadeIn from "../components/FadeIn";
 
@@ -36,7 +35,27 @@ const BlogPost = () => {
         </Link>
         <article className="prose dark:prose-invert prose-lg lg:prose-xl max-w-none">
           <h1 className="text-yellow-600 dark:text-yellow-400">{post.title}</h1>
-          <ReactMarkdown>{post.content}</ReactMarkdown>
+          <p className="text-sm text-gray-500 dark:text-gray-400">
+            {post.reading_time} min read
+          </p>
+          {post.toc.length > 1 && (
+            <nav className="not-prose mb-8 text-sm">
+              <ul className="space-y-1">
+                {post.toc.map((heading) => (
+                  <li key={heading.id} style={{ marginLeft: `${(heading.level - 1) * 1}rem` }}>
+                    <a
+                      href={`#${heading.id}`}
+                      className="text-purple-600 dark:text-purple-400 hover:underline"
+                    >
+                      {heading.title}
+                    </a>
+                  </li>
+                ))}
+              </ul>
+            </nav>
+          )}
+          {/* Rendered and sanitized on the server when the post is saved */}
+          <div dangerouslySetInnerHTML={{ __html: post.content_html }} />
         </article>
       </div>
     </FadeIn>
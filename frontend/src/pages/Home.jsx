@@ -1,7 +1,7 @@
 // frontend/src/pages/Home.jsx
 import React, { useState, useEffect } from "react";
-// We will use one of your fastest API calls as a "ping" to wake the server.
-import { fetchGithubStats } from "../api";
+// The homepage snapshot doubles as the "ping" that wakes the server.
+import { fetchBootstrap } from "../api";
 import { useDebounce } from "../hooks/useDebounce";
 import { performSearch } from "../api";
 import ContactForm from "../components/ContactForm";
@@ -21,6 +21,8 @@ import LoadingOverlay from "../components/LoadingOverlay";
 const Home = () => {
   // This state machine manages the entire loading experience
   const [serverState, setServerState] = useState("warming_up"); // Start in the "warming up" state
+  // Every above-the-fold section from /api/bootstrap/; null sections load on their own.
+  const [snapshot, setSnapshot] = useState({});
   // --- NEW: State for the full-text search ---
   const [searchQuery, setSearchQuery] = useState("");
   const [searchResults, setSearchResults] = useState({
@@ -32,9 +34,10 @@ const Home = () => {
   useEffect(() => {
     const wakeUpServer = async () => {
       try {
-        // We ping the server with a lightweight request. We don't care about the
-        // data yet, we just want to wake it up. This will take 0-50 seconds.
-        await fetchGithubStats();
+        // One request wakes the server (0-50 seconds on a cold start) and
+        // returns the data of every section below.
+        const { data } = await fetchBootstrap();
+        setSnapshot(data);
         // Once this request succeeds, the server is awake.
         setServerState("ready");
       } catch (error) {
@@ -84,19 +87,19 @@ const Home = () => {
         <>
           <FadeIn>
             <header className="text-center mb-12">
-              <NostrProfile />
+              <NostrProfile initialProfile={snapshot.nostr_profile} />
               <div className="flex justify-center items-stretch space-x-4 mt-6">
-                <GithubStats />
+                <GithubStats initialStats={snapshot.github_stats} />
                 <BitcoinTip />
               </div>
             </header>
           </FadeIn>
 
           <FadeIn delay={200}>
-            <LatestNostrNote />
+            <LatestNostrNote initialNote={snapshot.latest_note} />
           </FadeIn>
           <FadeIn delay={300}>
-            <MempoolStats />
+            <MempoolStats initialStats={snapshot.mempool_stats} />
           </FadeIn>
 
           <main>
@@ -116,6 +119,7 @@ const Home = () => {
               <TagCloud
                 selectedTag={selectedTag}
                 onTagSelect={setSelectedTag}
+                initialTags={snapshot.tags}
               />
             </FadeIn>
 
@@ -134,12 +138,15 @@ const Home = () => {
                   selectedTag={selectedTag}
                   onTagSelect={setSelectedTag}
                   onClearFilter={clearAllFilters}
+                  initialProjects={snapshot.projects}
                 />
               )}
             </FadeIn>
 
             <FadeIn delay={700}>
-              <CertificationList />
+              <CertificationList
+                initialCertifications={snapshot.certifications}
+              />
             </FadeIn>
             <FadeIn delay={800}>
               <ContactForm />